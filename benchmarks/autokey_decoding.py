@@ -0,0 +1,39 @@
+"""
+Compares the block based Auto-key decoding engine with the previous per-character implementation.
+
+Usage (from the project directory):
+    python -m benchmarks.autokey_decoding [size in megabytes]
+"""
+import random
+import sys
+import time
+
+from ciphers.ciphers import LATIN_ALPHABET, autokey_cipher_decoding, autokey_cipher_encoding
+
+
+def per_character_autokey_cipher_decoding(text: str, keyword: str, alphabet: str) -> str:
+    processed_text = ""
+    for character_number, character in enumerate(text):
+        processed_text += alphabet[(alphabet.index(character) -
+                                    alphabet.index(keyword[character_number] if character_number < len(keyword) else
+                                                   processed_text[character_number - len(keyword)]))]
+    return processed_text
+
+
+def measure(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    size = int(float(sys.argv[1]) * 1024 * 1024) if len(sys.argv) > 1 else 10 * 1024 * 1024
+    keyword = "FORTIFICATION"
+    plain_text = "".join(random.choices(LATIN_ALPHABET, k=size))
+    ciphered_text = autokey_cipher_encoding(plain_text, keyword, LATIN_ALPHABET)
+    old_result, old_time = measure(per_character_autokey_cipher_decoding, ciphered_text, keyword, str(LATIN_ALPHABET))
+    new_result, new_time = measure(autokey_cipher_decoding, ciphered_text, keyword, LATIN_ALPHABET)
+    assert old_result == new_result == plain_text
+    print(f"Text size: {size} characters")
+    print(f"Per-character decoding: {old_time:.3f} s")
+    print(f"Block decoding:         {new_time:.3f} s ({old_time / new_time:.1f}x faster)")
@@ -0,0 +1,41 @@
+"""
+Compares batch functions (one call for many messages) with calling single message functions in a loop.
+
+Usage (from the project directory):
+    python -m benchmarks.batch_encoding [number of messages] [message length]
+"""
+import random
+import sys
+import time
+
+from ciphers.ciphers import (LATIN_ALPHABET, caesar_cipher, caesar_cipher_batch, playfair_cipher_encoding,
+                             playfair_cipher_encoding_batch, playfair_cipher_generate_key_square, vigenere_cipher,
+                             vigenere_cipher_batch)
+
+
+def measure(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    number_of_messages = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    message_length = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    messages = ["".join(random.choices(LATIN_ALPHABET + " ", k=message_length)) for _ in range(number_of_messages)]
+    playfair_messages = [message.replace("J", "I").replace("X", "Y") for message in messages]
+    key_square = playfair_cipher_generate_key_square("KEYWORD", save_to_file=False)
+    cases = [("caesar_cipher", lambda: [caesar_cipher(message, 3, LATIN_ALPHABET) for message in messages],
+              lambda: caesar_cipher_batch(messages, 3, LATIN_ALPHABET)),
+             ("vigenere_cipher", lambda: [vigenere_cipher(message, "KEYWORD", LATIN_ALPHABET) for message in messages],
+              lambda: vigenere_cipher_batch(messages, "KEYWORD", LATIN_ALPHABET)),
+             ("playfair_cipher_encoding",
+              lambda: [playfair_cipher_encoding(message, key_square) for message in playfair_messages],
+              lambda: playfair_cipher_encoding_batch(playfair_messages, key_square))]
+    print(f"{number_of_messages} messages, {message_length} characters each")
+    for name, single_calls, batch_call in cases:
+        single_results, single_time = measure(single_calls)
+        batch_results, batch_time = measure(batch_call)
+        assert single_results == batch_results
+        print(f"{name:<26} single calls: {single_time:.3f} s, batch: {batch_time:.3f} s "
+              f"({single_time / batch_time:.1f}x faster)")
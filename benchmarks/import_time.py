@@ -0,0 +1,49 @@
+"""
+Measures how long "import ciphers" takes and checks, that heavy dependencies are not imported with it.
+
+Numpy is loaded on the first use of a function, that needs it, asyncio on the first use of the asynchronous helpers,
+and pandas, requests and BeautifulSoup only when letter frequency is downloaded, so none of them should be imported
+together with the module.
+
+The script fails, if any of them is imported or the median import time exceeds the maximum time (100 ms by default).
+
+Usage (from the project directory):
+    python -m benchmarks.import_time [number of runs] [maximum time in milliseconds]
+"""
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ("numpy", "pandas", "requests", "bs4", "asyncio")
+DEFAULT_MAXIMUM_TIME = 100.0
+
+
+def import_time(module_name: str = "ciphers") -> float:
+    """ Imports the module in a fresh interpreter and returns cumulative import time (in milliseconds). """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+                            capture_output=True, text=True, check=True)
+    for line in result.stderr.splitlines():
+        *_, cumulative_time, imported_package = line.split("|")
+        if imported_package.strip() == module_name:
+            return int(cumulative_time) / 1000
+    raise RuntimeError(f"Import time of {module_name} not found in the output!")
+
+
+def imported_heavy_modules(module_name: str = "ciphers") -> list:
+    """ Imports the module in a fresh interpreter and returns heavy modules, that were imported with it. """
+    result = subprocess.run([sys.executable, "-c", f"import sys, {module_name}; "
+                             f"print(' '.join(module for module in {HEAVY_MODULES!r} if module in sys.modules))"],
+                            capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+if __name__ == "__main__":
+    number_of_runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    maximum_time = float(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_MAXIMUM_TIME
+    times = [import_time() for _ in range(number_of_runs)]
+    heavy_modules = imported_heavy_modules()
+    print(f"Import time of ciphers ({number_of_runs} runs): median {statistics.median(times):.1f} ms, "
+          f"min {min(times):.1f} ms, max {max(times):.1f} ms")
+    print(f"Heavy modules imported with ciphers: {', '.join(heavy_modules) if heavy_modules else 'none'}")
+    if heavy_modules or statistics.median(times) > maximum_time:
+        sys.exit(1)
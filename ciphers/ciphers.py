@@ -1,10 +1,25 @@
+from __future__ import annotations
+
+import abc
+import bisect
+import codecs
+import collections
+import contextlib
+import functools
+import itertools
+import json
 import math
+import mmap
+import os
 import random
-import numpy
-import pandas
-import requests
-from bs4 import BeautifulSoup
-from typing import List, Tuple, Dict
+import re
+import threading
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Tuple, Dict, Optional, Union
+
+if TYPE_CHECKING:
+    import concurrent.futures
+    import numpy
+
 
 DIGITS = "0123456789"
 LATIN_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
@@ -14,6 +29,23 @@ GREEK_ALPHABET = "ΑΒΓΔΕΖΗΘΙΚΛΜΝΞΟΠΡΣΤΥΦΧΨΩ"
 HEBREW_ALPHABET = "אבגדהוזחטיכךלמםנןסעפףצץקרשת"
 CIPHER_MODE, DECIPHER_MODE = 1, -1
 
+LETTER_FREQUENCIES = {
+    LATIN_ALPHABET: {"A": 8.2, "B": 1.5, "C": 2.8, "D": 4.3, "E": 12.7, "F": 2.2, "G": 2.0, "H": 6.1, "I": 7.0,
+                     "J": 0.15, "K": 0.77, "L": 4.0, "M": 2.4, "N": 6.7, "O": 7.5, "P": 1.9, "Q": 0.095, "R": 6.0,
+                     "S": 6.3, "T": 9.1, "U": 2.8, "V": 0.98, "W": 2.4, "X": 0.15, "Y": 2.0, "Z": 0.074},
+    POLISH_ALPHABET: {"A": 10.503, "Ą": 0.699, "B": 1.740, "C": 3.895, "Ć": 0.743, "D": 3.725, "E": 7.352,
+                      "Ę": 1.035, "F": 0.143, "G": 1.731, "H": 1.015, "I": 8.328, "J": 1.836, "K": 2.753, "L": 2.564,
+                      "Ł": 2.109, "M": 2.515, "N": 6.237, "Ń": 0.362, "O": 6.667, "Ó": 1.141, "P": 2.445, "Q": 0.001,
+                      "R": 5.243, "S": 5.224, "Ś": 0.814, "T": 2.475, "U": 2.062, "V": 0.012, "W": 5.813, "X": 0.004,
+                      "Y": 3.206, "Z": 4.852, "Ź": 0.078, "Ż": 0.706},
+    RUSSIAN_ALPHABET: {"А": 8.01, "Б": 1.59, "В": 4.54, "Г": 1.70, "Д": 2.98, "Е": 8.45, "Ё": 0.04, "Ж": 0.94,
+                       "З": 1.65, "И": 7.35, "Й": 1.21, "К": 3.49, "Л": 4.40, "М": 3.21, "Н": 6.70, "О": 10.97,
+                       "П": 2.81, "Р": 4.73, "С": 5.47, "Т": 6.26, "У": 2.62, "Ф": 0.26, "Х": 0.97, "Ц": 0.48,
+                       "Ч": 1.44, "Ш": 0.73, "Щ": 0.36, "Ъ": 0.04, "Ы": 1.90, "Ь": 1.74, "Э": 0.32, "Ю": 0.64,
+                       "Я": 2.01}}
+_LETTER_FREQUENCY_NAMES = {LATIN_ALPHABET: "latin", POLISH_ALPHABET: "polish", RUSSIAN_ALPHABET: "russian"}
+_MAX_BISECTION_STEPS = 200
+
 
 def print_available_alphabets():
     print("List of available alphabets:")
@@ -24,6 +56,236 @@ def print_available_alphabets():
     print(f"- {HEBREW_ALPHABET=}")
 
 
+KeyScheduleCacheInfo = collections.namedtuple("KeyScheduleCacheInfo", ["hits", "misses", "evictions", "maxsize",
+                                                                       "currsize"])
+
+
+class KeyScheduleCache:
+    """ Bounded cache of compiled key schedules (translation tables, key squares, tableaus, inverted matrices, etc.)
+    shared by all ciphers.\n
+    Key schedules are stored under the name of the function, that compiles them, and its arguments, so encoding many
+    messages with the same key compiles the key only once. When the cache is full, the least recently used key schedule
+    is evicted. All ciphers of this module use KEY_SCHEDULE_CACHE instance.
+
+    :param maxsize: Maximum number of key schedules kept in the cache (0 disables caching).
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self._key_schedules = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = 0
+        self.maxsize = 0
+        self.resize(maxsize)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(maxsize={self.maxsize})"
+
+    def _evict(self):
+        while len(self._key_schedules) > self.maxsize:
+            self._key_schedules.popitem(last=False)
+            self._evictions += 1
+
+    def get(self, cipher_name: str, parameters: tuple, compile_key_schedule):
+        """ Returns a cached key schedule or compiles (and caches) a new one.
+
+        :param cipher_name: Name, that distinguishes key schedules of different ciphers.
+        :param parameters: Hashable parameters (key, alphabet, etc.), that the key schedule is compiled from.
+        :param compile_key_schedule: Function without arguments, that compiles the key schedule on a cache miss.
+        :return: Compiled key schedule.
+        """
+        cache_key = (cipher_name, parameters)
+        with self._lock:
+            if cache_key in self._key_schedules:
+                self._hits += 1
+                self._key_schedules.move_to_end(cache_key)
+                return self._key_schedules[cache_key]
+        key_schedule = compile_key_schedule()
+        with self._lock:
+            self._misses += 1
+            if self.maxsize > 0:
+                self._key_schedules[cache_key] = key_schedule
+                self._key_schedules.move_to_end(cache_key)
+                self._evict()
+        return key_schedule
+
+    def cached(self, compile_function):
+        """ Decorator, that caches key schedules returned by a compiling function in this cache. """
+        @functools.wraps(compile_function)
+        def cached_compile_function(*args):
+            return self.get(compile_function.__name__, args, functools.partial(compile_function, *args))
+        return cached_compile_function
+
+    def cache_info(self) -> KeyScheduleCacheInfo:
+        """ Returns numbers of hits, misses and evictions, maximum and current size of the cache. """
+        with self._lock:
+            return KeyScheduleCacheInfo(self._hits, self._misses, self._evictions, self.maxsize,
+                                        len(self._key_schedules))
+
+    def cache_clear(self):
+        """ Removes all key schedules from the cache and resets the statistics. """
+        with self._lock:
+            self._key_schedules.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def resize(self, maxsize: int):
+        """ Changes the maximum number of key schedules kept in the cache (least recently used ones are evicted).
+
+        :param maxsize: New maximum number of key schedules kept in the cache (0 disables caching).
+        """
+        if maxsize < 0:
+            raise ValueError("Cache size should not be negative!")
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+
+KEY_SCHEDULE_CACHE = KeyScheduleCache()
+
+# Alphabets with the highest code point below this limit get a dense code point -> index array, others are searched
+# in a sorted array of their code points.
+_DENSE_LOOKUP_LIMIT = 0x10000
+
+
+def _text_to_code_points(text: str) -> numpy.ndarray:
+    import numpy
+    return numpy.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype="<u4")
+
+
+def _code_points_to_text(code_points: numpy.ndarray) -> str:
+    import numpy
+    return numpy.ascontiguousarray(code_points, dtype="<u4").tobytes().decode("utf-32-le", "surrogatepass")
+
+
+class Alphabet(str):
+    """ Ordered letters for a given alphabet with precomputed character to index lookup.\n
+    Behaves exactly like a plain string, so it can be passed to every function, that accepts an alphabet. The
+    difference is, that "index" of a single character is a dictionary lookup instead of a linear scan of the
+    alphabet, and that a whole text can be converted to an array of indexes (and back) in one pass.\n
+    All alphabets defined in this module are instances of this class. Custom alphabets (including ones with thousands
+    of symbols) can be created with Alphabet("...").
+    """
+
+    def __new__(cls, letters: str):
+        alphabet = super().__new__(cls, letters)
+        alphabet._indexes = {}
+        for index, character in enumerate(letters):
+            alphabet._indexes.setdefault(character, index)
+        alphabet._lookup_tables = None
+        return alphabet
+
+    def __reduce__(self):
+        return Alphabet, (str(self),)
+
+    def index(self, character: str, *args) -> int:
+        if not args and character in self._indexes:
+            return self._indexes[character]
+        return super().index(character, *args)
+
+    def text_to_indexes(self, text: str) -> numpy.ndarray:
+        """ Converts a text to an array of indexes of its characters in the alphabet.
+
+        :param text: Text to be converted. Characters, that are not in the alphabet are converted to -1.
+        :return: Array of indexes with the same length as the text.
+        """
+        return self._code_points_to_indexes(_text_to_code_points(text))
+
+    def indexes_to_text(self, indexes: numpy.ndarray) -> str:
+        """ Converts an array of indexes in the alphabet back to a text.
+
+        :param indexes: Array of indexes (each between 0 and the length of the alphabet - 1).
+        :return: Text made of alphabet letters at given indexes.
+        """
+        return _code_points_to_text(self._indexes_to_code_points(indexes))
+
+    def _get_lookup_tables(self) -> tuple:
+        import numpy
+        if self._lookup_tables is None:
+            letter_code_points = numpy.array([ord(character) for character in self], dtype="<u4")
+            unique_code_points = numpy.array([ord(character) for character in self._indexes], dtype="<u4")
+            unique_indexes = numpy.array(list(self._indexes.values()), dtype=numpy.int32)
+            if len(unique_code_points) == 0 or unique_code_points.max() < _DENSE_LOOKUP_LIMIT:
+                dense_table = numpy.full(unique_code_points.max(initial=0) + 2, -1, dtype=numpy.int32)
+                dense_table[unique_code_points] = unique_indexes
+                self._lookup_tables = (letter_code_points, dense_table)
+            else:
+                order = numpy.argsort(unique_code_points)
+                self._lookup_tables = (letter_code_points, unique_code_points[order], unique_indexes[order])
+        return self._lookup_tables
+
+    def _indexes_to_code_points(self, indexes: numpy.ndarray) -> numpy.ndarray:
+        return self._get_lookup_tables()[0][indexes]
+
+    def _code_points_to_indexes(self, code_points: numpy.ndarray) -> numpy.ndarray:
+        import numpy
+        lookup_tables = self._get_lookup_tables()
+        if len(lookup_tables) == 2:
+            dense_table = lookup_tables[1]
+            return dense_table[numpy.minimum(code_points, len(dense_table) - 1)]
+        sorted_code_points, sorted_indexes = lookup_tables[1:]
+        positions = numpy.minimum(numpy.searchsorted(sorted_code_points, code_points), len(sorted_code_points) - 1)
+        return numpy.where(sorted_code_points[positions] == code_points, sorted_indexes[positions], -1)
+
+
+# Module alphabets are defined above as plain strings, so they are converted once the Alphabet class exists.
+LATIN_ALPHABET, POLISH_ALPHABET, RUSSIAN_ALPHABET, GREEK_ALPHABET, HEBREW_ALPHABET = map(
+    Alphabet, (LATIN_ALPHABET, POLISH_ALPHABET, RUSSIAN_ALPHABET, GREEK_ALPHABET, HEBREW_ALPHABET))
+
+
+@KEY_SCHEDULE_CACHE.cached
+def _cached_alphabet(alphabet: str) -> Alphabet:
+    return Alphabet(alphabet)
+
+
+def _as_alphabet(alphabet: str) -> Alphabet:
+    return alphabet if isinstance(alphabet, Alphabet) else _cached_alphabet(alphabet)
+
+
+@KEY_SCHEDULE_CACHE.cached
+def _caesar_translation_table(alphabet: str, shift: int, include_digits: bool) -> Dict[int, int]:
+    """ Builds a translation table of Caesar cipher for letters of the alphabet and, optionally, for digits. """
+    letters_shift = shift % len(alphabet) if alphabet else 0
+    table = str.maketrans(alphabet, alphabet[letters_shift:] + alphabet[:letters_shift])
+    if include_digits:
+        digits_shift = shift % len(DIGITS)
+        table.update(str.maketrans(DIGITS, DIGITS[digits_shift:] + DIGITS[:digits_shift]))
+    return table
+
+
+@KEY_SCHEDULE_CACHE.cached
+def _atbash_translation_table(alphabet: str, include_digits: bool) -> Dict[int, int]:
+    """ Builds a translation table of Atbash cipher for letters of the alphabet and, optionally, for digits. """
+    table = str.maketrans(alphabet, alphabet[::-1])
+    if include_digits:
+        table.update(str.maketrans(DIGITS, DIGITS[::-1]))
+    return table
+
+
+@KEY_SCHEDULE_CACHE.cached
+def _bytes_translation_table(table_function, *args) -> bytes:
+    """ Converts a translation table built by the given function to the one, that can be used with bytes.translate. """
+    table = table_function(*args)
+    if any(code_point > 0x7F for item in table.items() for code_point in item):
+        raise ValueError("Alphabet should only have ASCII letters to process bytes!")
+    return bytes(table.get(byte, byte) for byte in range(256))
+
+
+def _join_batch(texts: Iterable[str]) -> Tuple[str, List[int]]:
+    """ Concatenates uppercase messages of a batch into one text, so they can be processed at once. """
+    texts = list(texts)
+    lengths = list(map(len, texts))
+    text = "".join(texts).upper()
+    if len(text) != sum(lengths):
+        texts = [text.upper() for text in texts]
+        lengths, text = list(map(len, texts)), "".join(texts)
+    return text, lengths
+
+
+def _split_batch(text: str, lengths: List[int]) -> List[str]:
+    """ Splits a processed batch back into messages of given lengths. """
+    offsets = list(itertools.accumulate(lengths))
+    return [text[start:end] for start, end in zip([0] + offsets, offsets)]
+
+
 def caesar_cipher(text: str, shift: int, alphabet: str, include_digits: bool = False) -> str:
     """ Caesar cipher function.\n
     Simple message shifting by a specified value.\n
@@ -36,28 +298,152 @@ def caesar_cipher(text: str, shift: int, alphabet: str, include_digits: bool = F
     :param include_digits: Optional parameter, that specifies, whether to include digits in the shift e.g. 1 -> 3, 9 -> 0).
     :return: Ciphered or deciphered message.
     """
-    text = text.upper()
-    if include_digits:
-        processed_text = ""
-        for character in text:
-            if character in alphabet:
-                processed_text += alphabet[(alphabet.index(character) + shift) % len(alphabet)]
-            elif character.isdigit():
-                processed_text += str((int(character) + shift) % 10)
-            else:
-                processed_text += character
-        return processed_text
-    shifted_alphabet = alphabet[shift:] + alphabet[:shift]
-    table = str.maketrans(alphabet, shifted_alphabet)
-    return text.translate(table)
+    return text.upper().translate(_caesar_translation_table(alphabet, shift, include_digits))
+
+
+def caesar_cipher_bytes(data: bytes, shift: int, alphabet: str = LATIN_ALPHABET, include_digits: bool = False) -> bytes:
+    """ Caesar cipher function for ASCII encoded data.\n
+    Works the same way as "caesar_cipher" function, but uses bytes.translate, so big ASCII files can be processed
+    without decoding them.
+
+    :param data: ASCII encoded message to be encoded or decoded.
+    :param shift: A number by which the message should be shifted (positive shifts to the right, e.g. A -> B).
+    :param alphabet: Optional parameter with ordered ASCII letters for a given alphabet. Latin alphabet by default.
+    :param include_digits: Optional parameter, that specifies, whether to include digits in the shift e.g. 1 -> 3, 9 -> 0).
+    :return: Ciphered or deciphered message.
+    """
+    return data.upper().translate(_bytes_translation_table(_caesar_translation_table, alphabet, shift, include_digits))
+
+
+def caesar_cipher_batch(texts: Iterable[str], shift: int, alphabet: str, include_digits: bool = False) -> List[str]:
+    """ Caesar cipher function for many messages.\n
+    Works the same way as "caesar_cipher" function called for every message, but the translation table is built once
+    and all messages are translated as one concatenated text. For 100-character messages it is about 5 times faster
+    than single calls - a single call is already one cached translation, so creating the output strings dominates.
+
+    :param texts: Messages to be encoded or decoded (list or any other iterable).
+    :param shift: A number by which the messages should be shifted (positive shifts to the right, e.g. A -> B).
+    :param alphabet: Ordered letters for a given alphabet (ideally unchanged from given ones).
+    :param include_digits: Optional parameter, that specifies, whether to include digits in the shift e.g. 1 -> 3, 9 -> 0).
+    :return: List of ciphered or deciphered messages in the order of input messages.
+    """
+    text, lengths = _join_batch(texts)
+    return _split_batch(text.translate(_caesar_translation_table(alphabet, shift, include_digits)), lengths)
+
+
+class CipherStream(abc.ABC):
+    """ Base class of incremental (streaming) ciphers.\n
+    Consecutive chunks of a text (e.g. read from a big file) are fed with "update" method, which returns processed text
+    as soon as it is known. State needed to process the next chunk (e.g. position in the keyword) is kept between the
+    calls, so feeding the whole text at once or in any chunks and finalizing gives the same result as the corresponding
+    cipher function. Streams can be used as context managers to release resources they use (e.g. opened files).
+    """
+
+    @abc.abstractmethod
+    def update(self, chunk: str) -> str:
+        """ Feeds the stream with the next chunk of text.
+
+        :param chunk: Next part of the text.
+        :return: Text processed so far, that was not returned yet.
+        """
+
+    def finalize(self) -> str:
+        """ Processes the rest of the text and resets the stream, so that it can process another text.
+
+        :return: The rest of processed text (or an empty string).
+        """
+        return ""
+
+    def close(self):
+        """ Releases resources used by the stream. """
 
+    def __enter__(self) -> "CipherStream":
+        return self
 
-def vigenere_cipher(text: str, keyword: str, alphabet, mode: int = CIPHER_MODE, keyword_shift: int = 0) -> str:
+    def __exit__(self, *exception_info):
+        self.close()
+
+
+class CaesarCipherStream(CipherStream):
+    """ Incremental Caesar cipher (works the same way as "caesar_cipher" function).
+
+    :param shift: A number by which the message should be shifted (positive shifts to the right, e.g. A -> B).
+    :param alphabet: Ordered letters for a given alphabet (ideally unchanged from given ones).
+    :param include_digits: Optional parameter, that specifies, whether to include digits in the shift e.g. 1 -> 3, 9 -> 0).
+    """
+
+    def __init__(self, shift: int, alphabet: str, include_digits: bool = False):
+        self._table = _caesar_translation_table(alphabet, shift, include_digits)
+
+    def update(self, chunk: str) -> str:
+        return chunk.upper().translate(self._table)
+
+
+def _shift_letters(text: str, key_indexes: numpy.ndarray, alphabet: Alphabet, text_sign: int = 1, key_sign: int = 1,
+                   key_phase: int = 0, pass_other_characters: bool = True,
+                   key_restarts: Optional[numpy.ndarray] = None) -> str:
+    """ Shared engine of shift based polyalphabetic ciphers (Vigenere, Beaufort, Running key, Autokey).\n
+    Every letter of the text is replaced with the letter at index (text_sign*text_index + key_sign*key_index) mod
+    length of the alphabet, where key indexes are repeated to the number of letters in the text. Characters outside the
+    alphabet are passed through and do not consume letters of the key.
+
+    :param text: Text to be processed.
+    :param key_indexes: Indexes of key letters in the alphabet.
+    :param alphabet: Alphabet used to process the text.
+    :param text_sign: Sign of the text letter index (1 or -1).
+    :param key_sign: Sign of the key letter index (1 or -1).
+    :param key_phase: Index of the key letter, that the first letter of the text is shifted with.
+    :param pass_other_characters: Specifies, whether characters outside the alphabet are allowed in the text.
+    :param key_restarts: Optional sorted positions in the text, where the key starts over (e.g. starts of concatenated messages).
+    :return: Processed text.
+    """
+    import numpy
+    code_points = _text_to_code_points(text)
+    text_indexes = alphabet._code_points_to_indexes(code_points)
+    is_letter = text_indexes >= 0
+    if not pass_other_characters and not is_letter.all():
+        raise ValueError("Text should only have letters from the given alphabet!")
+    letter_indexes = text_indexes[is_letter]
+    if len(letter_indexes) == 0:
+        return text
+    if len(key_indexes) == 0:
+        raise ValueError("Keyword should not be empty!")
+    key_positions = numpy.arange(len(letter_indexes)) + key_phase
+    if key_restarts is not None:
+        letters_before_restarts = numpy.searchsorted(numpy.flatnonzero(is_letter), key_restarts)
+        key_positions -= numpy.repeat(letters_before_restarts,
+                                      numpy.diff(letters_before_restarts, append=len(letter_indexes)))
+    repeated_key_indexes = key_indexes[key_positions % len(key_indexes)]
+    if (repeated_key_indexes < 0).any():
+        raise ValueError("Keyword should only have letters from the given alphabet!")
+    processed_code_points = code_points.copy()
+    processed_code_points[is_letter] = alphabet._indexes_to_code_points(
+        (text_sign*letter_indexes + key_sign*repeated_key_indexes) % len(alphabet))
+    return _code_points_to_text(processed_code_points)
+
+
+def _count_alphabet_letters(text: str, alphabet: Alphabet) -> int:
+    """ Counts letters of the alphabet in an uppercase text. """
+    import numpy
+    return int(numpy.count_nonzero(alphabet.text_to_indexes(text) >= 0))
+
+
+def _vigenere_cipher_chunk(text: str, key_indexes: numpy.ndarray, alphabet: Alphabet, mode: int,
+                           key_phase: int = 0) -> str:
+    """ Processes an uppercase chunk of a text, which starts key_phase letters after the start of the text. """
+    return _shift_letters(text, key_indexes, alphabet, key_sign=mode, key_phase=key_phase)
+
+
+def vigenere_cipher(text: str, keyword: str, alphabet, mode: int = CIPHER_MODE, keyword_shift: int = 0,
+                    workers: int = 1) -> str:
     """ Vigenere cipher function.\n
     Keyword is repeated until the length is equal to that of ciphered/deciphered text. Then, letter by letter, index of
     the current letter of encoded/decoded text is a sum of the index of the current letter of repeated keyword and the
     index of the current letter of provided text.\n
     Can be used both for encoding and decoding messages.\n
+    Large texts can be split into chunks processed by separate processes. Position of the keyword in each chunk is
+    determined by the number of alphabet letters in all preceding chunks, counted chunk by chunk before the chunks
+    are sent.\n
     See reference [3] from README file for more information about the cipher.
 
     :param text: Message to be encoded or decoded. Can contain non-letter characters like numbers, punctuation marks, etc.
@@ -65,22 +451,106 @@ def vigenere_cipher(text: str, keyword: str, alphabet, mode: int = CIPHER_MODE,
     :param alphabet: Ordered letters for a given alphabet (ideally unchanged from given ones).
     :param mode: Specifies the mode for the function. Ideally use CIPHER_MODE and DECIPHER_MODE as inputs.
     :param keyword_shift: Optional argument. Specifies, whether to shift the key with Caesar cipher before encoding/decoding a message.
+    :param workers: Optional argument, that specifies the number of processes, that the text should be split between (worth using only for very large texts).
     :return: Ciphered or deciphered message.
     """
+    import concurrent.futures
+    if workers < 1:
+        raise ValueError("Number of workers should be at least 1!")
+    alphabet = _as_alphabet(alphabet)
     if keyword_shift != 0:
         keyword = caesar_cipher(keyword, keyword_shift, alphabet)
+    key_indexes = alphabet.text_to_indexes(keyword)
     text = text.upper()
-    processed_text = ""
-    number_of_other_characters = 0
-    for (character_number, character) in enumerate(text):
-        if character in alphabet:
-            processed_text += alphabet[(alphabet.index(character) +
-                                        mode*alphabet.index(keyword[(character_number - number_of_other_characters)
-                                                                    % len(keyword)])) % len(alphabet)]
-        else:
-            processed_text += character
-            number_of_other_characters += 1
-    return processed_text
+    if workers == 1 or not text:
+        return _vigenere_cipher_chunk(text, key_indexes, alphabet, mode)
+    chunk_length = math.ceil(len(text)/workers)
+    chunks = [text[i:i + chunk_length] for i in range(0, len(text), chunk_length)]
+    letter_counts = [_count_alphabet_letters(chunk, alphabet) for chunk in chunks[:-1]]
+    key_phases = itertools.accumulate(letter_counts, initial=0)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        processed_chunks = executor.map(_vigenere_cipher_chunk, chunks, itertools.repeat(key_indexes),
+                                        itertools.repeat(alphabet), itertools.repeat(mode), key_phases)
+        return "".join(processed_chunks)
+
+
+def vigenere_cipher_batch(texts: Iterable[str], keyword: str, alphabet, mode: int = CIPHER_MODE,
+                          keyword_shift: int = 0) -> List[str]:
+    """ Vigenere cipher function for many messages.\n
+    Works the same way as "vigenere_cipher" function called for every message (keyword starts over with every message),
+    but the keyword is prepared once and all messages are processed as one concatenated text. For 100-character
+    messages it is about 7 times faster than single calls.
+
+    :param texts: Messages to be encoded or decoded (list or any other iterable).
+    :param keyword: A word, that messages should be encoded/decoded with.
+    :param alphabet: Ordered letters for a given alphabet (ideally unchanged from given ones).
+    :param mode: Specifies the mode for the function. Ideally use CIPHER_MODE and DECIPHER_MODE as inputs.
+    :param keyword_shift: Optional argument. Specifies, whether to shift the key with Caesar cipher before encoding/decoding messages.
+    :return: List of ciphered or deciphered messages in the order of input messages.
+    """
+    import numpy
+    alphabet = _as_alphabet(alphabet)
+    if keyword_shift != 0:
+        keyword = caesar_cipher(keyword, keyword_shift, alphabet)
+    key_indexes = alphabet.text_to_indexes(keyword)
+    text, lengths = _join_batch(texts)
+    message_starts = numpy.cumsum([0] + lengths[:-1])
+    processed_text = _shift_letters(text, key_indexes, alphabet, key_sign=mode, key_restarts=message_starts)
+    return _split_batch(processed_text, lengths)
+
+
+class VigenereCipherStream(CipherStream):
+    """ Incremental Vigenere cipher (works the same way as "vigenere_cipher" function).\n
+    Position in the keyword is carried between chunks as the number of letters processed so far (key_phase), so a
+    stream can also be resumed in the middle of a text.
+
+    :param keyword: A word, that a message should be encoded/decoded with.
+    :param alphabet: Ordered letters for a given alphabet (ideally unchanged from given ones).
+    :param mode: Specifies the mode for the function. Ideally use CIPHER_MODE and DECIPHER_MODE as inputs.
+    :param keyword_shift: Optional argument. Specifies, whether to shift the key with Caesar cipher before encoding/decoding a message.
+    :param key_phase: Optional number of letters of the text, that were processed before the first chunk.
+    """
+
+    def __init__(self, keyword: str, alphabet: str, mode: int = CIPHER_MODE, keyword_shift: int = 0,
+                 key_phase: int = 0):
+        self.alphabet = _as_alphabet(alphabet)
+        if keyword_shift != 0:
+            keyword = caesar_cipher(keyword, keyword_shift, self.alphabet)
+        self.mode = mode
+        self._key_indexes = self.alphabet.text_to_indexes(keyword)
+        self.key_phase = self._initial_key_phase = key_phase
+
+    def update(self, chunk: str) -> str:
+        text = chunk.upper()
+        processed_text = _shift_letters(text, self._key_indexes, self.alphabet, key_sign=self.mode,
+                                        key_phase=self.key_phase)
+        self.key_phase += _count_alphabet_letters(text, self.alphabet)
+        return processed_text
+
+    def finalize(self) -> str:
+        self.key_phase = self._initial_key_phase
+        return ""
+
+
+@KEY_SCHEDULE_CACHE.cached
+def _bacon_codes(alphabet: str, code_letters: Tuple[str, str], unique_coding: bool) -> List[str]:
+    """ Builds Bacon codes of consecutive letters of the alphabet (J and V are skipped if coding is not unique). """
+    if not unique_coding:
+        alphabet = alphabet.replace("J", "").replace("V", "")
+    return [format(letter_number, "05b").replace("0", code_letters[0]).replace("1", code_letters[1])
+            for letter_number in range(len(alphabet))]
+
+
+@KEY_SCHEDULE_CACHE.cached
+def _bacon_encoding_table(alphabet: str, code_letters: Tuple[str, str], unique_coding: bool) -> Dict[int, str]:
+    if not unique_coding:
+        alphabet = alphabet.replace("J", "").replace("V", "")
+    letter_codes = {}
+    for letter, code in zip(alphabet, _bacon_codes(alphabet, code_letters, True)):
+        letter_codes.setdefault(letter, code)
+    if not unique_coding:
+        letter_codes.update({"J": letter_codes.get("I", "I"), "V": letter_codes.get("U", "U")})
+    return str.maketrans(letter_codes)
 
 
 def bacon_cipher_encoding(text: str, alphabet: str, letters_to_encode_with: Tuple[str] = ("a", "b"),
@@ -96,22 +566,84 @@ def bacon_cipher_encoding(text: str, alphabet: str, letters_to_encode_with: Tupl
     :param unique_coding: Specifies, whether to encode uniquely a message (without replacing all "J" with "I" and "V" with "U").
     :return: Ciphered message.
     """
-    text = text.upper()
     if len(alphabet) > 2**5:
         raise ValueError("Unfortunately the alphabet length must be at most 32 characters! "
                          "You can remove the letters from the alphabet, that are not used")
-    if not unique_coding:
-        alphabet = alphabet.replace("J", "").replace("V", "")
-        text = text.replace("J", "I").replace("V", "U")
-    processed_text = ""
-    for character in text:
-        if character not in alphabet:
-            processed_text += character
-        else:
-            encoded_character = str(format(alphabet.index(character), "05b"))
-            processed_text += \
-                encoded_character.replace("0", letters_to_encode_with[0]).replace("1", letters_to_encode_with[1])
-    return processed_text
+    return text.upper().translate(_bacon_encoding_table(alphabet, tuple(letters_to_encode_with), unique_coding))
+
+
+class BaconCipherEncoder(CipherStream):
+    """ Incremental Bacon cipher encoder (works the same way as "bacon_cipher_encoding" function).
+
+    :param alphabet: Ordered letters for a given alphabet with maximum of 32 letters (ideally unchanged from given ones).
+    :param letters_to_encode_with: A tuple of two, unique, one-character elements to encode a message with.
+    :param unique_coding: Specifies, whether to encode uniquely a message (without replacing all "J" with "I" and "V" with "U").
+    """
+
+    def __init__(self, alphabet: str, letters_to_encode_with: Tuple[str] = ("a", "b"), unique_coding: bool = False):
+        if len(alphabet) > 2**5:
+            raise ValueError("Unfortunately the alphabet length must be at most 32 characters! "
+                             "You can remove the letters from the alphabet, that are not used")
+        self._table = _bacon_encoding_table(alphabet, tuple(letters_to_encode_with), unique_coding)
+
+    def update(self, chunk: str) -> str:
+        return chunk.upper().translate(self._table)
+
+
+class BaconCipherDecoder(CipherStream):
+    """ Incremental Bacon cipher decoder.\n
+    Can be fed with consecutive chunks of encoded text (e.g. read from a big file) and returns decoded text as soon as
+    it is known. Groups of 5 encoding letters split between chunks are kept until the rest of them arrives. Feeding the
+    whole text and finalizing gives the same result as "bacon_cipher_decoding" function.
+
+    :param alphabet: Ordered letters for a given alphabet with maximum of 32 letters (ideally unchanged from given ones).
+    :param letters_to_decode_with: A tuple of two, unique, one-character elements to decode a message with.
+    :param unique_coding: Specifies, whether to the message was uniquely encoded (without replacing all "J" with "I" and "V" with "U").
+    """
+
+    def __init__(self, alphabet: str, letters_to_decode_with: Tuple[str] = ("a", "b"), unique_coding: bool = False):
+        if len(alphabet) > 2**5:
+            raise ValueError("Unfortunetely the alphabet length must be at most 32 characters! "
+                             "You can remove the letters from the alphabet, that are not used")
+        code_letters = tuple(letter.upper() for letter in letters_to_decode_with)
+        self.unique_coding = unique_coding
+        self._code_letters = "".join(code_letters)
+        self._group_pattern = re.compile(f"[{re.escape(self._code_letters)}]{{5}}")
+        if not unique_coding:
+            alphabet = alphabet.replace("J", "").replace("V", "")
+        self._group_letters = dict(zip(_bacon_codes(alphabet, code_letters, True), alphabet))
+        self._pending_text = ""
+
+    def _decode_group(self, group_match: re.Match) -> str:
+        try:
+            return self._group_letters[group_match.group()]
+        except KeyError:
+            raise ValueError(f'Text appears to have a group of letters, that does not encode any letter of the '
+                             f'alphabet: "{group_match.group()}"!') from None
+
+    def update(self, chunk: str) -> str:
+        """ Feeds the decoder with the next chunk of encoded text.
+
+        :param chunk: Next part of the encoded text.
+        :return: Text decoded so far, that was not returned yet.
+        """
+        text = self._pending_text + chunk.upper()
+        trailing_group_length = (len(text) - len(text.rstrip(self._code_letters))) % 5
+        self._pending_text = text[len(text) - trailing_group_length:]
+        processed_text = self._group_pattern.sub(self._decode_group, text[:len(text) - trailing_group_length])
+        if not self.unique_coding:
+            return processed_text.replace("I", "(I/J)").replace("U", "(U/V)")
+        return processed_text
+
+    def finalize(self) -> str:
+        """ Checks, that the encoded text did not end in the middle of a group and resets the decoder.
+
+        :return: An empty string (there is nothing left to decode).
+        """
+        pending_text, self._pending_text = self._pending_text, ""
+        if pending_text:
+            raise ValueError("Text appears to end with an incomplete group of letters!")
+        return ""
 
 
 def bacon_cipher_decoding(text: str, alphabet: str, letters_to_decode_with: Tuple[str] = ("a", "b"),
@@ -126,33 +658,8 @@ def bacon_cipher_decoding(text: str, alphabet: str, letters_to_decode_with: Tupl
     :param unique_coding: Specifies, whether to the message was uniquely encoded (without replacing all "J" with "I" and "V" with "U").
     :return: Deciphered message.
     """
-    text = text.upper()
-    if len(alphabet) > 2**5:
-        raise ValueError("Unfortunetely the alphabet length must be at most 32 characters! "
-                         "You can remove the letters from the alphabet, that are not used")
-    if not unique_coding:
-        alphabet = alphabet.replace("J", "").replace("V", "")
-    letters_to_decode_with = [letter.upper() for letter in letters_to_decode_with]
-    match_letters_to_code = {key: format(value, "05b") for (value, key) in enumerate(alphabet)}
-    for key in match_letters_to_code:
-        match_letters_to_code[key] = \
-            match_letters_to_code[key].replace("0", letters_to_decode_with[0]).replace("1", letters_to_decode_with[1])
-    text_index = 0
-    processed_text = ""
-    while text_index < len(text):
-        encrypted_code_part = text[text_index:text_index + 5]
-        number_of_different_characters = \
-            len(encrypted_code_part.replace(letters_to_decode_with[0], "").replace(letters_to_decode_with[1], ""))
-        if number_of_different_characters > 0:
-            processed_text += text[text_index:text_index + 1]
-            text_index += 1
-        else:
-            processed_text += \
-                list(match_letters_to_code.keys())[list(match_letters_to_code.values()).index(encrypted_code_part)]
-            text_index += 5
-    if not unique_coding:
-        return processed_text.replace("I", "(I/J)").replace("U", "(U/V)")
-    return processed_text
+    decoder = BaconCipherDecoder(alphabet, letters_to_decode_with, unique_coding)
+    return decoder.update(text) + decoder.finalize()
 
 
 def atbash_cipher(text: str, alphabet: str, include_digits: bool = False) -> str:
@@ -166,20 +673,34 @@ def atbash_cipher(text: str, alphabet: str, include_digits: bool = False) -> str
     :param include_digits: Optional parameter, that specifies, whether to include digits in the flip e.g. 1 -> 8, 3 -> 6).
     :return: Ciphered or deciphered message.
     """
-    text = text.upper()
-    if include_digits:
-        processed_text = ""
-        for character in text:
-            if character in alphabet:
-                processed_text += alphabet[len(alphabet) - alphabet.index(character) - 1]
-            elif character.isdigit():
-                processed_text += str(9 - int(character))
-            else:
-                processed_text += character
-        return processed_text
-    processed_text = "".join([alphabet[len(alphabet) - alphabet.index(character) - 1]
-                              if character in alphabet else character for character in text])
-    return processed_text
+    return text.upper().translate(_atbash_translation_table(alphabet, include_digits))
+
+
+def atbash_cipher_bytes(data: bytes, alphabet: str = LATIN_ALPHABET, include_digits: bool = False) -> bytes:
+    """ Atbash cipher function for ASCII encoded data.\n
+    Works the same way as "atbash_cipher" function, but uses bytes.translate, so big ASCII files can be processed
+    without decoding them.
+
+    :param data: ASCII encoded message to be encoded or decoded.
+    :param alphabet: Optional parameter with ordered ASCII letters for a given alphabet. Latin alphabet by default.
+    :param include_digits: Optional parameter, that specifies, whether to include digits in the flip e.g. 1 -> 8, 3 -> 6).
+    :return: Ciphered or deciphered message.
+    """
+    return data.upper().translate(_bytes_translation_table(_atbash_translation_table, alphabet, include_digits))
+
+
+class AtbashCipherStream(CipherStream):
+    """ Incremental Atbash cipher (works the same way as "atbash_cipher" function).
+
+    :param alphabet: Ordered letters for a given alphabet (ideally unchanged from given ones).
+    :param include_digits: Optional parameter, that specifies, whether to include digits in the flip e.g. 1 -> 8, 3 -> 6).
+    """
+
+    def __init__(self, alphabet: str, include_digits: bool = False):
+        self._table = _atbash_translation_table(alphabet, include_digits)
+
+    def update(self, chunk: str) -> str:
+        return chunk.upper().translate(self._table)
 
 
 def simple_substitution_generate_random_key(alphabet: str, save_to_file: bool = True) -> str:
@@ -198,7 +719,76 @@ def simple_substitution_generate_random_key(alphabet: str, save_to_file: bool =
     return random_key
 
 
-def simple_substitution_cipher(text: str, key: str, mode: int = CIPHER_MODE) -> str:
+class SimpleSubstitutionKey:
+    """ Compiled key of Simple substitution cipher.\n
+    The key is validated once and translation tables for encoding and decoding are built up front, so the same key can
+    be used to process many messages (or big files) without repeating the work.
+
+    :param key: Shuffled alphabet generated by "simple_substitution_generate_random_key" function.
+    """
+
+    def __init__(self, key: str):
+        if all("".join(sorted(key)) != "".join(sorted(alphabet))
+               for alphabet in [LATIN_ALPHABET, POLISH_ALPHABET, RUSSIAN_ALPHABET, GREEK_ALPHABET, HEBREW_ALPHABET]):
+            raise ValueError("Random key not generated from available alphabets!")
+        self.key = _as_alphabet(key)
+        self.alphabet = _as_alphabet("".join(sorted(key)))
+        self._tables = {CIPHER_MODE: str.maketrans(self.alphabet, self.key),
+                        DECIPHER_MODE: str.maketrans(self.key, self.alphabet)}
+        self._case_insensitive_tables = {mode: {**{ord(chr(letter).lower()): target for letter, target in table.items()
+                                                   if len(chr(letter).lower()) == 1}, **table}
+                                         for mode, table in self._tables.items()}
+        self._bytes_tables = None
+        if all(code_point <= 0x7F for table in self._case_insensitive_tables.values() for code_point in table):
+            self._bytes_tables = {mode: bytes(table.get(byte, byte) for byte in range(256))
+                                  for mode, table in self._case_insensitive_tables.items()}
+        self.preserves_utf8_length = all(len(chr(letter).encode("utf-8")) == len(chr(target).encode("utf-8"))
+                                         for table in self._case_insensitive_tables.values()
+                                         for letter, target in table.items())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self.key)!r})"
+
+    @staticmethod
+    def _check_mode(mode: int):
+        if mode not in (CIPHER_MODE, DECIPHER_MODE):
+            raise ValueError("Mode should be either CIPHER_MODE or DECIPHER_MODE!")
+
+    def translate(self, text: str, mode: int = CIPHER_MODE) -> str:
+        """ Encodes or decodes a message the same way as "simple_substitution_cipher" function.
+
+        :param text: Message to be encoded or decoded. Can contain non-letter characters like numbers, punctuation marks, etc.
+        :param mode: Specifies the mode for the function. Ideally use CIPHER_MODE and DECIPHER_MODE as inputs.
+        :return: Ciphered or deciphered message.
+        """
+        self._check_mode(mode)
+        return text.upper().translate(self._tables[mode])
+
+    def translate_bytes(self, data: bytes, mode: int = CIPHER_MODE) -> bytes:
+        """ Encodes or decodes UTF-8 (or ASCII) encoded message.\n
+        Letters of the key are matched regardless of their case and replaced with uppercase letters, other characters
+        are left unchanged. Keys with only ASCII letters are applied directly to the bytes, without decoding them.
+
+        :param data: UTF-8 encoded message to be encoded or decoded. Should not end in the middle of a character.
+        :param mode: Specifies the mode for the function. Ideally use CIPHER_MODE and DECIPHER_MODE as inputs.
+        :return: Ciphered or deciphered UTF-8 encoded message.
+        """
+        self._check_mode(mode)
+        if self._bytes_tables is not None:
+            return bytes(data).translate(self._bytes_tables[mode])
+        return bytes(data).decode("utf-8").translate(self._case_insensitive_tables[mode]).encode("utf-8")
+
+
+@KEY_SCHEDULE_CACHE.cached
+def _compile_simple_substitution_key(key: str) -> SimpleSubstitutionKey:
+    return SimpleSubstitutionKey(key)
+
+
+def _as_simple_substitution_key(key: Union[str, SimpleSubstitutionKey]) -> SimpleSubstitutionKey:
+    return key if isinstance(key, SimpleSubstitutionKey) else _compile_simple_substitution_key(key)
+
+
+def simple_substitution_cipher(text: str, key: Union[str, SimpleSubstitutionKey], mode: int = CIPHER_MODE) -> str:
     """ Simple substitution cipher function.\n
     Uses a key of shuffled alphabet letters to encode/decode a message. Plain alphabet is compared with the key to get
     1 to 1 correspondence between a letter, that is supposed to be encoded with a letter, that will take its place.
@@ -207,21 +797,98 @@ def simple_substitution_cipher(text: str, key: str, mode: int = CIPHER_MODE) ->
     See reference [6] from README file for more information about the cipher.
 
     :param text: Message to be encoded or decoded. Can contain non-letter characters like numbers, punctuation marks, etc.
-    :param key: Shuffled alphabet generated by "simple_substitution_generate_random_key" function.
+    :param key: Shuffled alphabet generated by "simple_substitution_generate_random_key" function or a compiled SimpleSubstitutionKey.
     :param mode: Specifies the mode for the function. Ideally use CIPHER_MODE and DECIPHER_MODE as inputs.
     :return: Ciphered or deciphered message.
     """
-    if all("".join(sorted(key)) != "".join(sorted(alphabet))
-           for alphabet in [LATIN_ALPHABET, POLISH_ALPHABET, RUSSIAN_ALPHABET, GREEK_ALPHABET, HEBREW_ALPHABET]):
-        raise ValueError("Random key not generated from available alphabets!")
-    text = text.upper()
-    alphabet = sorted(key)
-    processed_text = ""
-    if mode == CIPHER_MODE:
-        processed_text = "".join(key[alphabet.index(char)] if char in key else char for char in text)
-    elif mode == DECIPHER_MODE:
-        processed_text = "".join(alphabet[key.index(char)] if char in key else char for char in text)
-    return processed_text
+    return _as_simple_substitution_key(key).translate(text, mode)
+
+
+class SimpleSubstitutionCipherStream(CipherStream):
+    """ Incremental Simple substitution cipher (works the same way as "simple_substitution_cipher" function).
+
+    :param key: Shuffled alphabet generated by "simple_substitution_generate_random_key" function or a compiled SimpleSubstitutionKey.
+    :param mode: Specifies the mode for the function. Ideally use CIPHER_MODE and DECIPHER_MODE as inputs.
+    """
+
+    def __init__(self, key: Union[str, SimpleSubstitutionKey], mode: int = CIPHER_MODE):
+        self.key = _as_simple_substitution_key(key)
+        self.key._check_mode(mode)
+        self.mode = mode
+
+    def update(self, chunk: str) -> str:
+        return self.key.translate(chunk, self.mode)
+
+
+def simple_substitution_cipher_file(input_file_path: str, key: Union[str, SimpleSubstitutionKey],
+                                    mode: int = CIPHER_MODE, output_file_path: Optional[str] = None,
+                                    chunk_size: int = 16*1024*1024) -> str:
+    """ Simple substitution cipher function for UTF-8 (or ASCII) encoded files.\n
+    The input file is memory-mapped and processed in chunks, so it is never loaded into memory as a whole. Without an
+    output file, the input file is processed in place, which is possible only if the key does not change the length
+    of the UTF-8 encoded text (e.g. Latin, Russian, Greek and Hebrew keys). Letters of the key are matched regardless
+    of their case and replaced with uppercase letters, other characters are left unchanged.\n
+    See reference [6] from README file for more information about the cipher.
+
+    :param input_file_path: Path to the file to be encoded or decoded.
+    :param key: Shuffled alphabet generated by "simple_substitution_generate_random_key" function or a compiled SimpleSubstitutionKey.
+    :param mode: Specifies the mode for the function. Ideally use CIPHER_MODE and DECIPHER_MODE as inputs.
+    :param output_file_path: Optional argument with a path to the file, that the result should be written to.
+    :param chunk_size: Optional argument, that specifies how many bytes are processed at once.
+    :return: Path to the file with ciphered or deciphered message.
+    """
+    key = _as_simple_substitution_key(key)
+    key._check_mode(mode)
+    if chunk_size < 4:
+        raise ValueError("Chunk size should be at least 4 bytes!")
+    in_place = output_file_path is None
+    if in_place and not key.preserves_utf8_length:
+        raise ValueError("Key changes the length of UTF-8 encoded text, so the file can't be processed in place! "
+                         "Please provide an output file path.")
+    with contextlib.ExitStack() as stack:
+        input_file = stack.enter_context(open(input_file_path, "r+b" if in_place else "rb"))
+        output_file = None if in_place else stack.enter_context(open(output_file_path, "wb"))
+        file_size = os.fstat(input_file.fileno()).st_size
+        if file_size == 0:
+            return input_file_path if in_place else output_file_path
+        mapped_file = stack.enter_context(mmap.mmap(input_file.fileno(), 0,
+                                                    access=mmap.ACCESS_WRITE if in_place else mmap.ACCESS_READ))
+        chunk_start = 0
+        while chunk_start < file_size:
+            chunk_end = min(chunk_start + chunk_size, file_size)
+            while chunk_end < file_size and mapped_file[chunk_end] & 0xC0 == 0x80:
+                chunk_end -= 1
+            processed_chunk = key.translate_bytes(mapped_file[chunk_start:chunk_end], mode)
+            if in_place:
+                mapped_file[chunk_start:chunk_end] = processed_chunk
+            else:
+                output_file.write(processed_chunk)
+            chunk_start = chunk_end
+    return input_file_path if in_place else output_file_path
+
+
+@KEY_SCHEDULE_CACHE.cached
+def _columnar_transposition_column_order(keyword: str) -> numpy.ndarray:
+    """ Sorts columns by letters of the keyword, with columns under repeated letters kept in their original order. """
+    import numpy
+    column_order = numpy.argsort(_text_to_code_points(keyword), kind="stable")
+    column_order.flags.writeable = False
+    return column_order
+
+
+def _columnar_transposition_permutation(keyword: str, number_of_rows: int) -> numpy.ndarray:
+    """ Computes the order, in which characters of the text placed under the keyword are read by Columnar transposition
+    cipher.\n
+    Only the order of columns is cached, as the permutation itself is as long as the text.
+
+    :param keyword: A word, that a message is encoded with.
+    :param number_of_rows: Number of rows of the text placed under the keyword.
+    :return: Array with positions of the text characters in the order of the encoded message.
+    """
+    import numpy
+    dtype = numpy.int32 if number_of_rows*len(keyword) < 2**31 else numpy.int64
+    row_starts = numpy.arange(0, number_of_rows*len(keyword), len(keyword), dtype=dtype)
+    return (_columnar_transposition_column_order(keyword).astype(dtype)[:, None] + row_starts).ravel()
 
 
 def columnar_transposition_cipher_encoding(text: str, keyword: str, character_to_fill: str = "x") -> str:
@@ -241,25 +908,19 @@ def columnar_transposition_cipher_encoding(text: str, keyword: str, character_to
         raise ValueError("Keyword must contain only letters!")
     if len(character_to_fill) != 1:
         raise Exception('Wrong length of "character_that_filled" character (length 1 is the only option)!')
+    if not keyword:
+        raise ValueError("Keyword should not be empty!")
     text = text.upper().replace(" ", "")
     character_to_fill = character_to_fill.upper()
+    if not text:
+        return text
     if text[-1] == character_to_fill:
         print(f'Last letter of the message is the same as the "character_to_fill", that fills the gaps. '
               f'Consider changing the "character_to_fill" to be different than "{text[-1]}"')
-    separated_list = [text[i:i + len(keyword)] for i in range(0, len(text), len(keyword))]
-    if len(separated_list[-1]) < len(keyword):
-        separated_list[-1] += "".join([character_to_fill for _ in range(len(keyword) - len(separated_list[-1]))])
-    sorted_keyword = "".join(sorted(keyword))
-    transposed_list = list(map(list, zip(*separated_list)))
-    transposed_list_joined = ["".join(element) for element in transposed_list]
-    sorted_split_list = [[]]*len(keyword)
-    for letter_number in range(len(sorted_keyword)):
-        sorted_split_list[letter_number] = transposed_list_joined[keyword.index(sorted_keyword[0])]
-        transposed_list_joined.pop(keyword.index(sorted_keyword[0]))
-        keyword = keyword.replace(sorted_keyword[0], "", 1)
-        sorted_keyword = sorted_keyword[1:]
-    processed_text = "".join(sorted_split_list)
-    return processed_text
+    number_of_rows = -(-len(text) // len(keyword))
+    text += character_to_fill*(number_of_rows*len(keyword) - len(text))
+    code_points = _text_to_code_points(text)
+    return _code_points_to_text(code_points[_columnar_transposition_permutation(keyword, number_of_rows)])
 
 
 def columnar_transposition_cipher_decoding(text: str, keyword: str, character_that_filled: str = "x") -> str:
@@ -272,31 +933,24 @@ def columnar_transposition_cipher_decoding(text: str, keyword: str, character_th
     :param character_that_filled: Optional argument, that specifies, what letter was used to fill gaps in the last slice of the text (if the letter was equal to the last letter in encoded message it will be removed).
     :return: Deciphered message.
     """
+    import numpy
     if any(not char.isalpha() for char in keyword):
         raise ValueError("Keyword must contain only letters!")
     if len(character_that_filled) != 1:
         raise Exception('Wrong length of "character_that_filled" character (length 1 is the only option)!')
+    if not keyword:
+        raise ValueError("Keyword should not be empty!")
     text = text.upper()
     character_that_filled = character_that_filled.upper()
-    encoded_split_message = [text[i:i + len(text)//len(keyword)] for i in range(0, len(text), len(text)//len(keyword))]
-    sorted_keyword = "".join(sorted(keyword))
-    keyword_length = len(keyword)
-    sorted_split_message = [[]]*len(sorted_keyword)
-    for letter_number in range(len(sorted_keyword)):
-        sorted_split_message[letter_number] = encoded_split_message[sorted_keyword.index(keyword[0])]
-        encoded_split_message.pop(sorted_keyword.index(keyword[0]))
-        sorted_keyword = sorted_keyword.replace(keyword[0], "", 1)
-        keyword = keyword[1:]
-    processed_text = ""
-    for row in range(len(text)//keyword_length):
-        for column in range(keyword_length):
-            processed_text += sorted_split_message[column][row]
-    for _ in range(keyword_length):
-        if processed_text[-1] == character_that_filled:
-            processed_text = processed_text[:-1]
-        else:
-            break
-    return processed_text
+    number_of_rows = len(text)//len(keyword)
+    if number_of_rows == 0:
+        raise ValueError("Text should be at least as long as the keyword!")
+    code_points = _text_to_code_points(text[:number_of_rows*len(keyword)])
+    processed_code_points = numpy.empty_like(code_points)
+    processed_code_points[_columnar_transposition_permutation(keyword, number_of_rows)] = code_points
+    processed_text = _code_points_to_text(processed_code_points)
+    last_row = processed_text[-len(keyword):]
+    return processed_text[:-len(keyword)] + last_row.rstrip(character_that_filled)
 
 
 def autokey_cipher_encoding(text: str, keyword: str, alphabet: str) -> str:
@@ -314,11 +968,70 @@ def autokey_cipher_encoding(text: str, keyword: str, alphabet: str) -> str:
     text = text.upper().replace(" ", "")
     if any(not char.isalpha() for char in text):
         raise ValueError("Please remove any non-letter characters from the input text!")
+    alphabet = _as_alphabet(alphabet)
     key_phrase = keyword.upper() + text[:-len(keyword)]
-    processed_text = \
-        "".join([alphabet[(alphabet.index(text_character) + alphabet.index(key_phrase_character)) % len(alphabet)]
-                 for text_character, key_phrase_character in zip(text, key_phrase)])
-    return processed_text
+    text = text[:len(key_phrase)]
+    return _shift_letters(text, alphabet.text_to_indexes(key_phrase[:len(text)]), alphabet,
+                          pass_other_characters=False)
+
+
+class AutokeyCipherEncoder(CipherStream):
+    """ Incremental Auto-key cipher encoder (works the same way as "autokey_cipher_encoding" function).\n
+    The last letters of the text (as many as the keyword has) are kept between chunks, as they are the key for the
+    beginning of the next chunk.
+
+    :param keyword: A word, that a message should be encoded with.
+    :param alphabet: Ordered letters for a given alphabet (ideally unchanged from given ones).
+    """
+
+    def __init__(self, keyword: str, alphabet: str):
+        if not keyword:
+            raise ValueError("Keyword should not be empty!")
+        self.alphabet = _as_alphabet(alphabet)
+        self.keyword = keyword.upper()
+        self._key_letters = self.keyword
+
+    def update(self, chunk: str) -> str:
+        text = chunk.upper().replace(" ", "")
+        if any(not char.isalpha() for char in text):
+            raise ValueError("Please remove any non-letter characters from the input text!")
+        key_letters = self._key_letters + text
+        processed_text = _shift_letters(text, self.alphabet.text_to_indexes(key_letters[:len(text)]), self.alphabet,
+                                        pass_other_characters=False)
+        self._key_letters = key_letters[len(text):]
+        return processed_text
+
+    def finalize(self) -> str:
+        self._key_letters = self.keyword
+        return ""
+
+
+def _autokey_decoding_indexes(text_indexes: numpy.ndarray, key_indexes: numpy.ndarray,
+                              alphabet_length: int) -> numpy.ndarray:
+    """ Decoding engine of Auto-key cipher.\n
+    Every letter of the plaintext depends only on the ciphertext letter at the same position and the plaintext letter
+    one keyword length before, so the text is split into keyword length blocks (rows). In each column the recurrence
+    P[j] = C[j] - P[j-1] (with P[-1] being the keyword letter) unrolls to P[j] = (-1)^j (sum((-1)^i C[i], i <= j) - K),
+    which is computed for all blocks at once with a cumulative sum.
+
+    :param text_indexes: Indexes of ciphertext letters in the alphabet.
+    :param key_indexes: Indexes of keyword letters in the alphabet (at most as many as the text has).
+    :param alphabet_length: Length of the alphabet.
+    :return: Indexes of plaintext letters in the alphabet.
+    """
+    import numpy
+    number_of_blocks = -(-len(text_indexes) // len(key_indexes))
+    dtype = numpy.int32 if (number_of_blocks + 1)*alphabet_length < 2**31 else numpy.int64
+    blocks = numpy.zeros(number_of_blocks*len(key_indexes), dtype=dtype)
+    blocks[:len(text_indexes)] = text_indexes
+    columns = blocks.reshape(number_of_blocks, len(key_indexes)).T.copy()
+    signs = numpy.where(numpy.arange(number_of_blocks) % 2 == 0, 1, -1).astype(dtype)
+    columns *= signs
+    numpy.cumsum(columns, axis=1, out=columns)
+    columns -= key_indexes.astype(dtype)[:, None]
+    columns *= signs
+    columns %= alphabet_length
+    return columns.T.ravel()[:len(text_indexes)]
 
 
 def autokey_cipher_decoding(text: str, keyword: str, alphabet: str) -> str:
@@ -331,16 +1044,99 @@ def autokey_cipher_decoding(text: str, keyword: str, alphabet: str) -> str:
     :param alphabet: alphabet: Ordered letters for a given alphabet (ideally unchanged from given ones).
     :return: Deciphered message.
     """
-    if any(not char.isalpha() for char in text):
+    if not text:
+        return text
+    if not text.isalpha():
         raise ValueError("Text after ciphering with Autokey cipher should not have any non-letter characters!")
-    text = text.upper()
-    keyword = keyword.upper()
-    processed_text = ""
-    for character_number, character in enumerate(text):
-        processed_text += alphabet[(alphabet.index(character) -
-                                    alphabet.index(keyword[character_number] if character_number < len(keyword) else
-                                                   processed_text[character_number - len(keyword)]))]
-    return processed_text
+    if not keyword:
+        raise ValueError("Keyword should not be empty!")
+    alphabet = _as_alphabet(alphabet)
+    text_indexes = alphabet.text_to_indexes(text.upper())
+    if (text_indexes < 0).any():
+        raise ValueError("Text should only have letters from the given alphabet!")
+    key_indexes = alphabet.text_to_indexes(keyword.upper()[:len(text)])
+    if (key_indexes < 0).any():
+        raise ValueError("Keyword should only have letters from the given alphabet!")
+    return alphabet.indexes_to_text(_autokey_decoding_indexes(text_indexes, key_indexes, len(alphabet)))
+
+
+class AutokeyCipherDecoder(CipherStream):
+    """ Incremental Auto-key cipher decoder (works the same way as "autokey_cipher_decoding" function).\n
+    The last decoded letters (as many as the keyword has) are kept between chunks, as they are the key for the
+    beginning of the next chunk.
+
+    :param keyword: A word, that a message should be decoded with.
+    :param alphabet: Ordered letters for a given alphabet (ideally unchanged from given ones).
+    """
+
+    def __init__(self, keyword: str, alphabet: str):
+        if not keyword:
+            raise ValueError("Keyword should not be empty!")
+        self.alphabet = _as_alphabet(alphabet)
+        self.keyword = keyword.upper()
+        self._key_letters = self.keyword
+
+    def update(self, chunk: str) -> str:
+        if not chunk:
+            return chunk
+        if not chunk.isalpha():
+            raise ValueError("Text after ciphering with Autokey cipher should not have any non-letter characters!")
+        text_indexes = self.alphabet.text_to_indexes(chunk.upper())
+        if (text_indexes < 0).any():
+            raise ValueError("Text should only have letters from the given alphabet!")
+        key_indexes = self.alphabet.text_to_indexes(self._key_letters[:len(text_indexes)])
+        if (key_indexes < 0).any():
+            raise ValueError("Keyword should only have letters from the given alphabet!")
+        processed_text = self.alphabet.indexes_to_text(_autokey_decoding_indexes(text_indexes, key_indexes,
+                                                                                 len(self.alphabet)))
+        self._key_letters = (self._key_letters + processed_text)[len(processed_text):]
+        return processed_text
+
+    def finalize(self) -> str:
+        self._key_letters = self.keyword
+        return ""
+
+
+_CACHED_PERMUTATION_MAX_LENGTH = 1024
+
+
+def _build_rail_fence_permutation(text_length: int, number_of_rails: int) -> numpy.ndarray:
+    """ Computes the order, in which characters of the text are read rail by rail by Rail-fence cipher.\n
+    Characters repeat their rails every 2*(number_of_rails - 1) positions. The first and the last rail get one
+    character per cycle, every other rail r gets two - at positions r and cycle - r of each cycle. Permutations of
+    short texts are cached, long ones are computed every time, as they are as long as the text.
+
+    :param text_length: Length of the text.
+    :param number_of_rails: Number of rails (rows), to which the text is split.
+    :return: Array with positions of the text characters in the order of the encoded message.
+    """
+    import numpy
+    dtype = numpy.int32 if text_length < 2**31 else numpy.int64
+    cycle = 2*(number_of_rails - 1)
+    rails = [numpy.arange(0, text_length, cycle, dtype=dtype)]
+    for rail in range(1, number_of_rails - 1):
+        down_positions = numpy.arange(rail, text_length, cycle, dtype=dtype)
+        up_positions = numpy.arange(cycle - rail, text_length, cycle, dtype=dtype)
+        rail_positions = numpy.empty(len(down_positions) + len(up_positions), dtype=dtype)
+        rail_positions[0::2], rail_positions[1::2] = down_positions, up_positions
+        rails.append(rail_positions)
+    rails.append(numpy.arange(number_of_rails - 1, text_length, cycle, dtype=dtype))
+    return numpy.concatenate(rails)
+
+
+@KEY_SCHEDULE_CACHE.cached
+def _cached_rail_fence_permutation(text_length: int, number_of_rails: int) -> numpy.ndarray:
+    """ Read-only Rail-fence permutation of a short text, kept in the key schedule cache. """
+    permutation = _build_rail_fence_permutation(text_length, number_of_rails)
+    permutation.flags.writeable = False
+    return permutation
+
+
+def _rail_fence_permutation(text_length: int, number_of_rails: int) -> numpy.ndarray:
+    """ Rail-fence permutation, taken from the key schedule cache for texts up to _CACHED_PERMUTATION_MAX_LENGTH. """
+    if text_length <= _CACHED_PERMUTATION_MAX_LENGTH:
+        return _cached_rail_fence_permutation(text_length, number_of_rails)
+    return _build_rail_fence_permutation(text_length, number_of_rails)
 
 
 def rail_fence_cipher_encoding(text: str, number_of_rails: int, remove_spaces: bool = False) -> str:
@@ -359,18 +1155,8 @@ def rail_fence_cipher_encoding(text: str, number_of_rails: int, remove_spaces: b
     if remove_spaces:
         text = text.replace(" ", "")
     text = text.upper()
-    lists_of_text = [["" for _ in range(len(text))] for __ in range(number_of_rails)]
-    for rail in range(number_of_rails):
-        lists_of_text[rail][rail] = text[rail]
-    for letter in range(number_of_rails, len(text)):
-        index = number_of_rails - 1 - ((letter - number_of_rails) % (number_of_rails - 1) + 1) \
-            if ((letter - number_of_rails) // (number_of_rails - 1)) % 2 == 0 \
-            else ((letter - number_of_rails) % (number_of_rails - 1) + 1)
-        lists_of_text[index][letter] = text[letter]
-    processed_text_list = []
-    processed_text_list += ["".join(processed_list) for processed_list in lists_of_text]
-    processed_text = "".join(processed_text_list)
-    return processed_text
+    code_points = _text_to_code_points(text)
+    return _code_points_to_text(code_points[_rail_fence_permutation(len(text), number_of_rails)])
 
 
 def rail_fence_cipher_decoding(text: str, number_of_rails: int) -> str:
@@ -382,32 +1168,14 @@ def rail_fence_cipher_decoding(text: str, number_of_rails: int) -> str:
     :param number_of_rails: Specifies the number of rails (rows), to which the message was split.
     :return: Deciphered message.
     """
+    import numpy
     if number_of_rails < 2:
         raise ValueError("Number of rails should be at least 2!")
     text = text.upper()
-    lists_of_text = [["" for _ in range(len(text))] for __ in range(number_of_rails)]
-    text_index, last_text_index = 0, 0
-    indexes_list = [[2*(number_of_rails - i - 1), 2*i] for i in range(number_of_rails)]
-    for list_index in range(number_of_rails):
-        inlist_index = list_index
-        # if indexes_list[list_index][0] == 0:
-        #     indexes_list_index = 1
-        # elif indexes_list[list_index][1] == 0:
-        #     indexes_list_index = 0
-        # Line below is not the same, yet more elegant and works as it should
-        indexes_list_index = 1 if indexes_list[list_index][0] == 0 else 0
-        while inlist_index < len(text):
-            lists_of_text[list_index][inlist_index] = text[text_index]
-            if indexes_list[list_index][0] != 0 and indexes_list[list_index][1]:
-                indexes_list_index = (text_index - last_text_index) % 2
-            inlist_index += indexes_list[list_index][indexes_list_index]
-            text_index += 1
-        last_text_index = text_index
-    processed_text = ""
-    for letter_index in range(len(text)):
-        for list_index in range(number_of_rails):
-            processed_text += lists_of_text[list_index][letter_index]
-    return processed_text
+    code_points = _text_to_code_points(text)
+    processed_code_points = numpy.empty_like(code_points)
+    processed_code_points[_rail_fence_permutation(len(text), number_of_rails)] = code_points
+    return _code_points_to_text(processed_code_points)
 
 
 def bifid_cipher_generate_random_key(character_to_remove: str = "J", save_to_file: bool = True) -> str:
@@ -430,6 +1198,51 @@ def bifid_cipher_generate_random_key(character_to_remove: str = "J", save_to_fil
     return random_key
 
 
+def _regroup_fractionated_blocks(coordinates: numpy.ndarray, period: int, mode: int) -> numpy.ndarray:
+    """ Regroups coordinates of letters in period long blocks, as done by fractionating ciphers (Bifid, Trifid).\n
+    In encoding, coordinates of every block are written as all first coordinates, followed by all second coordinates
+    and so on, and then read back in groups of coordinates of one letter. Decoding does the opposite. All full blocks
+    are regrouped at once with reshape operations, the last (shorter) block separately.
+
+    :param coordinates: Array of shape (number of letters, number of coordinates of one letter).
+    :param period: Number of letters in each block.
+    :param mode: CIPHER_MODE or DECIPHER_MODE.
+    :return: Regrouped coordinates with the same shape.
+    """
+    import numpy
+    dimension = coordinates.shape[1]
+    full_blocks_length = len(coordinates) - len(coordinates) % period
+    blocks = [coordinates[:full_blocks_length].reshape(full_blocks_length//period, period, dimension),
+              coordinates[full_blocks_length:].reshape(1, len(coordinates) - full_blocks_length, dimension)]
+    if mode == CIPHER_MODE:
+        regrouped_blocks = [block.transpose(0, 2, 1).reshape(block.shape) for block in blocks]
+    else:
+        regrouped_blocks = [block.reshape(block.shape[0], dimension, block.shape[1]).transpose(0, 2, 1)
+                            for block in blocks]
+    return numpy.concatenate([block.reshape(-1, dimension) for block in regrouped_blocks])
+
+
+def _bifid_cipher(text: str, period: int, key: str, mode: int) -> str:
+    """ Shared engine of Bifid cipher encoding and decoding.\n
+    Letters of the text are converted to (row, column) coordinates in the 5x5 key square, regrouped in period long
+    blocks and converted back to letters.
+
+    :param text: Text to be processed (with letters from the key only).
+    :param period: Number of letters in each block of the text.
+    :param key: 25 letters of the key square.
+    :param mode: CIPHER_MODE or DECIPHER_MODE.
+    :return: Processed text.
+    """
+    import numpy
+    key = _as_alphabet(key)
+    letter_indexes = key.text_to_indexes(text)
+    if (letter_indexes < 0).any():
+        raise ValueError("Text should only have letters from the given key!")
+    coordinates = numpy.stack(numpy.divmod(letter_indexes.astype(numpy.uint8), 5), axis=1)
+    regrouped_coordinates = _regroup_fractionated_blocks(coordinates, period, mode)
+    return key.indexes_to_text(regrouped_coordinates[:, 0]*5 + regrouped_coordinates[:, 1])
+
+
 def bifid_cipher_encoding(text: str, period: int, key: str, character_to_replace: str = "J",
                           character_to_replace_with: str = "I") -> str:
     """ Bifid cipher function for encoding.\n
@@ -450,7 +1263,7 @@ def bifid_cipher_encoding(text: str, period: int, key: str, character_to_replace
     if period < 1:
         raise ValueError("Period must be positive!")
     text = text.upper().replace(" ", "")
-    if any(char not in LATIN_ALPHABET for char in text):
+    if (LATIN_ALPHABET.text_to_indexes(text) < 0).any():
         raise Exception("Please insert letters from the latin alphabet only!")
     if len(key) != len(LATIN_ALPHABET) - 1:
         raise ValueError("Key length has to be 1 less than that of the Latin Alphabet!")
@@ -460,26 +1273,7 @@ def bifid_cipher_encoding(text: str, period: int, key: str, character_to_replace
         raise ValueError("Invalid character_that_was_replaced or character_that_was_replaced_with. "
                          "Characters have to be single, different letters and have to be in Latin Alphabet!")
     text = text.replace(character_to_replace, character_to_replace_with)
-    key_square = {}
-    for row in range(1, 6):
-        for column in range(1, 6):
-            key_square[key[(row - 1)*5 + column - 1]] = [row, column]
-    first_row, second_row = "", ""
-    new_number_string = ""
-    for character_number, character in enumerate(text):
-        first_row += str(key_square[character][0])
-        second_row += str(key_square[character][1])
-        if (character_number + 1) % period == 0:
-            new_number_string += first_row + second_row
-            first_row, second_row = "", ""
-    new_number_string += first_row + second_row
-    processed_text = ""
-    keys_list = list(key_square.keys())
-    values_list = list(key_square.values())
-    for number in range(0, int(len(new_number_string)), 2):
-        processed_text += keys_list[values_list.index([int(new_number_string[number]),
-                                                       int(new_number_string[number + 1])])]
-    return processed_text
+    return _bifid_cipher(text, period, key, CIPHER_MODE)
 
 
 def bifid_cipher_decoding(text: str, period: int, key: str, character_that_was_replaced: str = "J",
@@ -497,7 +1291,7 @@ def bifid_cipher_decoding(text: str, period: int, key: str, character_that_was_r
     """
     if period < 1:
         raise ValueError("Period must be positive!")
-    if any(char not in LATIN_ALPHABET for char in text):
+    if (LATIN_ALPHABET.text_to_indexes(text) < 0).any():
         raise Exception("Please insert letters from the latin alphabet only!")
     if len(key) != len(LATIN_ALPHABET) - 1:
         raise ValueError("Key length has to be 1 less than that of the Latin Alphabet!")
@@ -508,29 +1302,40 @@ def bifid_cipher_decoding(text: str, period: int, key: str, character_that_was_r
         raise ValueError("Invalid character_that_was_replaced or character_that_was_replaced_with. "
                          "Characters have to be single, different letters and have to be in Latin Alphabet!")
     text = text.upper()
-    key_square = {}
-    for row in range(1, 6):
-        for column in range(1, 6):
-            key_square[key[(row - 1)*5 + column - 1]] = [row, column]
-    numbers_string = ""
-    for character in text:
-        numbers_string += str(key_square[character][0]) + str(key_square[character][1])
-    split_number_list = [numbers_string[i:i + period*2] for i in range(0, len(numbers_string), period*2)]
-    keys_list = list(key_square.keys())
-    values_list = list(key_square.values())
-    processed_text = ""
-    for section in split_number_list:
-        for iterable in range(period):
-            try:
-                processed_text += keys_list[values_list.index([int(section[iterable]),
-                                                               int(section[iterable + int(len(section)/2)])])]
-            except IndexError:
-                break
+    processed_text = _bifid_cipher(text, period, key, DECIPHER_MODE)
     processed_text = processed_text.replace(character_that_was_replaced_with,
                                             f"({character_that_was_replaced_with}/{character_that_was_replaced})")
     return processed_text
 
 
+class BeaufortCipherStream(CipherStream):
+    """ Incremental Beaufort cipher (works the same way as "beaufort_cipher" function).\n
+    Position in the keyword is carried between chunks as the number of letters processed so far (key_phase).
+
+    :param keyword: A word, that a message should be encoded/decoded with.
+    :param alphabet: Ordered letters for a given alphabet (ideally unchanged from given ones).
+    :param key_phase: Optional number of letters of the text, that were processed before the first chunk.
+    """
+
+    def __init__(self, keyword: str, alphabet: str, key_phase: int = 0):
+        self.alphabet = _as_alphabet(alphabet)
+        self._key_indexes = self.alphabet.text_to_indexes(keyword.upper())
+        self.key_phase = self._initial_key_phase = key_phase
+
+    def update(self, chunk: str) -> str:
+        text = chunk.upper().replace(" ", "")
+        if any(not char.isalpha() for char in text):
+            raise ValueError("Text to work with Beaufort cipher should not have any non-letter characters!")
+        processed_text = _shift_letters(text, self._key_indexes, self.alphabet, text_sign=-1, key_phase=self.key_phase,
+                                        pass_other_characters=False)
+        self.key_phase += len(text)
+        return processed_text
+
+    def finalize(self) -> str:
+        self.key_phase = self._initial_key_phase
+        return ""
+
+
 def beaufort_cipher(text: str, keyword: str, alphabet: str) -> str:
     """ Beufort cipher function.\n
     Keyword is repeated until the length is equal to that of ciphered/deciphered text. Then, letter by letter, index of
@@ -544,14 +1349,72 @@ def beaufort_cipher(text: str, keyword: str, alphabet: str) -> str:
     :param alphabet: Ordered letters for a given alphabet (ideally unchanged from given ones).
     :return: Ciphered or deciphered message.
     """
-    text = text.upper().replace(" ", "")
-    if any(not char.isalpha() for char in text):
-        raise ValueError("Text to work with Beaufort cipher should not have any non-letter characters!")
-    keyword = keyword.upper()
-    processed_text = \
-        "".join([alphabet[alphabet.index(keyword[character_number % len(keyword)]) - alphabet.index(character)]
-                 for character_number, character in enumerate(text)])
-    return processed_text
+    return BeaufortCipherStream(keyword, alphabet).update(text)
+
+
+@KEY_SCHEDULE_CACHE.cached
+def _porta_tableau(alphabet: Alphabet) -> numpy.ndarray:
+    """ Builds the Porta cipher tableau for the given alphabet.\n
+    Row number r corresponds to the keyword letters with indexes 2r and 2r + 1 and holds indexes of alphabet letters,
+    that letters of the alphabet are replaced with.
+
+    :param alphabet: Alphabet with even number of letters.
+    :return: Array of shape (length of the alphabet / 2, length of the alphabet).
+    """
+    import numpy
+    shift = len(alphabet)//2
+    modified_alphabet = list(range(shift, len(alphabet))) + list(range(shift))
+    tableau = numpy.empty((shift, len(alphabet)), dtype=numpy.int32)
+    for row in range(shift):
+        tableau[row] = modified_alphabet
+        modified_alphabet.insert(len(alphabet) - shift, modified_alphabet[0])
+        modified_alphabet.pop(0)
+        modified_alphabet.insert(len(alphabet) - shift, modified_alphabet[-1])
+        modified_alphabet.pop(-1)
+    tableau.flags.writeable = False
+    return tableau
+
+
+class PortaCipherStream(CipherStream):
+    """ Incremental Porta cipher (works the same way as "porta_cipher" function).\n
+    Position in the keyword is carried between chunks as the number of letters processed so far (key_phase).
+
+    :param keyword: A word, that a message should be encoded/decoded with.
+    :param alphabet: Ordered letters for a given alphabet (ideally unchanged from given ones).
+    :param key_phase: Optional number of letters of the text, that were processed before the first chunk.
+    """
+
+    def __init__(self, keyword: str, alphabet: str, key_phase: int = 0):
+        self.alphabet = _as_alphabet(alphabet)
+        self.keyword = keyword.upper()
+        self.key_phase = self._initial_key_phase = key_phase
+        key_indexes = self.alphabet.text_to_indexes(self.keyword)
+        self._keyword_in_alphabet = bool((key_indexes >= 0).all())
+        self._key_rows = key_indexes//2
+
+    def update(self, chunk: str) -> str:
+        import numpy
+        text = chunk.upper().replace(" ", "")
+        if text and not text.isalpha():
+            raise ValueError("Text to work with Porta cipher should not have any non-letter characters!")
+        if len(self.alphabet) % 2 != 0:
+            raise ValueError("Unfortunately Porta cipher doesn't work with alphabets, that are odd long...")
+        if not text:
+            return text
+        if not self.keyword:
+            raise ValueError("Keyword should not be empty!")
+        text_indexes = self.alphabet.text_to_indexes(text)
+        if (text_indexes < 0).any():
+            raise ValueError("Text should only have letters from the given alphabet!")
+        if not self._keyword_in_alphabet:
+            raise ValueError("Keyword should only have letters from the given alphabet!")
+        key_rows = self._key_rows[(numpy.arange(len(text_indexes)) + self.key_phase) % len(self._key_rows)]
+        self.key_phase += len(text_indexes)
+        return self.alphabet.indexes_to_text(_porta_tableau(self.alphabet)[key_rows, text_indexes])
+
+    def finalize(self) -> str:
+        self.key_phase = self._initial_key_phase
+        return ""
 
 
 def porta_cipher(text: str, keyword: str, alphabet: str) -> str:
@@ -571,28 +1434,154 @@ def porta_cipher(text: str, keyword: str, alphabet: str) -> str:
     :param alphabet: Ordered letters for a given alphabet (ideally unchanged from given ones).
     :return: Ciphered or deciphered message.
     """
-    text = text.upper().replace(" ", "")
-    if any(not char.isalpha() for char in text):
-        raise ValueError("Text to work with Porta cipher should not have any non-letter characters!")
-    if len(alphabet) % 2 != 0:
-        raise ValueError("Unfortunately Porta cipher doesn't work with alphabets, that are odd long...")
-    shift = len(alphabet)//2
-    shifted_alphabet = alphabet[shift:] + alphabet[:shift]
-    keyword = keyword.upper()
-    processed_text = ""
-    for character_number, character in enumerate(text):
-        modified_alphabet = list(shifted_alphabet)
-        for _ in range(alphabet.index(keyword[character_number % len(keyword)])//2):
-            modified_alphabet.insert(len(alphabet) - shift, modified_alphabet[0])
-            modified_alphabet.pop(0)
-            modified_alphabet.insert(len(alphabet) - shift, modified_alphabet[-1])
-            modified_alphabet.pop(-1)
-        joined_alphabet = "".join(modified_alphabet)
-        processed_text += joined_alphabet[(alphabet.index(character)) % len(alphabet)]
-    return processed_text
+    return PortaCipherStream(keyword, alphabet).update(text)
+
+
+def _keyphrase_letters(text: str) -> str:
+    """ Takes only letters from the keyphrase and changes them to uppercase. """
+    return "".join(filter(str.isalpha, text)).upper()
+
 
+class RunningKeyCorpus:
+    """ UTF-8 encoded corpus (e.g. a whole book) used as a keyphrase source of Running key cipher.\n
+    The corpus is memory-mapped and only as many letters as a message needs are extracted from it. While reading, an
+    index of chunk starts and numbers of letters before them is kept, so that reading letters at another offset starts
+    from the nearest chunk instead of the beginning of the corpus.
+
+    :param source: Path to the corpus file (string or os.PathLike), or memory-mapped (or bytes) UTF-8 encoded corpus.
+    :param chunk_size: Optional argument, that specifies how many bytes are read at once (and how dense the index is).
+    """
+
+    def __init__(self, source: Union[str, os.PathLike, mmap.mmap, bytes], chunk_size: int = 64*1024):
+        if chunk_size < 4:
+            raise ValueError("Chunk size should be at least 4 bytes!")
+        self.chunk_size = chunk_size
+        self._exit_stack = contextlib.ExitStack()
+        if isinstance(source, (str, os.PathLike)):
+            corpus_file = self._exit_stack.enter_context(open(source, "rb"))
+            if os.fstat(corpus_file.fileno()).st_size == 0:
+                self._data = b""
+            else:
+                self._data = self._exit_stack.enter_context(mmap.mmap(corpus_file.fileno(), 0,
+                                                                       access=mmap.ACCESS_READ))
+        else:
+            self._data = source
+        self._size = len(self._data)
+        self._chunk_starts, self._letters_before_chunks = [0], [0]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(<{self._size} bytes>, chunk_size={self.chunk_size})"
+
+    def __enter__(self) -> "RunningKeyCorpus":
+        return self
+
+    def __exit__(self, *exception_info):
+        self.close()
+
+    def close(self):
+        """ Closes the corpus file, if it was opened from a path. """
+        self._exit_stack.close()
+
+    def _chunk_end(self, chunk_start: int) -> int:
+        chunk_end = min(chunk_start + self.chunk_size, self._size)
+        while chunk_end < self._size and self._data[chunk_end] & 0xC0 == 0x80:
+            chunk_end -= 1
+        return chunk_end
+
+    def letters(self, offset: int, count: int) -> str:
+        """ Extracts letters (changed to uppercase) from the corpus. Other characters are skipped.
+
+        :param offset: Number of letters from the beginning of the corpus to skip.
+        :param count: Number of letters to extract.
+        :return: Extracted letters. Shorter than count, if the corpus ends earlier.
+        """
+        if offset < 0:
+            raise ValueError("Keyphrase offset should not be negative!")
+        chunk_number = bisect.bisect_right(self._letters_before_chunks, offset) - 1
+        chunk_start = self._chunk_starts[chunk_number]
+        letters_before_chunk = first_letters_before_chunk = self._letters_before_chunks[chunk_number]
+        chunk_letters = []
+        while letters_before_chunk < offset + count and chunk_start < self._size:
+            chunk_end = self._chunk_end(chunk_start)
+            chunk_letters.append(_keyphrase_letters(bytes(self._data[chunk_start:chunk_end]).decode("utf-8")))
+            letters_before_chunk += len(chunk_letters[-1])
+            chunk_start, chunk_number = chunk_end, chunk_number + 1
+            if chunk_number == len(self._chunk_starts):
+                self._chunk_starts.append(chunk_start)
+                self._letters_before_chunks.append(letters_before_chunk)
+        skipped_letters = offset - first_letters_before_chunk
+        return "".join(chunk_letters)[skipped_letters:skipped_letters + count]
+
+
+class RunningKeyCipherStream(CipherStream):
+    """ Incremental Running key cipher (works the same way as "running_key_cipher" function).\n
+    Letters of the keyphrase are read only when they are needed and the position in the keyphrase (keyphrase_offset)
+    is carried between chunks, so a big corpus used as a keyphrase is never loaded into memory as a whole.
+
+    :param keyphrase: A string of characters (letters mostly), that will serve as a key for encryption. Can also be a RunningKeyCorpus, a path (os.PathLike, e.g. pathlib.Path) to a UTF-8 encoded corpus file or a memory-mapped corpus. A string is always used as the keyphrase itself - to use a file given by a string path, pass RunningKeyCorpus(path).
+    :param alphabet: Ordered letters for a given alphabet (ideally unchanged from given ones).
+    :param mode: Specifies the mode for the function. Ideally use CIPHER_MODE and DECIPHER_MODE as inputs.
+    :param keyphrase_offset: Optional number of letters of the keyphrase to skip before the key starts.
+    """
 
-def running_key_cipher(text: str, keyphrase: str, alphabet: str, mode: int = CIPHER_MODE) -> str:
+    def __init__(self, keyphrase: Union[str, RunningKeyCorpus, os.PathLike, mmap.mmap], alphabet: str,
+                 mode: int = CIPHER_MODE, keyphrase_offset: int = 0):
+        if keyphrase_offset < 0:
+            raise ValueError("Keyphrase offset should not be negative!")
+        self.alphabet = _as_alphabet(alphabet)
+        self.mode = mode
+        self._initial_keyphrase_offset = keyphrase_offset
+        self._exit_stack = contextlib.ExitStack()
+        self._keyphrase, self._corpus = None, None
+        if isinstance(keyphrase, str):
+            self._keyphrase = keyphrase
+        elif isinstance(keyphrase, RunningKeyCorpus):
+            self._corpus = keyphrase
+        else:
+            self._corpus = self._exit_stack.enter_context(RunningKeyCorpus(keyphrase))
+        self._reset_keyphrase()
+
+    def _reset_keyphrase(self):
+        self.keyphrase_offset = self._initial_keyphrase_offset
+        if self._keyphrase is not None:
+            self.keyphrase_offset, self._keyphrase_position, self._pending_letters = 0, 0, ""
+            self._read_keyphrase_letters(self._initial_keyphrase_offset)
+
+    def _read_keyphrase_letters(self, count: int) -> str:
+        if self._corpus is not None:
+            letters = self._corpus.letters(self.keyphrase_offset, count)
+        else:
+            characters_to_read = count
+            while len(self._pending_letters) < count and self._keyphrase_position < len(self._keyphrase):
+                self._pending_letters += _keyphrase_letters(
+                    self._keyphrase[self._keyphrase_position:self._keyphrase_position + characters_to_read])
+                self._keyphrase_position += characters_to_read
+                characters_to_read *= 2
+            letters, self._pending_letters = self._pending_letters[:count], self._pending_letters[count:]
+        self.keyphrase_offset += len(letters)
+        return letters
+
+    def update(self, chunk: str) -> str:
+        text = chunk.upper().replace(" ", "")
+        if any(not char.isalpha() for char in text):
+            raise ValueError("Text to work with Porta cipher should not have any non-letter characters!")
+        keyphrase = self._read_keyphrase_letters(len(text))
+        if len(keyphrase) < len(text):
+            raise ValueError("Length of the keyphrase should be at least that of the ciphered text!")
+        return _shift_letters(text, self.alphabet.text_to_indexes(keyphrase), self.alphabet, key_sign=self.mode,
+                              pass_other_characters=False)
+
+    def finalize(self) -> str:
+        self._reset_keyphrase()
+        return ""
+
+    def close(self):
+        """ Closes the corpus file, if it was opened from a path. """
+        self._exit_stack.close()
+
+
+def running_key_cipher(text: str, keyphrase: Union[str, RunningKeyCorpus, os.PathLike, mmap.mmap], alphabet: str,
+                       mode: int = CIPHER_MODE, keyphrase_offset: int = 0) -> str:
     """ Running key cipher function.\n
     Uses a quote from a book/poem or any letter string, that is longer than the ciphered text. Letter by letter, index
     of the processed text is a sum of the index of the current letter from keyphrase and the index of the current letter
@@ -601,38 +1590,37 @@ def running_key_cipher(text: str, keyphrase: str, alphabet: str, mode: int = CIP
     See reference [13] from README file for more information about the cipher.
 
     :param text: Message to be encoded or decoded. Can contain only letter characters.
-    :param keyphrase: A string (longer, than ciphered text) of characters (letters mostly), that will serve as a key for encryption. Excerpts from books are a good example.
+    :param keyphrase: A string (longer, than ciphered text) of characters (letters mostly), that will serve as a key for encryption. Excerpts from books are a good example. Can also be a RunningKeyCorpus, a path (os.PathLike, e.g. pathlib.Path) to a UTF-8 encoded corpus file or a memory-mapped corpus. A string is always used as the keyphrase itself - to use a file given by a string path, pass RunningKeyCorpus(path).
     :param alphabet: Ordered letters for a given alphabet (ideally unchanged from given ones).
     :param mode: Specifies the mode for the function. Ideally use CIPHER_MODE and DECIPHER_MODE as inputs.
+    :param keyphrase_offset: Optional number of letters of the keyphrase to skip before the key starts.
     :return: Ciphered or deciphered message.
     """
-    text = text.upper().replace(" ", "")
-    keyphrase = "".join([character.upper() if character.isalpha() else "" for character in keyphrase])
-    if any(not char.isalpha() for char in text):
-        raise ValueError("Text to work with Porta cipher should not have any non-letter characters!")
-    if len(keyphrase) < len(text):
-        raise ValueError("Length of the keyphrase should be at least that of the ciphered text!")
-    processed_text = ""
-    for text_character, keyphrase_character in zip(text, keyphrase):
-        processed_text += alphabet[(alphabet.index(text_character) +
-                                    mode*alphabet.index(keyphrase_character)) % len(alphabet)]
-    return processed_text
+    with RunningKeyCipherStream(keyphrase, alphabet, mode, keyphrase_offset) as stream:
+        return stream.update(text)
 
 
-def homophonic_substitution_generate_letter_connection_dictionary(alphabet: str) -> Dict[str, List[str]]:
-    """ Function, that generates a letter connection dictionary for the usage of "homophonic_substitution_cipher"
-    function.\n
-    Creates a dictionary of alphabet letters as keys and lists of letters from the alphabet and numbers as values.
-    Lists are determined by reading letter frequency of a particular alphabet from wikipedia page.
-    The more common a letter is, the more characters are placed in the list as a value for that letter.\n
-    See references [14], [21], [22] from README file for more information about the cipher.
+def _letter_frequency_file_path(alphabet: str) -> str:
+    return f"./generated_files/letter_frequency_{_LETTER_FREQUENCY_NAMES[alphabet]}.json"
+
+
+def homophonic_substitution_refresh_letter_frequency(alphabet: str, save_to_file: bool = True) -> Dict[str, float]:
+    """ Function, that downloads letter frequency of a given alphabet from wikipedia page.\n
+    Downloaded frequency is saved to a file as a default and is used by
+    "homophonic_substitution_generate_letter_connection_dictionary" function instead of the bundled one
+    (LETTER_FREQUENCIES). Requires an internet connection.\n
+    See references [21], [22] from README file for more information about letter frequency.
 
     :param alphabet: Ordered letters for a given alphabet (allows alphabets only from given ones).
-    :return: Letter connection dictionary.
+    :param save_to_file: Optional argument, that specifies, whether to save downloaded letter frequency into a file.
+    :return: Dictionary of letters of the alphabet as keys and their frequency (in percents) as values.
     """
-    if alphabet not in [LATIN_ALPHABET, POLISH_ALPHABET, RUSSIAN_ALPHABET]:
+    if alphabet not in _LETTER_FREQUENCY_NAMES:
         raise ValueError("For now, this function accepts only three alphabets (Latin, Polish and Russian)! "
                          "Frequency of other alphabets is not accessible on wikipedia page.")
+    import pandas
+    import requests
+    from bs4 import BeautifulSoup
     extension_dict = {LATIN_ALPHABET: "Letter_frequency", POLISH_ALPHABET: "Letter_frequency",
                       RUSSIAN_ALPHABET: "Russian_alphabet"}
     extension = extension_dict[alphabet]
@@ -659,35 +1647,141 @@ def homophonic_substitution_generate_letter_connection_dictionary(alphabet: str)
     alphabet_frequency = list(dict_data[alphabet_to_name_dict[alphabet]].values())
     alphabet_frequency = [float(percentage.replace("%", "").replace("~", "").replace("[citation needed]", ""))
                           for percentage in alphabet_frequency]
-    alphabet_dict = {letter: percentage for letter, percentage in zip(letters, alphabet_frequency) if percentage != 0}
-    letters = list(alphabet_dict.keys())
-    alphabet_frequency = list(alphabet_dict.values())
+    frequency_dict = dict(zip(letters, alphabet_frequency))
+    frequency_dict = {letter: frequency_dict[letter] for letter in alphabet if letter in frequency_dict}
+    if save_to_file:
+        with open(_letter_frequency_file_path(alphabet), "w", encoding="utf-8") as output_file:
+            json.dump(frequency_dict, output_file, ensure_ascii=False, indent=4)
+    return frequency_dict
+
+
+def _load_letter_frequency(alphabet: str) -> Dict[str, float]:
+    """ Loads letter frequency saved by "homophonic_substitution_refresh_letter_frequency" function or falls back to
+    the bundled one. """
+    if alphabet not in _LETTER_FREQUENCY_NAMES:
+        raise ValueError("For now, this function accepts only three alphabets (Latin, Polish and Russian)! "
+                         "Frequency of other alphabets is not accessible on wikipedia page.")
+    try:
+        with open(_letter_frequency_file_path(alphabet), "r", encoding="utf-8") as input_file:
+            return json.load(input_file)
+    except FileNotFoundError:
+        return LETTER_FREQUENCIES[alphabet]
+
+
+def homophonic_substitution_generate_letter_connection_dictionary(
+        alphabet: str, letter_frequency: Optional[Dict[str, float]] = None) -> Dict[str, List[str]]:
+    """ Function, that generates a letter connection dictionary for the usage of "homophonic_substitution_cipher"
+    function.\n
+    Creates a dictionary of alphabet letters as keys and lists of letters from the alphabet and numbers as values.
+    Lists are determined by letter frequency of a particular alphabet. By default, the frequency downloaded earlier by
+    "homophonic_substitution_refresh_letter_frequency" function is used, or the bundled one (LETTER_FREQUENCIES) if it
+    was never downloaded, so no internet connection is needed.
+    The more common a letter is, the more characters are placed in the list as a value for that letter.\n
+    See references [14], [21], [22] from README file for more information about the cipher.
+
+    :param alphabet: Ordered letters for a given alphabet (allows alphabets only from given ones, unless letter_frequency is provided).
+    :param letter_frequency: Optional dictionary of letters of the alphabet as keys and their frequency (in percents) as values.
+    :return: Letter connection dictionary.
+    """
+    if letter_frequency is None:
+        letter_frequency = _load_letter_frequency(alphabet)
+    if any(letter_frequency.get(letter, 0) <= 0 for letter in alphabet):
+        raise ValueError("Letter frequency should have a positive value for every letter of the alphabet!")
+    alphabet_frequency = [letter_frequency[letter] for letter in alphabet]
     number_of_all_characters = 0
     lower_value, upper_value = 1, max(alphabet_frequency)
-    while number_of_all_characters != (total_length := len(alphabet) + len(DIGITS)):
+    for _ in range(_MAX_BISECTION_STEPS):
         medium_value = (lower_value + upper_value)/2
         all_characters = [int(percentage//medium_value) if percentage > medium_value else 1
                           for percentage in alphabet_frequency]
         number_of_all_characters = sum(all_characters)
+        if number_of_all_characters == (total_length := len(alphabet) + len(DIGITS)):
+            break
         if number_of_all_characters > total_length:
             lower_value = medium_value
         else:
             upper_value = medium_value
-    letter_connection_dictionary_unordered = {}
+    else:
+        raise ValueError("Letter frequency can't be used to split letters and digits between letters of the alphabet!")
+    letter_connection_dictionary = {}
     alphabet_copy = alphabet + DIGITS
-    for index, value in enumerate(all_characters):
+    for letter, value in zip(alphabet, all_characters):
         random_sample = random.sample(alphabet_copy, value)
-        letter_connection_dictionary_unordered[letters[index]] = random_sample
+        letter_connection_dictionary[letter] = random_sample
         for sample in random_sample:
             alphabet_copy = alphabet_copy.replace(sample, "")
-    letter_connection_dictionary = {}
-    for letter in alphabet:
-        letter_connection_dictionary[letter] = letter_connection_dictionary_unordered[letter]
     return letter_connection_dictionary
 
 
-def homophonic_substitution_cipher(text: str, letter_connection_dictionary: Dict[str, List[str]],
-                                   mode: int = CIPHER_MODE) -> str:
+class HomophonicSubstitutionKey:
+    """ Compiled letter connection dictionary of Homophonic substitution cipher.\n
+    Symbols of all letters are stored in one flat array (with the position of the first symbol and the number of
+    symbols of every letter), so encoding draws the symbols for a whole message at once. Decoding uses a reverse
+    symbol to letter translation table.
+
+    :param letter_connection_dictionary: A dictionary with letter as keys, and lists of characters and digits as values. Generated by "homophonic_substitution_generate_letter_connection_dictionary" function.
+    """
+
+    def __init__(self, letter_connection_dictionary: Dict[str, List[str]]):
+        import numpy
+        symbols = [symbol for letter_symbols in letter_connection_dictionary.values() for symbol in letter_symbols]
+        if len(symbols) != len(letter_connection_dictionary) + len(DIGITS) \
+                or any(len(symbol) != 1 for symbol in symbols) or len(set(symbols)) != len(symbols):
+            raise ValueError("letter_connection_dictionary appears to be constructed wrong! "
+                             "Please use \"homophonic_substitution_generate_letter_connection_dictionary\" function "
+                             "to generate the dictionary!")
+        self.letter_connection_dictionary = {letter: list(letter_symbols)
+                                             for letter, letter_symbols in letter_connection_dictionary.items()}
+        self.letters = _as_alphabet("".join(letter_connection_dictionary))
+        self.symbol_counts = numpy.array([len(letter_symbols)
+                                          for letter_symbols in letter_connection_dictionary.values()])
+        self.symbol_offsets = numpy.cumsum(self.symbol_counts) - self.symbol_counts
+        self.symbol_code_points = _text_to_code_points("".join(symbols))
+        for array in (self.symbol_counts, self.symbol_offsets, self.symbol_code_points):
+            array.flags.writeable = False
+        self._decoding_table = str.maketrans({symbol: letter for letter, letter_symbols
+                                              in reversed(letter_connection_dictionary.items())
+                                              for symbol in letter_symbols})
+        self._allowed_characters = {CIPHER_MODE: frozenset(self.letters + " "),
+                                    DECIPHER_MODE: frozenset(self.letters + " " + DIGITS)}
+
+    def translate(self, text: str, mode: int = CIPHER_MODE,
+                  seed: Optional[Union[int, numpy.random.Generator]] = None) -> str:
+        """ Encodes or decodes a message the same way as "homophonic_substitution_cipher" function.
+
+        :param text: Message to be encoded or decoded. Can contain only letter characters, when CIPHER_MODE or letter characters with digits, when DECIPHER_MODE.
+        :param mode: Specifies the mode for the function. Ideally use CIPHER_MODE and DECIPHER_MODE as inputs.
+        :param seed: Optional seed (or NumPy random generator) used to choose symbols, when encoding.
+        :return: Ciphered or deciphered message.
+        """
+        import numpy
+        text = text.upper()
+        if not set(text) <= self._allowed_characters[DECIPHER_MODE if mode == DECIPHER_MODE else CIPHER_MODE]:
+            raise ValueError("Homophonic substitution supports only letters from letter_connection_dictionary!")
+        if mode != CIPHER_MODE:
+            return text.translate(self._decoding_table)
+        code_points = _text_to_code_points(text)
+        letter_indexes = self.letters._code_points_to_indexes(code_points)
+        is_letter = letter_indexes >= 0
+        letter_indexes = letter_indexes[is_letter]
+        symbol_indexes = self.symbol_offsets[letter_indexes] + \
+            numpy.random.default_rng(seed).integers(self.symbol_counts[letter_indexes])
+        processed_code_points = code_points.copy()
+        processed_code_points[is_letter] = self.symbol_code_points[symbol_indexes]
+        return _code_points_to_text(processed_code_points)
+
+
+@KEY_SCHEDULE_CACHE.cached
+def _compile_homophonic_substitution_key(
+        letter_connection_items: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> HomophonicSubstitutionKey:
+    return HomophonicSubstitutionKey({letter: list(letter_symbols)
+                                      for letter, letter_symbols in letter_connection_items})
+
+
+def homophonic_substitution_cipher(text: str,
+                                   letter_connection_dictionary: Union[Dict[str, List[str]], HomophonicSubstitutionKey],
+                                   mode: int = CIPHER_MODE,
+                                   seed: Optional[Union[int, numpy.random.Generator]] = None) -> str:
     """ Homophonic substitution cipher function.\n
     Uses letter_connection_dictionary to encode and decode a message. The letters to be encoded are the keys of the
     dictionary, and shuffled letters with numbers are the values. The concept is to make ciphered text uniform in
@@ -698,36 +1792,15 @@ def homophonic_substitution_cipher(text: str, letter_connection_dictionary: Dict
     See reference [14] from README file for more information about the cipher.
 
     :param text: Message to be encoded or decoded. Can contain only letter characters, when CIPHER_MODE or letter characters with digits, when DECIPHER_MODE.
-    :param letter_connection_dictionary: A dictionary with letter as keys, and lists of characters and digits as values. Generated by "homophonic_substitution_generate_letter_connection_dictionary" function.
+    :param letter_connection_dictionary: A dictionary with letter as keys, and lists of characters and digits as values. Generated by "homophonic_substitution_generate_letter_connection_dictionary" function. Can also be a compiled HomophonicSubstitutionKey.
     :param mode: Specifies the mode for the function. Ideally use CIPHER_MODE and DECIPHER_MODE as inputs.
+    :param seed: Optional seed (or NumPy random generator) used to choose symbols, when encoding. The same seed gives the same ciphered message.
     :return: Ciphered or deciphered message.
     """
-    text = text.upper()
-    additional_characters = " " + DIGITS if mode == DECIPHER_MODE else " "
-    letters = list(letter_connection_dictionary.keys())
-    if any(char not in letters + list(additional_characters) for char in text):
-        raise ValueError("Homophonic substitution supports only letters from letter_connection_dictionary!")
-    number_of_characters_total = sum([len(item) for item in list(letter_connection_dictionary.values())])
-    if number_of_characters_total != len(letters) + len(DIGITS):
-        raise ValueError("letter_connection_dictionary appears to be constructed wrong! "
-                         "Please use \"homophonic_substitution_generate_letter_connection_dictionary\" function "
-                         "to generate the dictionary!")
-    if mode == CIPHER_MODE:
-        processed_text = "".join([random.choice(letter_connection_dictionary[character])
-                                  if character in letter_connection_dictionary.keys() else character
-                                  for character in text])
-    else:
-        dictionary_values_list = list(letter_connection_dictionary.values())
-        processed_text = ""
-        for character in text:
-            if character not in letters + list(DIGITS):
-                processed_text += character
-                continue
-            for value_number, value in enumerate(dictionary_values_list):
-                if character in value:
-                    processed_text += list(letter_connection_dictionary.keys())[value_number]
-                    break
-    return processed_text
+    if not isinstance(letter_connection_dictionary, HomophonicSubstitutionKey):
+        letter_connection_dictionary = _compile_homophonic_substitution_key(
+            tuple((letter, tuple(letter_symbols)) for letter, letter_symbols in letter_connection_dictionary.items()))
+    return letter_connection_dictionary.translate(text, mode, seed)
 
 
 def trifid_cipher_generate_random_key(additional_character: str = ".", save_to_file: bool = True) -> str:
@@ -750,6 +1823,13 @@ def trifid_cipher_generate_random_key(additional_character: str = ".", save_to_f
     return random_key
 
 
+def _trifid_coordinates(letter_indexes: numpy.ndarray) -> numpy.ndarray:
+    """ Converts indexes of letters in the Trifid key to (layer, row, column) coordinates in the 3x3x3 key cube. """
+    import numpy
+    letter_indexes = letter_indexes.astype(numpy.uint8)
+    return numpy.stack([letter_indexes//9, letter_indexes//3 % 3, letter_indexes % 3], axis=1)
+
+
 def trifid_cipher_encoding(text: str, key: str, period: int) -> str:
     """ Trifid cipher function for encoding.\n
     The key is split into 3 equal parts (length 9). These chunks are than split into 3 rows to create 3 square matrices
@@ -766,6 +1846,7 @@ def trifid_cipher_encoding(text: str, key: str, period: int) -> str:
     :param period: Specifies the number of letters, that is supposed to be in each chunk, when dividing the message.
     :return: Ciphered message.
     """
+    import numpy
     text = text.replace(" ", "").upper()
     key = key.upper()
     additional_character = ""
@@ -775,31 +1856,20 @@ def trifid_cipher_encoding(text: str, key: str, period: int) -> str:
     if len(additional_character) != 1:
         raise ValueError("Key appears to have wrong structure not generated by "
                          "trifid_cipher_generate_random_key function!")
-    if any(char not in key for char in text):
+    key = _as_alphabet(key)
+    letter_indexes = key.text_to_indexes(text)
+    if (letter_indexes < 0).any():
         raise Exception("Please insert letters from the key only!")
     if period < 2:
         raise ValueError("Period should be at least 2!")
-    first_row, second_row, third_row = "", "", ""
-    new_number_string = ""
-    for character_number, character in enumerate(text):
-        letter_number = key.index(character) + 1
-        first_row += str((letter_number - 1)//9)
-        second_row += str(((letter_number - 1)//3) % 3)
-        third_row += str((letter_number - 1) % 3)
-        if (character_number + 1) % period == 0:
-            new_number_string += first_row + second_row + third_row + " "
-            first_row, second_row, third_row = "", "", ""
-    new_number_string += first_row + second_row + third_row
-    processed_text = ""
-    skip_letters = 0
-    for letter_number in range(0, len(text)*3, 3):
-        if (letter_number/3) % period == 0 and letter_number != 0:
-            skip_letters += 1
-            processed_text += " "
-        processed_text += key[int(new_number_string[letter_number + skip_letters])*9 +
-                              int(new_number_string[letter_number + 1 + skip_letters])*3 +
-                              int(new_number_string[letter_number + 2 + skip_letters])]
-    return processed_text
+    if not text:
+        return text
+    coordinates = _regroup_fractionated_blocks(_trifid_coordinates(letter_indexes), period, CIPHER_MODE)
+    code_points = key._indexes_to_code_points(coordinates @ numpy.array([9, 3, 1]))
+    positions = numpy.arange(len(code_points))
+    processed_code_points = numpy.full(len(code_points) + (len(code_points) - 1)//period, ord(" "), dtype=numpy.uint32)
+    processed_code_points[positions + positions//period] = code_points
+    return _code_points_to_text(processed_code_points)
 
 
 def trifid_cipher_decoding(text: str, key: str, period: int) -> str:
@@ -812,6 +1882,7 @@ def trifid_cipher_decoding(text: str, key: str, period: int) -> str:
     :param period: Specifies the number of letters, that was supposed to be in each chunk, when dividing the message.
     :return: Deciphered message.
     """
+    import numpy
     text = text.upper()
     key = key.upper()
     additional_character = ""
@@ -821,29 +1892,98 @@ def trifid_cipher_decoding(text: str, key: str, period: int) -> str:
     if len(additional_character) != 1:
         raise ValueError("Key appears to have wrong structure not generated by "
                          "trifid_cipher_generate_random_key function!")
-    if any(char not in key + " " for char in text):
+    key = _as_alphabet(key)
+    code_points = _text_to_code_points(text)
+    is_space = code_points == ord(" ")
+    letter_indexes = key._code_points_to_indexes(code_points)
+    if ((letter_indexes < 0) & ~is_space).any():
         raise Exception("Encoded message appears to have characters, that are not in key and are not space!")
     if period < 2:
         raise ValueError("Period should be at least 2!")
-    split_text = text.split(" ")
-    number_string = ""
-    number_list = []
-    for word in split_text:
-        for character in word:
-            letter_number = key.index(character) + 1
-            first_number = str((letter_number - 1)//9)
-            second_number = str(((letter_number - 1)//3) % 3)
-            third_number = str((letter_number - 1) % 3)
-            number_string += first_number + second_number + third_number
-        number_list.append(number_string)
-        number_string = ""
-    processed_text = ""
-    for number_string in number_list:
-        for letter_number in range(string_length := len(number_string)//3):
-            processed_text += key[int(number_string[letter_number])*9 +
-                                  int(number_string[letter_number + string_length])*3 +
-                                  int(number_string[letter_number + 2*string_length])]
-    return processed_text
+    coordinates = _trifid_coordinates(letter_indexes[~is_space])
+    word_lengths = numpy.diff(numpy.concatenate(([-1], numpy.flatnonzero(is_space), [len(text)]))) - 1
+    word_lengths = word_lengths[word_lengths > 0]
+    run_starts = numpy.flatnonzero(numpy.diff(word_lengths, prepend=0))
+    run_lengths = numpy.diff(numpy.append(run_starts, len(word_lengths)))
+    regrouped_coordinates, coordinates_start = [coordinates[:0]], 0
+    for word_length, number_of_words in zip(word_lengths[run_starts], run_lengths):
+        coordinates_end = coordinates_start + word_length*number_of_words
+        regrouped_coordinates.append(_regroup_fractionated_blocks(coordinates[coordinates_start:coordinates_end],
+                                                                  word_length, DECIPHER_MODE))
+        coordinates_start = coordinates_end
+    return key.indexes_to_text(numpy.concatenate(regrouped_coordinates) @ numpy.array([9, 3, 1]))
+
+
+def _integer_determinant(matrix: Tuple[Tuple[int, ...], ...]) -> int:
+    """ Computes the exact determinant of an integer matrix with fraction-free Bareiss elimination. """
+    matrix = [list(row) for row in matrix]
+    size, sign, previous_pivot = len(matrix), 1, 1
+    for pivot_number in range(size - 1):
+        if matrix[pivot_number][pivot_number] == 0:
+            swap_row = next((row for row in range(pivot_number + 1, size) if matrix[row][pivot_number] != 0), None)
+            if swap_row is None:
+                return 0
+            matrix[pivot_number], matrix[swap_row] = matrix[swap_row], matrix[pivot_number]
+            sign = -sign
+        pivot = matrix[pivot_number][pivot_number]
+        for row in range(pivot_number + 1, size):
+            for column in range(pivot_number + 1, size):
+                matrix[row][column] = (matrix[row][column]*pivot -
+                                       matrix[row][pivot_number]*matrix[pivot_number][column]) // previous_pivot
+        previous_pivot = pivot
+    return sign*matrix[-1][-1]
+
+
+def _modular_matrix_inverse(matrix: Tuple[Tuple[int, ...], ...], modulus: int) -> List[List[int]]:
+    """ Computes the inverse of an integer matrix modulo a (not necessarily prime) number.\n
+    Gauss-Jordan elimination, in which pivots are found with Euclidean algorithm on the rows, so that only integer
+    operations are used. The determinant of the matrix has to be coprime with the modulus.
+    """
+    size = len(matrix)
+    rows = [[element % modulus for element in row] + [int(row_number == column) for column in range(size)]
+            for row_number, row in enumerate(matrix)]
+    for column in range(size):
+        while True:
+            pivot_row = min((row for row in range(column, size) if rows[row][column] != 0),
+                            key=lambda row: rows[row][column])
+            rows[column], rows[pivot_row] = rows[pivot_row], rows[column]
+            for row in range(column + 1, size):
+                quotient = rows[row][column] // rows[column][column]
+                rows[row] = [(element - quotient*pivot_element) % modulus
+                             for element, pivot_element in zip(rows[row], rows[column])]
+            if all(rows[row][column] == 0 for row in range(column + 1, size)):
+                break
+        pivot_inverse = pow(rows[column][column], -1, modulus)
+        rows[column] = [element*pivot_inverse % modulus for element in rows[column]]
+        for row in range(size):
+            if row != column and rows[row][column] != 0:
+                factor = rows[row][column]
+                rows[row] = [(element - factor*pivot_element) % modulus
+                             for element, pivot_element in zip(rows[row], rows[column])]
+    return [row[size:] for row in rows]
+
+
+@KEY_SCHEDULE_CACHE.cached
+def _hill_cipher_key_schedule(key_matrix: Tuple[Tuple[int, ...], ...],
+                              alphabet_length: int) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """ Validates the key matrix of Hill cipher and computes its inverse modulo the length of the alphabet.
+
+    :param key_matrix: Square key matrix.
+    :param alphabet_length: Length of the alphabet.
+    :return: Key matrix and its modular inverse.
+    """
+    import numpy
+    key_determinant = _integer_determinant(key_matrix) % alphabet_length
+    if key_determinant == 0:
+        raise ValueError("Determinant of the matrix is 0 (matrix is not invertable, thus, "
+                         "no decoding will be possible). Change the key matrix!")
+    if (common_divisor := math.gcd(key_determinant, alphabet_length)) != 1:
+        raise ValueError(f"Key matrix determinant ({key_determinant}) has common divisor ({common_divisor}) "
+                         f"with the length of the alphabet ({alphabet_length}). Change the key matrix!")
+    key_array = numpy.array(key_matrix, dtype=numpy.int64)
+    key_inverse_array = numpy.array(_modular_matrix_inverse(key_matrix, alphabet_length), dtype=numpy.int64)
+    key_array.flags.writeable = key_inverse_array.flags.writeable = False
+    return key_array, key_inverse_array
 
 
 def hill_cipher(text: str, alphabet: str, key_matrix: List[List[int]], mode: int = CIPHER_MODE,
@@ -871,56 +2011,38 @@ def hill_cipher(text: str, alphabet: str, key_matrix: List[List[int]], mode: int
     :param character_to_fill: Optional argument, that specifies, what letter should be used to fill gaps in the last slice of the text (ideally should not be equal to the last letter in the message).
     :return: Ciphered or deciphered message.
     """
+    import numpy
     text = text.replace(" ", "").upper()
+    alphabet = _as_alphabet(alphabet)
     number_of_columns = len(key_matrix)
-    for row in key_matrix:
-        if len(row) != number_of_columns:
-            raise ValueError("Key matrix must be a square matrix!")
+    if number_of_columns == 0 or any(len(row) != number_of_columns for row in key_matrix):
+        raise ValueError("Key matrix must be a square matrix!")
     for row in key_matrix:
         for element in row:
             if element > len(alphabet) - 1 or element < 0:
                 raise ValueError(f"Numbers in the matrix should be in range 0 - {len(alphabet) - 1} for this alphabet")
     if len(character_to_fill.replace(" ", "")) != 1:
         raise ValueError('"character_to_fill" should be one character and not blank space!')
-    if any(char not in alphabet for char in text):
+    text_indexes = alphabet.text_to_indexes(text)
+    if (text_indexes < 0).any():
         raise ValueError("Hill cipher supports only letters from the given alphabet!")
     character_to_fill = character_to_fill.upper()
-    if text[-1] == character_to_fill:
+    if text and text[-1] == character_to_fill:
         print(f'Last letter of the message is the same as the "character_to_fill", that fills the gap. '
               f'Consider changing it to be different than "{text[-1]}"')
-    key_array = numpy.array(key_matrix)
-    alphabet_length = len(alphabet)
-    key_determinant = (round(numpy.linalg.det(key_array)) % alphabet_length + alphabet_length) % alphabet_length
-    if key_determinant == 0:
-        raise ValueError("Determinant of the matrix is 0 (matrix is not invertable, thus, "
-                         "no decoding will be possible). Change the key matrix!")
-    if (common_divisor := math.gcd(key_determinant, alphabet_length)) != 1:
-        raise ValueError(f"Key matrix determinant ({key_determinant}) has common divisor ({common_divisor}) "
-                         f"with the length of the alphabet ({alphabet_length}). Change the key matrix!")
-    number_of_characters_to_fill = len(text) % len(key_matrix)
-    text += character_to_fill*number_of_characters_to_fill
+    key_array, key_inverse_array = _hill_cipher_key_schedule(tuple(map(tuple, key_matrix)), len(alphabet))
     if mode == DECIPHER_MODE:
-        key_inverse = numpy.linalg.inv(key_array)
-        multiplicative_inverse = pow(key_determinant, -1, alphabet_length)
-        key_array = numpy.rint(numpy.fmod(multiplicative_inverse*numpy.fmod(
-            numpy.fmod(key_inverse*numpy.linalg.det(key_array), alphabet_length) + alphabet_length, alphabet_length) +
-                                          alphabet_length, alphabet_length))
-    message_vector = [[0]]*number_of_columns
-    sliced_text = [text[i:i + number_of_columns] for i in range(0, len(text), number_of_columns)]
-    processed_text = ""
-    for text_group in sliced_text:
-        for character_number, character in enumerate(text_group):
-            message_vector[character_number] = [alphabet.index(character)]
-        message_vector_array = numpy.array(message_vector)
-        enciphered_vector = numpy.fmod(numpy.matmul(key_array, message_vector_array), alphabet_length).tolist()
-        for character_number in enciphered_vector:
-            processed_text += alphabet[int(character_number[0])]
+        key_array = key_inverse_array
+    number_of_characters_to_fill = -len(text_indexes) % number_of_columns
+    if number_of_characters_to_fill:
+        if character_to_fill not in alphabet:
+            raise ValueError('"character_to_fill" should be a letter from the given alphabet!')
+        text_indexes = numpy.append(text_indexes, [alphabet.index(character_to_fill)]*number_of_characters_to_fill)
+    processed_indexes = (text_indexes.reshape(-1, number_of_columns) @ key_array.T) % len(alphabet)
+    processed_text = alphabet.indexes_to_text(processed_indexes.ravel())
     if mode == DECIPHER_MODE:
-        for _ in range(number_of_columns):
-            if processed_text[-1] == character_to_fill:
-                processed_text = processed_text[:-1]
-            else:
-                break
+        last_block = processed_text[-number_of_columns:]
+        processed_text = processed_text[:-number_of_columns] + last_block.rstrip(character_to_fill)
     return processed_text
 
 
@@ -960,6 +2082,100 @@ def playfair_cipher_generate_key_square(keyword: str, character_to_remove: str =
     return key_square
 
 
+class PlayfairKeySquare:
+    """ Compiled key square of Playfair cipher.\n
+    All 625 pairs of letters (digraphs) are mapped to their encoded and decoded counterparts once, so that encoding or
+    decoding a message is a single table lookup per pair of letters. A pair of the same letters is encoded as the letter
+    followed by the swap letter.
+
+    :param key_square: 25 different letters of the key square (e.g. generated by "playfair_cipher_generate_key_square" function).
+    :param swap_letter: A character, that replaces the second letter of a pair of the same letters.
+    """
+
+    def __init__(self, key_square: str, swap_letter: str = "X"):
+        import numpy
+        self.key_square = _as_alphabet(key_square)
+        self.swap_letter = swap_letter
+        self.encoding_table = self._digraph_table(1)
+        self.decoding_table = self._digraph_table(-1)
+        if swap_letter in self.key_square:
+            swap_index = self.key_square.index(swap_letter)
+            double_pairs = numpy.arange(25)*26
+            self.encoding_table[double_pairs] = self.encoding_table[double_pairs - numpy.arange(25) + swap_index]
+            self.encoding_table[swap_index*26] = -1
+        else:
+            self.encoding_table[numpy.arange(25)*26] = -2
+        self.encoding_table.flags.writeable = self.decoding_table.flags.writeable = False
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self.key_square)!r}, {self.swap_letter!r})"
+
+    @staticmethod
+    def _digraph_table(shift: int) -> numpy.ndarray:
+        import numpy
+        first_rows, first_columns = numpy.divmod(numpy.repeat(numpy.arange(25), 25), 5)
+        second_rows, second_columns = numpy.divmod(numpy.tile(numpy.arange(25), 25), 5)
+        same_row, same_column = first_rows == second_rows, first_columns == second_columns
+        first_columns_shifted = numpy.where(same_row, (first_columns + shift) % 5,
+                                            numpy.where(same_column, first_columns, second_columns))
+        second_columns_shifted = numpy.where(same_row, (second_columns + shift) % 5,
+                                             numpy.where(same_column, second_columns, first_columns))
+        first_rows_shifted = numpy.where(~same_row & same_column, (first_rows + shift) % 5, first_rows)
+        second_rows_shifted = numpy.where(~same_row & same_column, (second_rows + shift) % 5, second_rows)
+        return numpy.stack([first_rows_shifted*5 + first_columns_shifted,
+                            second_rows_shifted*5 + second_columns_shifted], axis=1)
+
+    def translate_pairs(self, letter_indexes: numpy.ndarray, mode: int = CIPHER_MODE) -> numpy.ndarray:
+        """ Encodes or decodes pairs of letters given as indexes in the key square.
+
+        :param letter_indexes: Even number of indexes of letters in the key square.
+        :param mode: Specifies the mode for the function. Ideally use CIPHER_MODE and DECIPHER_MODE as inputs.
+        :return: Indexes of ciphered or deciphered letters in the key square.
+        """
+        pairs = letter_indexes.reshape(-1, 2)
+        digraph_table = self.encoding_table if mode == CIPHER_MODE else self.decoding_table
+        processed_pairs = digraph_table[pairs[:, 0]*25 + pairs[:, 1]]
+        if (processed_pairs < 0).any():
+            if (processed_pairs == -1).any():
+                raise ValueError(f"Text appears to have a double letter pair, "
+                                 f"that equals to the swap_letter: {self.swap_letter}. Please change the swap_letter!")
+            raise ValueError("Playfair cipher supports only letters from the key_square!")
+        return processed_pairs.ravel()
+
+
+@KEY_SCHEDULE_CACHE.cached
+def _compile_playfair_key_square(key_square: str, swap_letter: str) -> PlayfairKeySquare:
+    return PlayfairKeySquare(key_square, swap_letter)
+
+
+def _prepare_playfair_encoding(key_square: str, character_to_replace: str, character_to_replace_with: str,
+                               swap_letter: str) -> Tuple[PlayfairKeySquare, str, str]:
+    """ Validates parameters of Playfair cipher encoding and returns the compiled key square with characters, that are
+    replaced and replaced with.
+    """
+    key_square = key_square.replace(" ", "").upper()
+    swap_letter = swap_letter.replace(" ", "").upper()
+    character_to_replace = character_to_replace.replace(" ", "").upper()
+    character_to_replace_with = character_to_replace_with.replace(" ", "").upper()
+    if any(char not in LATIN_ALPHABET for char in key_square):
+        raise ValueError("key_square supports only letters from Latin alphabet!")
+    if len(set(key_square)) != len(key_square):
+        raise ValueError("Key square appears to have a few same letters in it. "
+                         "Use \"playfair_cipher_generate_key_square\" function")
+    if len(key_square) != 25:
+        raise ValueError(f"Key square appears to be wrong length - {len(key_square)}, should be 25!")
+    if len(swap_letter) != 1:
+        raise ValueError("Swap letter should be a single character!")
+    if len(character_to_replace) != 1 or len(character_to_replace_with) != 1 \
+            or character_to_replace not in LATIN_ALPHABET or character_to_replace_with not in LATIN_ALPHABET \
+            or character_to_replace == character_to_replace_with:
+        raise ValueError("Characters, that are replaced and replaced with should be single, "
+                         "not equal letters and be in Latin alphabet!")
+    if character_to_replace in key_square:
+        raise ValueError("Key square should not contain character, that was supposed to be replaced!")
+    return _compile_playfair_key_square(key_square, swap_letter), character_to_replace, character_to_replace_with
+
+
 def playfair_cipher_encoding(text: str, key_square: str, character_to_replace: str = "J",
                              character_to_replace_with: str = "I", swap_letter: str = "X") -> str:
     """ Playfair cipher function for encoding.\n
@@ -989,56 +2205,46 @@ def playfair_cipher_encoding(text: str, key_square: str, character_to_replace: s
     :return: Ciphered message.
     """
     text = text.replace(" ", "").upper()
-    key_square = key_square.replace(" ", "").upper()
-    swap_letter = swap_letter.replace(" ", "").upper()
-    character_to_replace = character_to_replace.replace(" ", "").upper()
-    character_to_replace_with = character_to_replace_with.replace(" ", "").upper()
-    if any(char not in LATIN_ALPHABET for char in key_square):
-        raise ValueError("key_square supports only letters from Latin alphabet!")
-    if len(set(key_square)) != len(key_square):
-        raise ValueError("Key square appears to have a few same letters in it. "
-                         "Use \"playfair_cipher_generate_key_square\" function")
-    if len(key_square) != 25:
-        raise ValueError(f"Key square appears to be wrong length - {len(key_square)}, should be 25!")
-    if len(swap_letter) != 1:
-        raise ValueError("Swap letter should be a single character!")
-    if len(character_to_replace) != 1 or len(character_to_replace_with) != 1 \
-            or character_to_replace not in LATIN_ALPHABET or character_to_replace_with not in LATIN_ALPHABET \
-            or character_to_replace == character_to_replace_with:
-        raise ValueError("Characters, that are replaced and replaced with should be single, "
-                         "not equal letters and be in Latin alphabet!")
-    if character_to_replace in key_square:
-        raise ValueError("Key square should not contain character, that was supposed to be replaced!")
+    compiled_key_square, character_to_replace, character_to_replace_with = _prepare_playfair_encoding(
+        key_square, character_to_replace, character_to_replace_with, swap_letter)
+    swap_letter = compiled_key_square.swap_letter
     if len(text) % 2 != 0:
         text += swap_letter
     text = text.replace(character_to_replace, character_to_replace_with)
-    if any(char not in key_square for char in text):
+    letter_indexes = compiled_key_square.key_square.text_to_indexes(text)
+    if (letter_indexes < 0).any():
         raise ValueError("Playfair cipher supports only letters from the key_square!")
-    sliced_text = [text[i:i + 2] for i in range(0, len(text), 2)]
-    sliced_key_square = [key_square[i:i + 5] for i in range(0, len(key_square), 5)]
-
-    def get_row_and_column(letter):
-        for slice_number, slice_value in enumerate(sliced_key_square):
-            if letter in slice_value:
-                return {"row": slice_number, "column": slice_value.index(letter)}
-    processed_text = ""
-    for pair in sliced_text:
-        if pair[0] == pair[1]:
-            if pair[0] == swap_letter:
-                raise ValueError(f"Text appears to have a double letter pair, "
-                                 f"that equals to the swap_letter: {swap_letter}. Please change the swap_letter!")
-            pair = pair[0] + swap_letter
-        first_letter, second_letter = get_row_and_column(pair[0]), get_row_and_column(pair[1])
-        if first_letter["row"] == second_letter["row"]:
-            processed_text += sliced_key_square[first_letter["row"]][(first_letter["column"] + 1) % 5] + \
-                              sliced_key_square[second_letter["row"]][(second_letter["column"] + 1) % 5]
-        elif first_letter["column"] == second_letter["column"]:
-            processed_text += sliced_key_square[(first_letter["row"] + 1) % 5][first_letter["column"]] + \
-                              sliced_key_square[(second_letter["row"] + 1) % 5][second_letter["column"]]
-        else:
-            processed_text += sliced_key_square[first_letter["row"]][second_letter["column"]] + \
-                              sliced_key_square[second_letter["row"]][first_letter["column"]]
-    return processed_text
+    processed_indexes = compiled_key_square.translate_pairs(letter_indexes, CIPHER_MODE)
+    return compiled_key_square.key_square.indexes_to_text(processed_indexes)
+
+
+def playfair_cipher_encoding_batch(texts: Iterable[str], key_square: str, character_to_replace: str = "J",
+                                   character_to_replace_with: str = "I", swap_letter: str = "X") -> List[str]:
+    """ Playfair cipher function for encoding many messages.\n
+    Works the same way as "playfair_cipher_encoding" function called for every message, but the key square is validated
+    and compiled once and pairs of letters of all messages are encoded at once. Messages are still uppercased and padded
+    one by one, as uppercasing can change their length. For 100-character messages it is about 8 times faster than
+    single calls.
+
+    :param texts: Messages to be encoded (list or any other iterable). Can contain only letters from Latin alphabet.
+    :param key_square: Key used to encode messages (generated by "playfair_cipher_generate_key_square" function or any shuffled Latin alphabet with one character removed).
+    :param character_to_replace: A character (letter), that is supposed to be replaced with another character when encoding.
+    :param character_to_replace_with: A character (letter), that is supposed to replace all instances of the "character_to_replace".
+    :param swap_letter: A character, that serves two purposes. First is to extend messages to be even length if needed. Second, if a pair of the same letters is found, the second letter in that pair becomes "swap_letter".
+    :return: List of ciphered messages in the order of input messages.
+    """
+    compiled_key_square, character_to_replace, character_to_replace_with = _prepare_playfair_encoding(
+        key_square, character_to_replace, character_to_replace_with, swap_letter)
+    swap_letter = compiled_key_square.swap_letter
+    texts = [text.replace(" ", "").upper() for text in texts]
+    texts = [text + swap_letter if len(text) % 2 != 0 else text for text in texts]
+    text, lengths = "".join(texts), list(map(len, texts))
+    letter_indexes = compiled_key_square.key_square.text_to_indexes(text.replace(character_to_replace,
+                                                                                 character_to_replace_with))
+    if (letter_indexes < 0).any():
+        raise ValueError("Playfair cipher supports only letters from the key_square!")
+    processed_indexes = compiled_key_square.translate_pairs(letter_indexes, CIPHER_MODE)
+    return _split_batch(compiled_key_square.key_square.indexes_to_text(processed_indexes), lengths)
 
 
 def playfair_cipher_decoding(text: str, key_square: str, character_that_was_replaced: str = "J",
@@ -1054,6 +2260,7 @@ def playfair_cipher_decoding(text: str, key_square: str, character_that_was_repl
     :param swap_letter: A character, that served two purposes. First - extended the message to be even length if it was needed. Second, if a pair of the same letters was found, the second letter in that pair became "swap_letter".
     :return: Deciphered message.
     """
+    import numpy
     text = text.replace(" ", "").upper()
     key_square = key_square.replace(" ", "").upper()
     swap_letter = swap_letter.replace(" ", "").upper()
@@ -1078,46 +2285,146 @@ def playfair_cipher_decoding(text: str, key_square: str, character_that_was_repl
         raise ValueError("Key square should not contain character, that was supposed to be replaced!")
     if len(text) % 2 != 0:
         raise ValueError("Length of the encoded text should be even!")
-    if any(char not in key_square for char in text):
+    compiled_key_square = _compile_playfair_key_square(key_square, swap_letter)
+    letter_indexes = compiled_key_square.key_square.text_to_indexes(text)
+    if (letter_indexes < 0).any():
         raise ValueError("Text should only have letters from the key_square!")
-    sliced_text = [text[i:i + 2] for i in range(0, len(text), 2)]
-    sliced_key_square = [key_square[i:i + 5] for i in range(0, len(key_square), 5)]
-
-    def get_row_and_column(letter):
-        for slice_number, slice_value in enumerate(sliced_key_square):
-            if letter in slice_value:
-                return {"row": slice_number, "column": slice_value.index(letter)}
-    processed_text = ""
-    for pair in sliced_text:
-        first_letter = get_row_and_column(pair[0])
-        second_letter = get_row_and_column(pair[1])
-        if first_letter["row"] == second_letter["row"]:
-            processed_text += sliced_key_square[first_letter["row"]][(first_letter["column"] - 1) % 5] + \
-                              sliced_key_square[second_letter["row"]][(second_letter["column"] - 1) % 5]
-        elif first_letter["column"] == second_letter["column"]:
-            processed_text += sliced_key_square[(first_letter["row"] - 1) % 5][first_letter["column"]] + \
-                              sliced_key_square[(second_letter["row"] - 1) % 5][second_letter["column"]]
-        else:
-            processed_text += sliced_key_square[first_letter["row"]][second_letter["column"]] + \
-                              sliced_key_square[second_letter["row"]][first_letter["column"]]
-    sliced_processed_text = [processed_text[i:i + 2] for i in range(0, len(processed_text), 2)]
-    processed_text = ""
-    for pair in sliced_processed_text[:-1]:
-        if pair[1] == swap_letter:
-            pair = pair[0] + f"({swap_letter}/{pair[0]})"
-        processed_text += pair
-    processed_text += sliced_processed_text[-1]
+    if not text:
+        return text
+    processed_indexes = compiled_key_square.translate_pairs(letter_indexes, DECIPHER_MODE)
+    processed_text = compiled_key_square.key_square.indexes_to_text(processed_indexes)
+    key_square = compiled_key_square.key_square
+    swap_index = key_square.index(swap_letter) if swap_letter in key_square else -1
+    swap_positions = numpy.flatnonzero(processed_indexes[1:-2:2] == swap_index)*2 + 1
+    processed_text_parts, part_start = [], 0
+    for swap_position in swap_positions.tolist():
+        processed_text_parts += [processed_text[part_start:swap_position],
+                                 f"({swap_letter}/{processed_text[swap_position - 1]})"]
+        part_start = swap_position + 1
+    processed_text = "".join(processed_text_parts) + processed_text[part_start:]
     if processed_text[-1] == swap_letter:
         processed_text = processed_text[:-1] + f"({swap_letter}/{processed_text[-2]}/_)"
     return processed_text.replace(character_that_was_replaced_with,
                                   f"({character_that_was_replaced_with}/{character_that_was_replaced})")
 
 
+_MORSE_CODE = {"A": ".-", "B": "-...", "C": "-.-.", "D": "-..", "E": ".", "F": "..-.", "G": "--.", "H": "....",
+               "I": "..", "J": ".---", "K": "-.-", "L": ".-..", "M": "--", "N": "-.", "O": "---", "P": ".--.",
+               "Q": "--.-", "R": ".-.", "S": "...", "T": "-", "U": "..-", "V": "...-", "W": ".--", "X": "-..-",
+               "Y": "-.--", "Z": "--..", ".": ".-.-.-", ",": "--..--", ":": "---...", '"': ".-..-.", "'": ".----.",
+               "!": "-.-.--", "?": "..--..", "@": ".--.-.", "-": "-....-", ";": "-.-.-.", "(": "-.--.", ")": "-.--.-",
+               "=": "-...-", "1": ".----", "2": "..---", "3": "...--", "4": "....-", "5": ".....", "6": "-....",
+               "7": "--...", "8": "---..", "9": "----.", "0": "-----"}
+_MORSE_CODE_DECODING = {code: character for character, code in _MORSE_CODE.items()}
+
+
+@KEY_SCHEDULE_CACHE.cached
+def _morse_code_translation_table(gap_fill: str) -> Dict[int, str]:
+    """ Builds a translation table, that replaces characters with their Morse code followed by the gap fill. """
+    return str.maketrans({**{character: code + gap_fill for character, code in _MORSE_CODE.items()}, " ": gap_fill})
+
+
+class MorseCodeEncoder(CipherStream):
+    """ Incremental Morse code encoder (works the same way as "morse_code" function in encoding mode).\n
+    The gap after the last encoded character is held back until the next chunk arrives, as there is no gap at the end
+    of the encoded text.
+
+    :param gap_fill: Character used as a separator between encoded characters.
+    """
+
+    def __init__(self, gap_fill: str = " "):
+        if gap_fill in _MORSE_CODE:
+            raise ValueError("Gap fill character should not be a character present in international characters!")
+        if gap_fill == "":
+            raise ValueError("Gap fill should be at least one character long "
+                             "(ideally a space or a character not used in the text)!")
+        self.gap_fill = gap_fill
+        self._table = _morse_code_translation_table(gap_fill)
+        self._pending_gap = ""
+
+    def update(self, chunk: str) -> str:
+        text = chunk.upper()
+        if not set(text) <= _MORSE_CODE.keys() | {" "}:
+            raise ValueError("Characters in provided text are not in the international character set!")
+        if not text:
+            return text
+        processed_text = self._pending_gap + text.translate(self._table)[:-len(self.gap_fill)]
+        self._pending_gap = self.gap_fill
+        return processed_text
+
+    def finalize(self) -> str:
+        self._pending_gap = ""
+        return ""
+
+
+class MorseCodeDecoder(CipherStream):
+    """ Incremental Morse code decoder.\n
+    Can be fed with consecutive chunks of encoded text (e.g. received from a stream) and returns decoded characters as
+    soon as the gap after them is seen. A single gap fill separates encoded characters, a double one separates words.
+    A part of a multi-character gap fill at the end of a chunk is held until the next chunk completes it. Gaps at the
+    end of the text are ignored (Fractionated morse code pads messages with them).
+    Feeding the whole text and finalizing gives the same result as "morse_code" function in decoding mode.
+
+    :param gap_fill: Character used as a separator between encoded characters.
+    """
+
+    def __init__(self, gap_fill: str = " "):
+        if gap_fill == "":
+            raise ValueError("Gap fill should be at least one character long "
+                             "(ideally a space or a character not used in the text)!")
+        self.gap_fill = gap_fill
+        self._pending_code = ""
+        self._gaps = 0
+        self._started = False
+
+    def _decode_code(self, code: str) -> str:
+        try:
+            return _MORSE_CODE_DECODING[code]
+        except KeyError:
+            raise ValueError(f'Encoded text appears to have a sequence, that is not in the Morse code: "{code}"!') \
+                from None
+
+    def update(self, chunk: str) -> str:
+        """ Feeds the decoder with the next chunk of encoded text.
+
+        :param chunk: Next part of the encoded text.
+        :return: Characters decoded so far, that were not returned yet.
+        """
+        codes = (self._pending_code + chunk).split(self.gap_fill)
+        self._pending_code = codes.pop()
+        processed_text = []
+        for code in codes:
+            if code:
+                if self._gaps == 2:
+                    processed_text.append(" ")
+                processed_text.append(self._decode_code(code))
+                self._gaps, self._started = 1, True
+            else:
+                self._gaps += 1
+                if not self._started or self._gaps > 2:
+                    raise ValueError("Encoded text appears to have a gap at the beginning or more than two gaps in a "
+                                     "row!")
+        if self._pending_code and self._gaps == 2 and not self.gap_fill.startswith(self._pending_code):
+            processed_text.append(" ")
+            self._gaps = 0
+        return "".join(processed_text)
+
+    def finalize(self) -> str:
+        """ Decodes the last encoded character (not followed by a gap) and resets the decoder. Gaps at the end of the
+        text are ignored.
+
+        :return: The last decoded character (or an empty string).
+        """
+        processed_text = self._decode_code(self._pending_code) if self._pending_code else ""
+        self._pending_code, self._gaps, self._started = "", 0, False
+        return processed_text
+
+
 def morse_code(text: str, gap_fill: str = " ", mode: int = CIPHER_MODE) -> str:
     """ Morse code function.\n
     When encoding, replaces letters with predefined "dot and dash" equivalents with specified gap_fill in between
     encoded letters and twice the gap_fill in between words.\n
-    When decoding, the process is done in reverse.\n
+    When decoding, the process is done in reverse. Gaps at the end of the encoded text are ignored.\n
     Can be used both for encoding and decoding messages.\n
     See reference [18] from README file for more information about the code.
 
@@ -1126,39 +2433,21 @@ def morse_code(text: str, gap_fill: str = " ", mode: int = CIPHER_MODE) -> str:
     :param mode: Specifies the mode for the function. Ideally use CIPHER_MODE and DECIPHER_MODE as inputs.
     :return: Ciphered or deciphered message.
     """
-    international_characters = ["A", "B", "C", "D", "E", "F", "G", "H", "I", "J", "K", "L", "M", "N", "O", "P", 
-                                "Q", "R", "S", "T", "U", "V", "W", "X", "Y", "Z", ".", ",", ":", '"', "'", "!",
-                                "?", "@", "-", ";", "(", ")", "=", "1", "2", "3", "4", "5", "6", "7", "8", "9", "0"]
-    international_morse_equivalent = [".-", "-...", "-.-.", "-..", ".", "..-.", "--.", "....", "..", ".---", "-.-",
-                                      ".-..", "--", "-.", "---", ".--.", "--.-", ".-.", "...", "-", "..-", "...-",
-                                      ".--", "-..-", "-.--", "--..", ".-.-.-", "--..--", "---...", ".-..-.", ".----.",
-                                      "-.-.--", "..--..", ".--.-.", "-....-", "-.-.-.", "-.--.", "-.--.-", "-...-",
-                                      ".----", "..---", "...--", "....-", ".....", "-....", "--...", "---..", "----.",
-                                      "-----"]
-    if mode == CIPHER_MODE and any(character not in [*international_characters, " "] for character in text.upper()):
+    if mode == CIPHER_MODE and not set(text.upper()) <= _MORSE_CODE.keys() | {" "}:
         raise ValueError("Characters in provided text are not in the international character set!")
-    elif mode == DECIPHER_MODE and any(character not in ".-" + gap_fill for character in text):
+    elif mode == DECIPHER_MODE and any(character not in ".-" + gap_fill for character in set(text)):
         raise ValueError("Enciphered text appears to have characters, that should not be there after encoding!")
-    if gap_fill in international_characters:
+    if gap_fill in _MORSE_CODE:
         raise ValueError("Gap fill character should not be a character present in international characters!")
     if gap_fill == "":
         raise ValueError("Gap fill should be at least one character long "
                          "(ideally a space or a character not used in the text)!")
-    processed_text = ""
     if mode == CIPHER_MODE:
-        text = text.upper()
-        for character in text:
-            processed_text += international_morse_equivalent[international_characters.index(character)] + gap_fill \
-                if character != " " else gap_fill
-    elif mode == DECIPHER_MODE:
-        split_words = text.split(gap_fill*2)
-        split_characters = [word.split(gap_fill) for word in split_words]
-        for word in split_characters:
-            for character in word:
-                processed_text += international_characters[international_morse_equivalent.index(character)]
-            processed_text += " "
-    processed_text = processed_text[:-1]
-    return processed_text
+        return text.upper().translate(_morse_code_translation_table(gap_fill))[:-len(gap_fill)]
+    if mode == DECIPHER_MODE:
+        decoder = MorseCodeDecoder(gap_fill)
+        return decoder.update(text) + decoder.finalize()
+    return ""
 
 
 def fractionated_morse_code_generate_key_table(keyword: str, save_to_file: bool = True) -> str:
@@ -1190,7 +2479,92 @@ def fractionated_morse_code_generate_key_table(keyword: str, save_to_file: bool
     return key_table
 
 
-def fractionated_morse_code(text: str, key_table: str, gap_fill: str = " ", mode: int = CIPHER_MODE) -> str:
+_LATIN_LETTERS_AND_SPACE = frozenset(LATIN_ALPHABET + " ")
+_FRACTIONATED_MORSE_CHUNK_SIZE = 64*1024
+
+
+class FractionatedMorseKeyTable:
+    """ Compiled key table of Fractionated morse code.\n
+    Each letter of the key table is assigned its trigram of Morse code symbols (its position written in base 3, where
+    0 -> ".", 1 -> "-", 2 -> gap_fill) once, so that encoding and decoding are dictionary lookups. Messages can be
+    processed in chunks, without building the whole intermediate Morse code message.
+
+    :param key_table: A string generated by "fractionated_morse_code_generate_key_table" function or any shuffled Latin alphabet.
+    :param gap_fill: A character used as a separator between encoded characters.
+    """
+
+    def __init__(self, key_table: str, gap_fill: str = " "):
+        if len(set(key_table)) != 26 or len(set(key_table)) != len(key_table):
+            raise ValueError("Key table appears not to be generated by \"fractionated_morse_code_generate_key_table\" "
+                             "function (length is not 26 or is not unique)!")
+        if gap_fill in _MORSE_CODE:
+            raise ValueError("Gap fill character should not be a character present in international characters!")
+        if gap_fill == "":
+            raise ValueError("Gap fill should be at least one character long "
+                             "(ideally a space or a character not used in the text)!")
+        if len(gap_fill) != 1:
+            raise ValueError("Gap fill should be a single character in Fractionated morse code!")
+        self.key_table = key_table
+        self.gap_fill = gap_fill
+        symbols = ".-" + gap_fill
+        self.encoding_trigrams = {"".join(trigram): letter
+                                  for trigram, letter in zip(itertools.product(symbols, repeat=3), key_table)}
+        self._key_table_letters = frozenset(key_table)
+        self._decoding_table = str.maketrans({letter: trigram for trigram, letter in self.encoding_trigrams.items()})
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.key_table!r}, {self.gap_fill!r})"
+
+    def _encode_trigrams(self, encoded_message: str) -> str:
+        try:
+            return "".join([self.encoding_trigrams[encoded_message[index: index + 3]]
+                            for index in range(0, len(encoded_message), 3)])
+        except KeyError:
+            raise ValueError("Text appears to have spaces, that can't be encoded "
+                             "(at the beginning, at the end or more than one in a row)!") from None
+
+    def encode(self, chunks: Iterable[str]) -> Iterator[str]:
+        """ Encodes a message given in consecutive chunks (e.g. lines of a big file).
+
+        :param chunks: Consecutive parts of the message. Can contain only letters from Latin alphabet and spaces.
+        :return: Iterator over ciphered parts of the message.
+        """
+        morse_code_table = _morse_code_translation_table(self.gap_fill)
+        pending_symbols = ""
+        for chunk in chunks:
+            chunk = chunk.upper()
+            if not set(chunk) <= _LATIN_LETTERS_AND_SPACE:
+                raise ValueError("Characters in the text should be Latin letters and spaces!")
+            encoded_message = pending_symbols + chunk.translate(morse_code_table)
+            complete_length = len(encoded_message) - len(encoded_message) % 3
+            pending_symbols = encoded_message[complete_length:]
+            yield self._encode_trigrams(encoded_message[:complete_length])
+        # The last gap is not a part of the encoded message, so it is dropped or replaced with the padding.
+        if len(pending_symbols) > 1:
+            yield self._encode_trigrams(pending_symbols.ljust(3, self.gap_fill))
+
+    def decode(self, chunks: Iterable[str]) -> Iterator[str]:
+        """ Decodes a message given in consecutive chunks (e.g. lines of a big file).
+
+        :param chunks: Consecutive parts of the ciphered message. Can contain only letters from the key table.
+        :return: Iterator over deciphered parts of the message.
+        """
+        decoder = MorseCodeDecoder(self.gap_fill)
+        for chunk in chunks:
+            chunk = chunk.upper()
+            if not set(chunk) <= self._key_table_letters:
+                raise ValueError("It appears, that the ciphered text does not come from this function encoding!")
+            yield decoder.update(chunk.translate(self._decoding_table))
+        yield decoder.finalize()
+
+
+@KEY_SCHEDULE_CACHE.cached
+def _compile_fractionated_morse_key_table(key_table: str, gap_fill: str) -> FractionatedMorseKeyTable:
+    return FractionatedMorseKeyTable(key_table, gap_fill)
+
+
+def fractionated_morse_code(text: str, key_table: Union[str, FractionatedMorseKeyTable], gap_fill: str = " ",
+                            mode: int = CIPHER_MODE) -> str:
     """ Fractionated morse code function.\n
     Firstly, the message is encoded with standard morse code (see reference [18] from README file for more information
     about the morse code). Then, each letter from key_table is encoded in base 3, and then
@@ -1202,47 +2576,20 @@ def fractionated_morse_code(text: str, key_table: str, gap_fill: str = " ", mode
     See reference [19], [23] from README file for more information about the code.
 
     :param text: Message to be encoded or decoded. Can contain only letters from Latin alphabet and when CIPHER_MODE - additionaly spaces.
-    :param key_table: A string, that is used to encode or decode a message (generated by "fractionated_morse_code_generate_key_table" function or any shuffled Latin alphabet).
+    :param key_table: A string, that is used to encode or decode a message (generated by "fractionated_morse_code_generate_key_table" function or any shuffled Latin alphabet) or a compiled FractionatedMorseKeyTable.
     :param gap_fill: Specifies what character was used as a separator between words provided in text.
     :param mode: Specifies the mode for the function. Ideally use CIPHER_MODE and DECIPHER_MODE as inputs.
     :return: Ciphered or deciphered message.
     """
-    text = text.upper()
-    if len(set(key_table)) != 26 or len(set(key_table)) != len(key_table):
-        raise ValueError("Key table appears not to be generated by \"fractionated_morse_code_generate_key_table\" "
-                         "function (length is not 26 or is not unique)!")
-
-    def base_3(number):
-        if number == 0:
-            return "0"*3
-        nums = []
-        while number:
-            number, remainder = divmod(number, 3)
-            nums.append(str(remainder))
-        return "".join(reversed(nums)).rjust(3, "0")
-    encrypted_letters = [base_3(letter_number).replace("0", ".").replace("1", "-").replace("2", gap_fill)
-                         for letter_number in range(len(key_table))]
-    processed_text = ""
+    if not isinstance(key_table, FractionatedMorseKeyTable):
+        key_table = _compile_fractionated_morse_key_table(key_table, gap_fill)
+    chunks = (text[index: index + _FRACTIONATED_MORSE_CHUNK_SIZE]
+              for index in range(0, len(text), _FRACTIONATED_MORSE_CHUNK_SIZE))
     if mode == CIPHER_MODE:
-        if any(character not in LATIN_ALPHABET + " " for character in text):
-            raise ValueError("Characters in the text should be Latin letters and spaces!")
-        encoded_message = morse_code(text, gap_fill, CIPHER_MODE)
-        if (number_of_characters := len(encoded_message) % 3) != 0:
-            encoded_message += gap_fill*(3 - number_of_characters)
-        split_morse = [encoded_message[i:i + 3] for i in range(0, len(encoded_message), 3)]
-        for split_part in split_morse:
-            processed_text += key_table[encrypted_letters.index(split_part)]
-    elif mode == DECIPHER_MODE:
-        if any(character not in LATIN_ALPHABET for character in text):
-            raise ValueError("It appears, that the ciphered text does not come from this function encoding!")
-        encoded_message = ""
-        for letter in text:
-            encoded_message += encrypted_letters[key_table.index(letter)]
-        for _ in range(2):
-            if encoded_message[-1] == gap_fill:
-                encoded_message = encoded_message[:-1]
-        processed_text = morse_code(encoded_message, gap_fill, DECIPHER_MODE)
-    return processed_text
+        return "".join(key_table.encode(chunks))
+    if mode == DECIPHER_MODE:
+        return "".join(key_table.decode(chunks))
+    return ""
 
 
 def straddle_checkerboard_cipher_generate_random_key(save_to_file: bool = True) -> str:
@@ -1260,8 +2607,115 @@ def straddle_checkerboard_cipher_generate_random_key(save_to_file: bool = True)
     return random_key
 
 
-def straddle_checkerboard_cipher_encoding(text: str, key: str, key_number: int = 0, return_numbers: bool = False,
-                                          spare_positions: Tuple[int, int] = (3, 7)) -> str:
+class StraddleCheckerboardKey:
+    """ Compiled key of Straddle checkerboard cipher.\n
+    Letters of the key are assigned their one or two digit numbers once. Numbers are kept in two tables: one indexed
+    by a single digit and one indexed by a pair of digits (a spare position followed by a column), so that each number
+    is decoded with a single lookup.
+
+    :param key: Key generated by "straddle_checkerboard_cipher_generate_random_key" function or any shuffled Latin alphabet.
+    :param spare_positions: A tuple of two integer values, that specifies, what numbers are used as prefixes modulo 10 division of the key.
+    """
+
+    def __init__(self, key: str, spare_positions: Tuple[int, int] = (3, 7)):
+        import numpy
+        key = key.upper()
+        if any(char not in LATIN_ALPHABET for char in key) or len(key) != 26 or len(set(key)) != len(key):
+            raise ValueError("Characters in key should only have letters from Latin alphabet, "
+                             "length equal to 26 and not contain duplicates!")
+        if len(spare_positions) != 2 or len(set(spare_positions)) != 2:
+            raise ValueError("Spare positions list should contain 2 different elements!")
+        if spare_positions[0] not in range(10) or spare_positions[1] not in range(10):
+            raise ValueError("Each element in spare_positions list should have a value between 1 and 9 "
+                             "including both ends!")
+        self.key = _as_alphabet(key)
+        self.spare_positions = tuple(sorted(spare_positions))
+        self.letter_digits = numpy.zeros((26, 2), dtype=numpy.uint8)
+        self.letter_lengths = numpy.ones(26, dtype=numpy.uint8)
+        self.single_digit_table = numpy.full(10, -1, dtype=numpy.int8)
+        self.double_digit_table = numpy.full((10, 10), -1, dtype=numpy.int8)
+        letter_number = 0
+        for letter_index in range(26):
+            letter_number = letter_number + 1 if letter_number in self.spare_positions else letter_number
+            row, column = divmod(letter_number, 10)
+            if row:
+                self.letter_digits[letter_index] = self.spare_positions[row - 1], column
+                self.letter_lengths[letter_index] = 2
+                self.double_digit_table[self.spare_positions[row - 1], column] = letter_index
+            else:
+                self.letter_digits[letter_index, 0] = column
+                self.single_digit_table[column] = letter_index
+            letter_number += 1
+        for table in (self.letter_digits, self.letter_lengths, self.single_digit_table, self.double_digit_table):
+            table.flags.writeable = False
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self.key)!r}, {self.spare_positions!r})"
+
+    def letters_to_digits(self, text: str) -> numpy.ndarray:
+        """ Replaces letters with their numbers.
+
+        :param text: Text made only of uppercase Latin letters.
+        :return: Array of digits of numbers of consecutive letters.
+        """
+        import numpy
+        letter_indexes = self.key.text_to_indexes(text)
+        return self.letter_digits[letter_indexes][numpy.arange(2) < self.letter_lengths[letter_indexes, None]]
+
+    def digits_to_letters(self, digits: numpy.ndarray) -> str:
+        """ Replaces numbers with their letters. Two digit number is taken whenever it is possible.
+
+        :param digits: Array of digits.
+        :return: Text made of letters from the key.
+        :raises ValueError: When the digits can't be split into numbers of letters.
+        """
+        import numpy
+        single_letters = self.single_digit_table[digits].tolist()
+        double_letters = self.double_digit_table[digits[:-1], digits[1:]].tolist() + [-1]
+        letter_indexes = []
+        digit_index = 0
+        while digit_index < len(single_letters):
+            if (letter_index := double_letters[digit_index]) >= 0:
+                digit_index += 2
+            elif (letter_index := single_letters[digit_index]) >= 0:
+                digit_index += 1
+            else:
+                raise ValueError("Digits can't be split into numbers of letters from the key!")
+            letter_indexes.append(letter_index)
+        return self.key.indexes_to_text(numpy.array(letter_indexes, dtype=numpy.intp))
+
+
+@KEY_SCHEDULE_CACHE.cached
+def _compile_straddle_checkerboard_key(key: str, spare_positions: Tuple[int, int]) -> StraddleCheckerboardKey:
+    return StraddleCheckerboardKey(key, spare_positions)
+
+
+def _as_straddle_checkerboard_key(key: Union[str, StraddleCheckerboardKey],
+                                  spare_positions: Tuple[int, int]) -> StraddleCheckerboardKey:
+    if isinstance(key, StraddleCheckerboardKey):
+        return key
+    return _compile_straddle_checkerboard_key(key, tuple(spare_positions))
+
+
+def _check_key_number(key_number: int) -> None:
+    """ Rejects key numbers, that cannot be added digit by digit to the encoded message. """
+    if not isinstance(key_number, int) or isinstance(key_number, bool):
+        raise ValueError("Key number should be an integer!")
+    if key_number < 0:
+        raise ValueError("Key number should not be negative!")
+
+
+def _add_key_number(digits: numpy.ndarray, key_number: int, sign: int = 1) -> numpy.ndarray:
+    """ Non-carrying addition (or subtraction) of the key number repeated along the digits. """
+    import numpy
+    key_digits = numpy.frombuffer(str(key_number).encode("ascii"), dtype=numpy.uint8) - ord("0")
+    repeated_key_digits = numpy.resize(key_digits if sign > 0 else 10 - key_digits, len(digits))
+    return (digits + repeated_key_digits) % 10
+
+
+def straddle_checkerboard_cipher_encoding(text: str, key: Union[str, StraddleCheckerboardKey], key_number: int = 0,
+                                          return_numbers: bool = False, spare_positions: Tuple[int, int] = (3, 7),
+                                          return_bytes: bool = False) -> Union[str, bytes]:
     """ Straddle checkerboard cipher function for encoding.\n
     The key provided is translated to a dictionary of letters from key as keys and numbers as values. Numbers are
     constructed as follows: We create a table with numbers from 0 to 9 as a top row and empty string, first number from
@@ -1276,109 +2730,181 @@ def straddle_checkerboard_cipher_encoding(text: str, key: str, key_number: int =
     See reference [20] from README file for more information about the cipher.
 
     :param text: Message to be encoded. Can contain only letters from Latin alphabet.
-    :param key: Key generated by "straddle_checkerboard_cipher_generate_random_key" function or any shuffled Latin alphabet.
+    :param key: Key generated by "straddle_checkerboard_cipher_generate_random_key" function or any shuffled Latin alphabet, or a compiled StraddleCheckerboardKey (its spare positions are used then).
     :param key_number: An integer, that specifies, what number should be added with non-carrying addition to partially encoded message (ideally more than one digit number).
     :param return_numbers: Optional argument, that specifies, whether to return numerical encoded value or proceed to return a text.
     :param spare_positions: A tuple of two integer values, that specifies, what numbers are used as prefixes modulo 10 division of the key.
+    :param return_bytes: Optional argument, that specifies, whether numerical encoded value should be returned as bytes (ASCII digits) instead of a string.
     :return: Ciphered message.
     """
     text = text.upper().replace(" ", "")
-    key = key.upper()
-    if any(char not in LATIN_ALPHABET for char in text):
+    if not set(text) <= set(LATIN_ALPHABET):
         raise ValueError("Characters in text should only have letters from Latin alphabet!")
-    if any(char not in LATIN_ALPHABET for char in key) or len(key) != 26 or len(set(key)) != len(key):
-        raise ValueError("Characters in key should only have letters from Latin alphabet, "
-                         "length equal to 26 and not contain duplicates!")
-    if key_number is not None and key_number < 0:
-        raise ValueError("Key number should not be negative!")
-    if len(spare_positions) != 2 or len(set(spare_positions)) != 2:
-        raise ValueError("Spare positions list should contain 2 different elements!")
-    if spare_positions[0] not in range(10) or spare_positions[1] not in range(10):
-        raise ValueError("Each element in spare_positions list should have a value between 1 and 9 "
-                         "including both ends!")
-    spare_positions = sorted(spare_positions)
-    letter_number = 0
-    key_dict = {}
-    for letter in key:
-        letter_number = letter_number + 1 if letter_number in spare_positions else letter_number
-        number_string_to_input = "" if not letter_number//10 else str(spare_positions[letter_number//10 - 1])
-        number_string_to_input += str(letter_number % 10)
-        key_dict[letter] = number_string_to_input
-        letter_number += 1
-    processed_numbers = "".join([key_dict[letter] for letter in text])
-    added_numbers = ""
-    for number_number, number in enumerate(processed_numbers):
-        added_numbers += str((int(number) + int(str(key_number)[number_number % len(str(key_number))])) % 10)
+    _check_key_number(key_number)
+    key = _as_straddle_checkerboard_key(key, spare_positions)
+    added_digits = _add_key_number(key.letters_to_digits(text), key_number)
     if return_numbers:
-        return added_numbers
-    processed_text = ""
-    enumerated_numbers = enumerate(added_numbers)
-    for number_number, number in enumerated_numbers:
-        if number_number == len(added_numbers) - 1:
-            processed_text += list(key_dict.keys())[list(key_dict.values()).index(number)]
-        elif (joined_number := added_numbers[number_number] + added_numbers[number_number + 1]) \
-                in list(key_dict.values()):
-            processed_text += list(key_dict.keys())[list(key_dict.values()).index(joined_number)]
-            next(enumerated_numbers)
-        else:
-            try:
-                processed_text += list(key_dict.keys())[list(key_dict.values()).index(number)]
-            except ValueError:
-                raise ValueError("Unfortunately this set of parameters cannot be used with this text, "
-                                 "because of the problem in non-carrying adding. Choose another number!")
-    return processed_text
+        encoded_digits = (added_digits + ord("0")).tobytes()
+        return encoded_digits if return_bytes else encoded_digits.decode("ascii")
+    try:
+        return key.digits_to_letters(added_digits)
+    except ValueError:
+        raise ValueError("Unfortunately this set of parameters cannot be used with this text, "
+                         "because of the problem in non-carrying adding. Choose another number!") from None
 
 
-def straddle_checkerboard_cipher_decoding(text: str, key: str, key_number: int = 0,
-                                          spare_positions: Tuple[int, int] = (3, 7)) -> str:
+def straddle_checkerboard_cipher_decoding(text: Union[str, bytes], key: Union[str, StraddleCheckerboardKey],
+                                          key_number: int = 0, spare_positions: Tuple[int, int] = (3, 7)) -> str:
     """ Straddle checkerboard cipher function for decoding.\n
     Decoding reverses the procedures from encoding function.\n
     See reference [20] from README file for more information about the cipher.
 
-    :param text: Message to be decoded. Can contain only letters from Latin alphabet if the output of encoding was letters and only digits if the output of encoding was digits.
-    :param key: Key used to encode the message (generated by "straddle_checkerboard_cipher_generate_random_key" function).
+    :param text: Message to be decoded. Can contain only letters from Latin alphabet if the output of encoding was letters and only digits (as a string or bytes) if the output of encoding was digits.
+    :param key: Key used to encode the message (generated by "straddle_checkerboard_cipher_generate_random_key" function), or a compiled StraddleCheckerboardKey (its spare positions are used then).
     :param key_number: An integer, that specifies, what number was added with non-carrying addition to partially encoded message.
     :param spare_positions: A tuple of two integer values, that specifies, what numbers were used as prefixes modulo 10 division of the key.
     :return: Deciphered message.
     """
+    import numpy
+    if isinstance(text, (bytes, bytearray, memoryview)):
+        text = bytes(text).decode("latin-1")
     text = text.upper().replace(" ", "")
-    key = key.upper()
-    if text[0].isdigit() and any(character not in DIGITS for character in text) or not text[0].isdigit() \
-            and any(character not in LATIN_ALPHABET for character in text):
+    text_characters = set(text)
+    if not (text_characters <= set(DIGITS) or text_characters <= set(LATIN_ALPHABET)):
         raise ValueError("All characters in input text should be one type "
                          "(either digits or letters from Latin alphabet)")
-    if any(char not in LATIN_ALPHABET for char in key) or len(key) != 26 or len(set(key)) != len(key):
-        raise ValueError("Characters in key should only have letters from Latin alphabet, "
-                         "length equal to 26 and not contain duplicates!")
-    if key_number < 0:
-        raise ValueError("Key number should not be negative!")
-    if len(spare_positions) != 2 or len(set(spare_positions)) != 2:
-        raise ValueError("Spare positions list should contain 2 different elements!")
-    if not (0 <= spare_positions[0] < 10) or not (0 <= spare_positions[1] < 10):
-        raise ValueError("Each element in spare_positions list should have a value between 1 and 9 "
-                         "including both ends!")
-    spare_positions = sorted(spare_positions)
-    letter_number = 0
-    key_dict = {}
-    for letter in key:
-        letter_number = letter_number + 1 if letter_number in spare_positions else letter_number
-        number_string_to_input = "" if not letter_number//10 else str(spare_positions[letter_number//10 - 1])
-        number_string_to_input += str(letter_number % 10)
-        key_dict[letter] = number_string_to_input
-        letter_number += 1
-    text = "".join([key_dict[letter] for letter in text]) if not text[0].isdigit() else text
-    added_numbers = ""
-    for number_number, number in enumerate(text):
-        added_numbers += str((int(number) - int(str(key_number)[number_number % len(str(key_number))]) + 10) % 10)
-    processed_text = ""
-    enumerated_numbers = enumerate(added_numbers)
-    for number_number, number in enumerated_numbers:
-        if number_number == len(added_numbers) - 1:
-            processed_text += list(key_dict.keys())[list(key_dict.values()).index(number)]
-        elif (joined_number := added_numbers[number_number] + added_numbers[number_number + 1]) \
-                in list(key_dict.values()):
-            processed_text += list(key_dict.keys())[list(key_dict.values()).index(joined_number)]
-            next(enumerated_numbers)
-        else:
-            processed_text += list(key_dict.keys())[list(key_dict.values()).index(number)]
-    return processed_text
+    _check_key_number(key_number)
+    key = _as_straddle_checkerboard_key(key, spare_positions)
+    if text[:1].isdigit():
+        digits = numpy.frombuffer(text.encode("ascii"), dtype=numpy.uint8) - ord("0")
+    else:
+        digits = key.letters_to_digits(text)
+    return key.digits_to_letters(_add_key_number(digits, key_number, -1))
+
+
+def _morse_code_stream(gap_fill: str = " ", mode: int = CIPHER_MODE) -> CipherStream:
+    return MorseCodeEncoder(gap_fill) if mode == CIPHER_MODE else MorseCodeDecoder(gap_fill)
+
+
+_CIPHER_STREAMS = {caesar_cipher: CaesarCipherStream, atbash_cipher: AtbashCipherStream,
+                   vigenere_cipher: VigenereCipherStream, running_key_cipher: RunningKeyCipherStream,
+                   simple_substitution_cipher: SimpleSubstitutionCipherStream, beaufort_cipher: BeaufortCipherStream,
+                   porta_cipher: PortaCipherStream, autokey_cipher_encoding: AutokeyCipherEncoder,
+                   autokey_cipher_decoding: AutokeyCipherDecoder, bacon_cipher_encoding: BaconCipherEncoder,
+                   bacon_cipher_decoding: BaconCipherDecoder, morse_code: _morse_code_stream}
+
+
+def _open_cipher_stream(cipher, args: tuple, kwargs: dict, stack: contextlib.ExitStack) -> CipherStream:
+    """ Returns the given CipherStream object or creates one (closed together with the stack) from a CipherStream class
+    or a cipher function, that can be streamed.
+    """
+    if isinstance(cipher, CipherStream):
+        return cipher
+    if isinstance(cipher, type) and issubclass(cipher, CipherStream):
+        return stack.enter_context(cipher(*args, **kwargs))
+    if callable(cipher) and cipher in _CIPHER_STREAMS:
+        return stack.enter_context(_CIPHER_STREAMS[cipher](*args, **kwargs))
+    raise ValueError("Cipher can't process text in chunks! Please use a CipherStream or a cipher function, "
+                     "that can be streamed.")
+
+
+def transform_file(input_file_path: Union[str, os.PathLike], output_file_path: Union[str, os.PathLike], cipher,
+                   *args, chunk_size: int = 1024*1024, **kwargs) -> Union[str, os.PathLike]:
+    """ Function, that encodes or decodes UTF-8 encoded files with bounded memory.\n
+    The input file is read in chunks, that are fed to a streaming cipher, and processed text is written to the output
+    file right away, so files of any size can be processed. The cipher can be a CipherStream object (e.g.
+    VigenereCipherStream("LION", LATIN_ALPHABET)), a CipherStream class or one of the cipher functions, that can be
+    streamed (caesar_cipher, atbash_cipher, vigenere_cipher, running_key_cipher, simple_substitution_cipher,
+    beaufort_cipher, porta_cipher, autokey_cipher_encoding, autokey_cipher_decoding, bacon_cipher_encoding,
+    bacon_cipher_decoding and morse_code) followed by its arguments (without the text).
+
+    :param input_file_path: Path to the file to be encoded or decoded.
+    :param output_file_path: Path to the file, that the result should be written to.
+    :param cipher: CipherStream object, CipherStream class or a cipher function, that the file should be processed with.
+    :param args: Arguments of the CipherStream class or the cipher function (without the text).
+    :param chunk_size: Optional argument, that specifies how many characters are processed at once.
+    :param kwargs: Keyword arguments of the CipherStream class or the cipher function.
+    :return: Path to the file with ciphered or deciphered message.
+    """
+    if chunk_size < 1:
+        raise ValueError("Chunk size should be at least 1 character!")
+    with contextlib.ExitStack() as stack:
+        stream = _open_cipher_stream(cipher, args, kwargs, stack)
+        input_file = stack.enter_context(open(input_file_path, "r", encoding="utf-8", newline=""))
+        output_file = stack.enter_context(open(output_file_path, "w", encoding="utf-8", newline=""))
+        while chunk := input_file.read(chunk_size):
+            output_file.write(stream.update(chunk))
+        output_file.write(stream.finalize())
+    return output_file_path
+
+
+async def cipher_async(cipher_function, *args, executor: Optional[concurrent.futures.Executor] = None, **kwargs):
+    """ Function, that runs any cipher function in an executor, so that the asyncio event loop is not blocked while a
+    big message is processed (e.g. by "hill_cipher" or "porta_cipher").
+
+    :param cipher_function: Cipher function to be called (e.g. vigenere_cipher).
+    :param args: Arguments of the cipher function (with the text).
+    :param executor: Optional executor (e.g. concurrent.futures.ProcessPoolExecutor), that the function is run in. Default executor of the event loop is used otherwise.
+    :param kwargs: Keyword arguments of the cipher function.
+    :return: Result of the cipher function.
+    """
+    import asyncio
+    return await asyncio.get_running_loop().run_in_executor(executor,
+                                                            functools.partial(cipher_function, *args, **kwargs))
+
+
+async def _read_chunks(source, chunk_size: int):
+    if hasattr(source, "read"):
+        while data := await source.read(chunk_size):
+            yield data
+    else:
+        async for data in source:
+            yield data
+
+
+async def transform_stream(source, cipher, *args, executor: Optional[concurrent.futures.Executor] = None,
+                           chunk_size: int = 64*1024, executor_threshold: int = 16*1024, **kwargs):
+    """ Asynchronous generator, that encodes or decodes a text received from a network connection (or any other
+    asynchronous source) and yields processed chunks of it.\n
+    The source can be an asyncio.StreamReader (read in chunks of chunk_size bytes) or any asynchronous iterator of
+    UTF-8 encoded bytes (bytearray and memoryview chunks are accepted too) or strings. Bytes are decoded incrementally,
+    so characters split between chunks are handled.
+    The cipher is given the same way as in "transform_file" function. Chunks of at least executor_threshold characters
+    are processed in the executor, so the event loop stays responsive, smaller ones directly in the event loop. The next
+    chunk is read only after the previous one was processed and its result was taken by the consumer, so a slow consumer
+    slows down reading from the source (back-pressure) and memory usage stays bounded.
+
+    :param source: asyncio.StreamReader or an asynchronous iterator of bytes (or other bytes-like objects) or strings.
+    :param cipher: CipherStream object, CipherStream class or a cipher function, that the text should be processed with.
+    :param args: Arguments of the CipherStream class or the cipher function (without the text).
+    :param executor: Optional thread pool executor, that big chunks are processed in. Default executor of the event loop is used otherwise.
+    :param chunk_size: Optional argument, that specifies the maximum number of bytes read from a StreamReader and characters processed at once.
+    :param executor_threshold: Optional minimum number of characters of a chunk, that is processed in the executor (0 sends every chunk to the executor).
+    :param kwargs: Keyword arguments of the CipherStream class or the cipher function.
+    :return: Asynchronous generator of processed chunks of the text.
+    """
+    import asyncio
+    import concurrent.futures
+    if chunk_size < 1:
+        raise ValueError("Chunk size should be at least 1 character!")
+    if isinstance(executor, concurrent.futures.ProcessPoolExecutor):
+        raise ValueError("Streams keep their state between chunks, so they can't be processed in a process pool! "
+                         "Please use a thread pool executor.")
+    loop = asyncio.get_running_loop()
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    with contextlib.ExitStack() as stack:
+        stream = _open_cipher_stream(cipher, args, kwargs, stack)
+        async for data in _read_chunks(source, chunk_size):
+            text = decoder.decode(data) if isinstance(data, (bytes, bytearray, memoryview)) else data
+            for chunk_start in range(0, len(text), chunk_size):
+                chunk = text[chunk_start:chunk_start + chunk_size]
+                if len(chunk) >= executor_threshold:
+                    processed_chunk = await loop.run_in_executor(executor, stream.update, chunk)
+                else:
+                    processed_chunk = stream.update(chunk)
+                if processed_chunk:
+                    yield processed_chunk
+        text = decoder.decode(b"", final=True)
+        processed_chunk = (stream.update(text) if text else "") + stream.finalize()
+        if processed_chunk:
+            yield processed_chunk
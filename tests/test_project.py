@@ -1,5 +1,11 @@
+import asyncio
+import concurrent.futures
+import contextlib
+import json
+import numpy
 import pytest
 import os
+import subprocess
 import sys
 
 sys.path.append("../ciphers")
@@ -8,6 +14,41 @@ from ciphers.ciphers import *
 TEXT_TO_CIPHER_LATIN = "THE QUICK BROWN FOX JUMPS OVER THE LAZY DOG 5"
 TEXT_TO_CIPHER_LATIN_2 = "DEFEND THE EAST WALL OF THE CASTLE"
 TEXT_TO_CIPHER_POLISH = "MĘŻNY BĄDŹ, CHROŃ PUŁK TWÓJ I SZEŚĆ FLAG 1"
+CJK_ALPHABET = Alphabet("".join(chr(0x4E00 + index) for index in range(5000)))
+EMOJI_ALPHABET = Alphabet("".join(chr(0x1F600 + index) for index in range(50)) + "AB")
+
+
+@pytest.mark.parametrize("alphabet",
+                         [LATIN_ALPHABET, POLISH_ALPHABET, RUSSIAN_ALPHABET, GREEK_ALPHABET, HEBREW_ALPHABET, CJK_ALPHABET])
+def test_alphabet_index(alphabet):
+    assert isinstance(alphabet, Alphabet)
+    assert [alphabet.index(character) for character in alphabet] == list(range(len(alphabet)))
+    assert alphabet.index(alphabet[1:3]) == 1
+    with pytest.raises(ValueError):
+        alphabet.index("1")
+
+
+@pytest.mark.parametrize("text_to_input, alphabet",
+                         [(TEXT_TO_CIPHER_LATIN, LATIN_ALPHABET),
+                          (TEXT_TO_CIPHER_POLISH, POLISH_ALPHABET),
+                          (TEXT_TO_CIPHER_POLISH, LATIN_ALPHABET),
+                          ("一丁 丂七, 丄丅 " + CJK_ALPHABET[-3:] + " 9", CJK_ALPHABET),
+                          ("😀 A😁B, C" + EMOJI_ALPHABET[-5:], EMOJI_ALPHABET),
+                          ("", LATIN_ALPHABET)])
+def test_alphabet_text_to_indexes(text_to_input, alphabet):
+    indexes = alphabet.text_to_indexes(text_to_input)
+    assert indexes.tolist() == [alphabet.index(character) if character in alphabet else -1 for character in text_to_input]
+    assert alphabet.indexes_to_text(indexes[indexes >= 0]) == "".join(character for character in text_to_input
+                                                                      if character in alphabet)
+
+
+def test_alphabet_as_plain_string():
+    plain_alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    assert LATIN_ALPHABET == plain_alphabet and hash(LATIN_ALPHABET) == hash(plain_alphabet)
+    assert vigenere_cipher(TEXT_TO_CIPHER_LATIN, "LION", plain_alphabet) == \
+        vigenere_cipher(TEXT_TO_CIPHER_LATIN, "LION", LATIN_ALPHABET)
+    assert caesar_cipher(TEXT_TO_CIPHER_LATIN, 3, Alphabet(plain_alphabet), True) == \
+        caesar_cipher(TEXT_TO_CIPHER_LATIN, 3, plain_alphabet, True)
 
 
 @pytest.mark.parametrize("text_to_input, shift, alphabet, include_digits, expected",
@@ -20,11 +61,35 @@ TEXT_TO_CIPHER_POLISH = "MĘŻNY BĄDŹ, CHROŃ PUŁK TWÓJ I SZEŚĆ FLAG 1"
                           (TEXT_TO_CIPHER_POLISH, -3, POLISH_ALPHABET, True, "KĆYLV ŻŹBX, AĘÓMŁ ŃSJH RTNG F PWCQĄ DIZE 8"),
                           (TEXT_TO_CIPHER_POLISH[:-2], 5, POLISH_ALPHABET, True, "PJĆQĄ ĘEHC, FŁVSR TZÓŃ YŻŚN M WBIXG KODL"),
                           ("KĆYLV ŻŹBX, AĘÓMŁ ŃSJH RTNG F PWCQĄ DIZE 8", 3, POLISH_ALPHABET, True, TEXT_TO_CIPHER_POLISH),
-                          ("PJĆQĄ ĘEHC, FŁVSR TZÓŃ YŻŚN M WBIXG KODL", -5, POLISH_ALPHABET, True, TEXT_TO_CIPHER_POLISH[:-2])])
+                          ("PJĆQĄ ĘEHC, FŁVSR TZÓŃ YŻŚN M WBIXG KODL", -5, POLISH_ALPHABET, True, TEXT_TO_CIPHER_POLISH[:-2]),
+                          (TEXT_TO_CIPHER_LATIN, 29, LATIN_ALPHABET, False, "WKH TXLFN EURZQ IRA MXPSV RYHU WKH ODCB GRJ 5"),
+                          (TEXT_TO_CIPHER_LATIN, -55, LATIN_ALPHABET, True, "QEB NRFZH YOLTK CLU GRJMP LSBO QEB IXWV ALD 0")])
 def test_caesar_cipher(text_to_input, shift, alphabet, include_digits, expected):
     assert caesar_cipher(text_to_input, shift, alphabet, include_digits) == expected
 
 
+@pytest.mark.parametrize("shift, include_digits", [(3, False), (-3, True), (29, True)])
+def test_caesar_cipher_bytes(shift, include_digits):
+    assert caesar_cipher_bytes(TEXT_TO_CIPHER_LATIN.lower().encode("ascii"), shift, LATIN_ALPHABET, include_digits) == \
+        caesar_cipher(TEXT_TO_CIPHER_LATIN, shift, LATIN_ALPHABET, include_digits).encode("ascii")
+
+
+def test_caesar_cipher_bytes_edge_case():
+    with pytest.raises(ValueError) as exception_info:
+        caesar_cipher_bytes(b"ABC", 3, POLISH_ALPHABET)
+    assert str(exception_info.value) == "Alphabet should only have ASCII letters to process bytes!"
+
+
+@pytest.mark.parametrize("texts_to_input, shift, alphabet, include_digits",
+                         [([TEXT_TO_CIPHER_LATIN, "", "straße", TEXT_TO_CIPHER_LATIN_2.lower()], 3, LATIN_ALPHABET, True),
+                          (iter([TEXT_TO_CIPHER_POLISH, "ż"]), -5, POLISH_ALPHABET, False),
+                          ([], 1, LATIN_ALPHABET, False)])
+def test_caesar_cipher_batch(texts_to_input, shift, alphabet, include_digits):
+    texts_to_input = list(texts_to_input)
+    assert caesar_cipher_batch(iter(texts_to_input), shift, alphabet, include_digits) == \
+        [caesar_cipher(text, shift, alphabet, include_digits) for text in texts_to_input]
+
+
 @pytest.mark.parametrize("text_to_input, keyword, alphabet, mode, keyword_shift, expected",
                          [(TEXT_TO_CIPHER_LATIN, "LION", LATIN_ALPHABET, CIPHER_MODE, 0, "EPS DFQQX MZCJY NCK UCACD WJRC BVR WINL OWU 5"),
                           (TEXT_TO_CIPHER_LATIN, "LION", LATIN_ALPHABET, CIPHER_MODE, 2, "GRU FHSSZ OBELA PEM WECEF YLTE DXT YKPN QYW 5"),
@@ -38,6 +103,50 @@ def test_vigenere_cipher(text_to_input, keyword, alphabet, mode, keyword_shift,
     assert vigenere_cipher(text_to_input, keyword, alphabet, mode, keyword_shift) == expected
 
 
+@pytest.mark.parametrize("text_to_input, keyword, alphabet, error_message",
+                         [(TEXT_TO_CIPHER_LATIN, "", LATIN_ALPHABET, "Keyword should not be empty!"),
+                          (TEXT_TO_CIPHER_LATIN, "lion", LATIN_ALPHABET, "Keyword should only have letters from the given alphabet!"),
+                          (TEXT_TO_CIPHER_POLISH, "MĘSKI", LATIN_ALPHABET, "Keyword should only have letters from the given alphabet!")])
+def test_vigenere_cipher_edge_cases(text_to_input, keyword, alphabet, error_message):
+    with pytest.raises(ValueError) as exception_info:
+        vigenere_cipher(text_to_input, keyword, alphabet)
+    assert str(exception_info.value) == error_message
+
+
+@pytest.mark.parametrize("text_to_input, keyword, alphabet, mode, workers",
+                         [(TEXT_TO_CIPHER_LATIN*50, "LION", LATIN_ALPHABET, CIPHER_MODE, 2),
+                          (TEXT_TO_CIPHER_POLISH*50, "MĘSKI", POLISH_ALPHABET, DECIPHER_MODE, 3),
+                          ("a, b", "LION", LATIN_ALPHABET, CIPHER_MODE, 8),
+                          ("Große Straße, ąę!"*20, "LION", LATIN_ALPHABET, CIPHER_MODE, 4)])
+def test_vigenere_cipher_workers(text_to_input, keyword, alphabet, mode, workers):
+    assert vigenere_cipher(text_to_input, keyword, alphabet, mode, workers=workers) == \
+        vigenere_cipher(text_to_input, keyword, alphabet, mode)
+
+
+def test_vigenere_cipher_workers_edge_case():
+    with pytest.raises(ValueError) as exception_info:
+        vigenere_cipher(TEXT_TO_CIPHER_LATIN, "LION", LATIN_ALPHABET, workers=0)
+    assert str(exception_info.value) == "Number of workers should be at least 1!"
+
+
+@pytest.mark.parametrize("texts_to_input, keyword, alphabet, mode, keyword_shift",
+                         [([TEXT_TO_CIPHER_LATIN, "", "1, 2", "a", TEXT_TO_CIPHER_LATIN_2], "LION", LATIN_ALPHABET, CIPHER_MODE, 0),
+                          ([TEXT_TO_CIPHER_POLISH, "straße", TEXT_TO_CIPHER_POLISH[::-1]], "MĘSKI", POLISH_ALPHABET, DECIPHER_MODE, 5),
+                          ([], "LION", LATIN_ALPHABET, CIPHER_MODE, 0)])
+def test_vigenere_cipher_batch(texts_to_input, keyword, alphabet, mode, keyword_shift):
+    assert vigenere_cipher_batch(iter(texts_to_input), keyword, alphabet, mode, keyword_shift) == \
+        [vigenere_cipher(text, keyword, alphabet, mode, keyword_shift) for text in texts_to_input]
+
+
+@pytest.mark.parametrize("texts_to_input, keyword, alphabet, error_message",
+                         [(["", TEXT_TO_CIPHER_LATIN], "", LATIN_ALPHABET, "Keyword should not be empty!"),
+                          ([TEXT_TO_CIPHER_POLISH], "MĘSKI", LATIN_ALPHABET, "Keyword should only have letters from the given alphabet!")])
+def test_vigenere_cipher_batch_edge_cases(texts_to_input, keyword, alphabet, error_message):
+    with pytest.raises(ValueError) as exception_info:
+        vigenere_cipher_batch(texts_to_input, keyword, alphabet)
+    assert str(exception_info.value) == error_message
+
+
 @pytest.mark.parametrize("text_to_input, alphabet, letters_to_encode_with, unique_coding, expected",
                          [(TEXT_TO_CIPHER_LATIN, LATIN_ALPHABET, ["c", "d"], True, "dccddccdddccdcc dccccdcdcccdccccccdccdcdc ccccddcccdcdddcdcddccddcd ccdcdcdddcdcddd cdccddcdcccddcccdddddccdc cdddcdcdcdccdccdcccd dccddccdddccdcc cdcddcccccddccdddccc cccddcdddcccddc 5"),
                           (TEXT_TO_CIPHER_LATIN, LATIN_ALPHABET, ["a", "b"], False, "baabaaabbbaabaa abbbbbaabbabaaaaaabaabaab aaaabbaaaaabbabbabaaabbaa aabababbabbabab abaaabaabbababbabbbabaaab abbabbaabbaabaabaaaa baabaaabbbaabaa ababaaaaaababbbbabba aaabbabbabaabba 5"),
@@ -68,6 +177,26 @@ def test_bacon_cipher_decoding_edge_case():
     assert str(exception_info.value) == "Unfortunetely the alphabet length must be at most 32 characters! You can remove the letters from the alphabet, that are not used"
 
 
+@pytest.mark.parametrize("text_to_input, letters_to_decode_with, error_message",
+                         [("AAAAA BBBBB", ["a", "b"], "Text appears to have a group of letters, that does not encode any letter of the alphabet: \"BBBBB\"!"),
+                          ("AAAAA BBB", ["a", "b"], "Text appears to end with an incomplete group of letters!")])
+def test_bacon_cipher_decoding_group_edge_cases(text_to_input, letters_to_decode_with, error_message):
+    with pytest.raises(ValueError) as exception_info:
+        bacon_cipher_decoding(text_to_input, LATIN_ALPHABET, letters_to_decode_with, False)
+    assert str(exception_info.value) == error_message
+
+
+@pytest.mark.parametrize("text_to_input, alphabet, letters_to_code_with, unique_coding, chunk_size",
+                         [(TEXT_TO_CIPHER_LATIN, LATIN_ALPHABET, ["c", "d"], True, 1),
+                          (TEXT_TO_CIPHER_LATIN, LATIN_ALPHABET, ["a", "b"], False, 7),
+                          (TEXT_TO_CIPHER_POLISH, POLISH_ALPHABET.replace("Q", "").replace("V", "").replace("X", ""), ["ń", "s"], True, 3)])
+def test_bacon_cipher_decoder(text_to_input, alphabet, letters_to_code_with, unique_coding, chunk_size):
+    encoded_text = bacon_cipher_encoding(text_to_input, alphabet, letters_to_code_with, unique_coding)
+    decoder = BaconCipherDecoder(alphabet, letters_to_code_with, unique_coding)
+    decoded_text = "".join(decoder.update(encoded_text[index: index + chunk_size]) for index in range(0, len(encoded_text), chunk_size))
+    assert decoded_text + decoder.finalize() == bacon_cipher_decoding(encoded_text, alphabet, letters_to_code_with, unique_coding)
+
+
 @pytest.mark.parametrize("text_to_input, alphabet, include_digits, expected",
                          [(TEXT_TO_CIPHER_LATIN, LATIN_ALPHABET, True, "GSV JFRXP YILDM ULC QFNKH LEVI GSV OZAB WLT 4"),
                           (TEXT_TO_CIPHER_LATIN, LATIN_ALPHABET, False, "GSV JFRXP YILDM ULC QFNKH LEVI GSV OZAB WLT 5"),
@@ -81,6 +210,12 @@ def test_atbash_cipher(text_to_input, alphabet, include_digits, expected):
     assert atbash_cipher(text_to_input, alphabet, include_digits) == expected
 
 
+@pytest.mark.parametrize("include_digits", [True, False])
+def test_atbash_cipher_bytes(include_digits):
+    assert atbash_cipher_bytes(TEXT_TO_CIPHER_LATIN.encode("ascii"), LATIN_ALPHABET, include_digits) == \
+        atbash_cipher(TEXT_TO_CIPHER_LATIN, LATIN_ALPHABET, include_digits).encode("ascii")
+
+
 def test_simple_substitution_random_key():
     for alphabet in [LATIN_ALPHABET, POLISH_ALPHABET, RUSSIAN_ALPHABET, GREEK_ALPHABET, HEBREW_ALPHABET]:
         assert len(simple_substitution_generate_random_key(alphabet, False)) == len(alphabet)
@@ -101,6 +236,44 @@ def test_simple_substitution_random_key():
                           ("OĘŻFW HĄGŹ, QEKDŃ XVŁL CTÓY A RBIŚĆ UNPM", "phqgiumeaylnofdxjkrcvstzwb".upper(), DECIPHER_MODE, TEXT_TO_CIPHER_POLISH[:-2])])
 def test_simple_substitution(text_to_input, random_key, mode, expected):
     assert simple_substitution_cipher(text_to_input, random_key, mode) == expected
+    assert simple_substitution_cipher(text_to_input, SimpleSubstitutionKey(random_key), mode) == expected
+
+
+@pytest.mark.parametrize("random_key, mode, error_message",
+                         [("ABC", CIPHER_MODE, "Random key not generated from available alphabets!"),
+                          ("phqgiumeaylnofdxjkrcvstzwb".upper(), 0, "Mode should be either CIPHER_MODE or DECIPHER_MODE!")])
+def test_simple_substitution_edge_cases(random_key, mode, error_message):
+    with pytest.raises(ValueError) as exception_info:
+        simple_substitution_cipher(TEXT_TO_CIPHER_LATIN, random_key, mode)
+    assert str(exception_info.value) == error_message
+
+
+@pytest.mark.parametrize("text_to_input, random_key, chunk_size",
+                         [(TEXT_TO_CIPHER_LATIN.lower()*100, "phqgiumeaylnofdxjkrcvstzwb".upper(), 7),
+                          (TEXT_TO_CIPHER_POLISH*100, "phqgiumeaylnofdxjkrcvstzwb".upper(), 5),
+                          ("СЪЕШЬ ЖЕ ЕЩЁ ЭТИХ мягких французских булок, да выпей чаю"*100, "ЯЮЭЬЫЪЩШЧЦХФУТСРПОНМЛКЙИЗЖЁЕДГВБА", 4),
+                          ("", "phqgiumeaylnofdxjkrcvstzwb".upper(), 4)])
+def test_simple_substitution_file_in_place(tmp_path, text_to_input, random_key, chunk_size):
+    file_path = tmp_path / "message.txt"
+    file_path.write_bytes(text_to_input.encode("utf-8"))
+    assert simple_substitution_cipher_file(str(file_path), random_key, CIPHER_MODE, chunk_size=chunk_size) == str(file_path)
+    ciphered_text = file_path.read_bytes().decode("utf-8")
+    assert ciphered_text == SimpleSubstitutionKey(random_key).translate_bytes(text_to_input.encode("utf-8")).decode("utf-8")
+    assert ciphered_text.upper() == simple_substitution_cipher(text_to_input, random_key, CIPHER_MODE).upper()
+    simple_substitution_cipher_file(str(file_path), random_key, DECIPHER_MODE, chunk_size=chunk_size)
+    assert file_path.read_bytes().decode("utf-8") == text_to_input.upper()
+
+
+def test_simple_substitution_file_with_output(tmp_path):
+    random_key = "AĄBCĆDEĘFGHIJKLŁMNŃOÓPQRSŚTUVWXYZŹŻ"[::-1]
+    input_file_path, output_file_path = tmp_path / "message.txt", tmp_path / "ciphered_message.txt"
+    input_file_path.write_bytes((TEXT_TO_CIPHER_POLISH*1000).encode("utf-8"))
+    with pytest.raises(ValueError) as exception_info:
+        simple_substitution_cipher_file(str(input_file_path), random_key)
+    assert str(exception_info.value) == "Key changes the length of UTF-8 encoded text, so the file can't be processed in place! Please provide an output file path."
+    simple_substitution_cipher_file(str(input_file_path), random_key, CIPHER_MODE, str(output_file_path), chunk_size=9)
+    assert input_file_path.read_bytes().decode("utf-8") == TEXT_TO_CIPHER_POLISH*1000
+    assert output_file_path.read_bytes().decode("utf-8") == simple_substitution_cipher(TEXT_TO_CIPHER_POLISH*1000, random_key)
 
 
 @pytest.mark.parametrize("text_to_input, keyword, character_to_fill, expected",
@@ -115,7 +288,8 @@ def test_columnar_transposition_cipher_encoding(text_to_input, keyword, characte
 @pytest.mark.parametrize("text_to_input, keyword, character_to_fill, expected_error, expected_error_message",
                          [(TEXT_TO_CIPHER_LATIN, "test_", "x", ValueError, "Keyword must contain only letters!"),
                           (TEXT_TO_CIPHER_LATIN, "test1", "x", ValueError, "Keyword must contain only letters!"),
-                          (TEXT_TO_CIPHER_LATIN, "test", "xx", Exception, 'Wrong length of "character_that_filled" character (length 1 is the only option)!')])
+                          (TEXT_TO_CIPHER_LATIN, "test", "xx", Exception, 'Wrong length of "character_that_filled" character (length 1 is the only option)!'),
+                          (TEXT_TO_CIPHER_LATIN, "", "x", ValueError, "Keyword should not be empty!")])
 def test_columnar_transposition_cipher_encoding_edge_cases(text_to_input, keyword, character_to_fill, expected_error,
                                                            expected_error_message):
     with pytest.raises(expected_error) as exception_info:
@@ -135,7 +309,9 @@ def test_columnar_transposition_cipher_decoding(text_to_input, keyword, characte
 @pytest.mark.parametrize("text_to_input, keyword, character_that_filled, expected_error, expected_error_message",
                          [(TEXT_TO_CIPHER_LATIN.replace(" ", ""), "test_", "x", ValueError, "Keyword must contain only letters!"),
                           (TEXT_TO_CIPHER_LATIN.replace(" ", ""), "test1", "x", ValueError, "Keyword must contain only letters!"),
-                          (TEXT_TO_CIPHER_LATIN.replace(" ", ""), "test", "xx", Exception, 'Wrong length of "character_that_filled" character (length 1 is the only option)!')])
+                          (TEXT_TO_CIPHER_LATIN.replace(" ", ""), "test", "xx", Exception, 'Wrong length of "character_that_filled" character (length 1 is the only option)!'),
+                          (TEXT_TO_CIPHER_LATIN.replace(" ", ""), "", "x", ValueError, "Keyword should not be empty!"),
+                          ("QKWX", "zebras", "x", ValueError, "Text should be at least as long as the keyword!")])
 def test_columnar_transposition_cipher_decoding_edge_cases(text_to_input, keyword, character_that_filled,
                                                            expected_error, expected_error_message):
     with pytest.raises(expected_error) as exception_info:
@@ -143,6 +319,15 @@ def test_columnar_transposition_cipher_decoding_edge_cases(text_to_input, keywor
     assert str(exception_info.value) == expected_error_message
 
 
+@pytest.mark.parametrize("text_to_input, keyword",
+                         [(TEXT_TO_CIPHER_LATIN.replace(" ", "")*100, "TOMATO"),
+                          (TEXT_TO_CIPHER_POLISH.replace(" ", "")*100, "żółtko"),
+                          ("FOX", "LONGKEYWORD")])
+def test_columnar_transposition_cipher_long_text(text_to_input, keyword):
+    assert columnar_transposition_cipher_decoding(columnar_transposition_cipher_encoding(text_to_input, keyword, "q"),
+                                                  keyword, "q") == text_to_input
+
+
 @pytest.mark.parametrize("text_to_input, keyword, alphabet, expected",
                          [(TEXT_TO_CIPHER_LATIN[:-2], "fortification", LATIN_ALPHABET, "YVVJCNKMBKWKAYVBZOURCPMSNGMSIJTKSGU"),
                           (TEXT_TO_CIPHER_LATIN[:-2], "lioN", LATIN_ALPHABET, "EPSDNPGAVZQGOWCTWZAMBIHTJHCICTGCOOF"),
@@ -179,6 +364,25 @@ def test_autokey_cipher_decoding_edge_cases(text_to_input, keyword, alphabet):
     assert str(exception_info.value) == "Text after ciphering with Autokey cipher should not have any non-letter characters!"
 
 
+@pytest.mark.parametrize("text_to_input, keyword, alphabet",
+                         [(TEXT_TO_CIPHER_LATIN[:-2].replace(" ", "")*100, "LION", LATIN_ALPHABET),
+                          (TEXT_TO_CIPHER_POLISH[:-2].replace(",", "").replace(" ", "")*100, "MĘSKI", POLISH_ALPHABET),
+                          ("DOG", "FORTIFICATION", LATIN_ALPHABET)])
+def test_autokey_cipher_decoding_long_text(text_to_input, keyword, alphabet):
+    assert autokey_cipher_decoding(autokey_cipher_encoding(text_to_input, keyword, alphabet), keyword, alphabet) == \
+        text_to_input
+
+
+@pytest.mark.parametrize("text_to_input, keyword, alphabet, error_message",
+                         [("YVVJCNKMBKWKAYVBZOURC", "", LATIN_ALPHABET, "Keyword should not be empty!"),
+                          ("ZLRXĘŃFĆŁŻJSSMSBCZGŁJ", "MESKI", LATIN_ALPHABET, "Text should only have letters from the given alphabet!"),
+                          ("YVVJCNKMBKWKAYVBZOURC", "MĘSKI", LATIN_ALPHABET, "Keyword should only have letters from the given alphabet!")])
+def test_autokey_cipher_decoding_key_edge_cases(text_to_input, keyword, alphabet, error_message):
+    with pytest.raises(ValueError) as exception_info:
+        autokey_cipher_decoding(text_to_input, keyword, alphabet)
+    assert str(exception_info.value) == error_message
+
+
 @pytest.mark.parametrize("text_to_input, number_of_rails, remove_spaces, expected",
                          [(TEXT_TO_CIPHER_LATIN, 5, False, "TKFSHDHC  OP TE OEIBNXMO  YG URW UVRLZ QOJEA5"),
                           (TEXT_TO_CIPHER_LATIN, 5, True, "TBJRDHKRXUETYOECOOMVHZGQIWFPOEA5UNSL"),
@@ -215,6 +419,23 @@ def test_rail_fence_cipher_decoding_edge_cases(text_to_input, random_number):
     assert str(exception_info.value) == "Number of rails should be at least 2!"
 
 
+@pytest.mark.parametrize("text_to_input, number_of_rails, expected",
+                         [("", 3, ""),
+                          ("FOX", 5, "FOX"),
+                          ("WEAREDISCOVERED", 3, "WECRERDSOEEAIVD")])
+def test_rail_fence_cipher_short_text(text_to_input, number_of_rails, expected):
+    assert rail_fence_cipher_encoding(text_to_input, number_of_rails) == expected
+    assert rail_fence_cipher_decoding(expected, number_of_rails) == text_to_input
+
+
+@pytest.mark.parametrize("text_to_input, number_of_rails",
+                         [(TEXT_TO_CIPHER_LATIN*1000, 10),
+                          (TEXT_TO_CIPHER_POLISH*1000, 7)])
+def test_rail_fence_cipher_long_text(text_to_input, number_of_rails):
+    assert rail_fence_cipher_decoding(rail_fence_cipher_encoding(text_to_input, number_of_rails), number_of_rails) == \
+        text_to_input
+
+
 @pytest.mark.parametrize("character_to_remove",
                          [(""),
                           ("JJ"),
@@ -303,6 +524,19 @@ def test_bifid_cipher_decoding_edge_case_2(character_what_was_replaced, characte
     assert str(exception_info.value) == "Invalid character_that_was_replaced or character_that_was_replaced_with. Characters have to be single, different letters and have to be in Latin Alphabet!"
 
 
+def test_bifid_cipher_key_edge_case():
+    with pytest.raises(ValueError) as exception_info:
+        bifid_cipher_encoding(TEXT_TO_CIPHER_LATIN[:-2], 5, "PHQGMEAYLNOFDXKRCVSZWBUTI", "K", "Q")
+    assert str(exception_info.value) == "Text should only have letters from the given key!"
+
+
+@pytest.mark.parametrize("period", [1, 4, 7, 2000])
+def test_bifid_cipher_long_text(period):
+    text_to_input = TEXT_TO_CIPHER_LATIN_2.replace(" ", "")*100
+    ciphered_text = bifid_cipher_encoding(text_to_input, period, "PHQGMEAYLNOFDXKRCVSZWBUTI")
+    assert bifid_cipher_decoding(ciphered_text, period, "PHQGMEAYLNOFDXKRCVSZWBUTI") == text_to_input
+
+
 @pytest.mark.parametrize("text_to_input, keyword, alphabet, expected",
                          [(TEXT_TO_CIPHER_LATIN[:-2], "fortification", LATIN_ALPHABET, "MHNDOXGSZCUSAAAUKOTTKMYEXUYKGTJHFOU"),
                           (TEXT_TO_CIPHER_LATIN[:-2], "lioN", LATIN_ALPHABET, "SBKXRAMDKRARYDAQCOCYTUTJUPHJAIPPIUI"),
@@ -348,6 +582,16 @@ def test_porta_cipher_edge_cases(text_to_input, alphabet, error_message):
     assert str(exception_info.value) == error_message
 
 
+@pytest.mark.parametrize("text_to_input, keyword, alphabet, error_message",
+                         [(TEXT_TO_CIPHER_LATIN[:-2], "", LATIN_ALPHABET, "Keyword should not be empty!"),
+                          (TEXT_TO_CIPHER_POLISH[:-2].replace(",", ""), "FOO", LATIN_ALPHABET, "Text should only have letters from the given alphabet!"),
+                          (TEXT_TO_CIPHER_LATIN[:-2], "męski", LATIN_ALPHABET, "Keyword should only have letters from the given alphabet!")])
+def test_porta_cipher_keyword_edge_cases(text_to_input, keyword, alphabet, error_message):
+    with pytest.raises(ValueError) as exception_info:
+        porta_cipher(text_to_input, keyword, alphabet)
+    assert str(exception_info.value) == error_message
+
+
 @pytest.mark.parametrize("text_to_input, keyword, alphabet, mode, expected",
                          [(TEXT_TO_CIPHER_LATIN[:-2], "'You know what the greatest tragedy in the whole world is?' said Ginger, not paying him the least attention. It's all the people who never find out what they really want to do or what it is they're really good at", LATIN_ALPHABET, CIPHER_MODE, "RVYAHWYGIRHPUJUONUFTKHOVRZLHJIMRKSC"),
                           (TEXT_TO_CIPHER_LATIN[:-2], "The Discworld is as unreal as it is possible to be while still being just real enough to exist.", LATIN_ALPHABET, CIPHER_MODE, "MOITCAEGPIZZVXOPDHDTSZVWZMPWAORQLPR"),
@@ -372,6 +616,44 @@ def test_running_key_cipher_edge_cases(text_to_input, alphabet, error_message):
     assert str(exception_info.value) == error_message
 
 
+@pytest.mark.parametrize("text_to_input, keyphrase, alphabet, keyphrase_offset, chunk_size",
+                         [(TEXT_TO_CIPHER_LATIN[:-2], "The Discworld is as unreal as it is possible to be while still being just real enough to exist.", LATIN_ALPHABET, 0, 4),
+                          (TEXT_TO_CIPHER_LATIN[:-2], "The Discworld is as unreal as it is possible to be while still being just real enough to exist.", LATIN_ALPHABET, 17, 16),
+                          (TEXT_TO_CIPHER_POLISH[:-2].replace(",", ""), "Człowiek wyruszył na spotkanie innych światów, innych cywilizacji, nie poznawszy do końca własnych zakamarków, ślepych dróg, studni, zabarykadowanych, ciemnych drzwi.", POLISH_ALPHABET, 5, 7)])
+def test_running_key_cipher_corpus(tmp_path, text_to_input, keyphrase, alphabet, keyphrase_offset, chunk_size):
+    corpus_path = tmp_path / "corpus.txt"
+    corpus_path.write_text(keyphrase, encoding="utf-8")
+    keyphrase_letters = "".join(character for character in keyphrase if character.isalpha())[keyphrase_offset:]
+    expected = running_key_cipher(text_to_input, keyphrase_letters, alphabet)
+    assert running_key_cipher(text_to_input, keyphrase, alphabet, CIPHER_MODE, keyphrase_offset) == expected
+    assert running_key_cipher(text_to_input, corpus_path, alphabet, CIPHER_MODE, keyphrase_offset) == expected
+    with RunningKeyCorpus(str(corpus_path), chunk_size) as corpus:
+        assert corpus.letters(keyphrase_offset + 3, 5) == keyphrase_letters[3:8].upper()
+        assert running_key_cipher(text_to_input, corpus, alphabet, CIPHER_MODE, keyphrase_offset) == expected
+        assert running_key_cipher(expected, corpus, alphabet, DECIPHER_MODE, keyphrase_offset) == text_to_input.replace(" ", "")
+
+
+@pytest.mark.parametrize("keyphrase_offset, error_message",
+                         [(-1, "Keyphrase offset should not be negative!"),
+                          (70, "Length of the keyphrase should be at least that of the ciphered text!")])
+def test_running_key_cipher_corpus_edge_cases(tmp_path, keyphrase_offset, error_message):
+    corpus_path = tmp_path / "corpus.txt"
+    corpus_path.write_text("The Discworld is as unreal as it is possible to be while still being just real enough to exist.", encoding="utf-8")
+    with pytest.raises(ValueError) as exception_info:
+        running_key_cipher(TEXT_TO_CIPHER_LATIN_2, corpus_path, LATIN_ALPHABET, CIPHER_MODE, keyphrase_offset)
+    assert str(exception_info.value) == error_message
+
+
+def test_running_key_cipher_string_path(tmp_path):
+    keyphrase = "The Discworld is as unreal as it is possible to be while still being just real enough to exist."
+    corpus_path = tmp_path / "corpus.txt"
+    corpus_path.write_text(keyphrase, encoding="utf-8")
+    expected = running_key_cipher(TEXT_TO_CIPHER_LATIN_2, keyphrase, LATIN_ALPHABET)
+    with RunningKeyCorpus(str(corpus_path)) as corpus:
+        assert running_key_cipher(TEXT_TO_CIPHER_LATIN_2, corpus, LATIN_ALPHABET) == expected
+    assert running_key_cipher("HI", "/data/book.txt", LATIN_ALPHABET) == running_key_cipher("HI", "DATABOOKTXT", LATIN_ALPHABET)
+
+
 @pytest.mark.parametrize("alphabet",
                          [LATIN_ALPHABET,
                           POLISH_ALPHABET,
@@ -385,6 +667,37 @@ def test_homophonic_substitution_cipher_generate_letter_connection_dictionary(al
     assert sorted(every_character) == sorted(alphabet + DIGITS)
 
 
+def test_homophonic_substitution_cipher_generate_letter_connection_dictionary_from_saved_frequency(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "generated_files").mkdir()
+    letter_frequency = {letter: 1.0 for letter in LATIN_ALPHABET}
+    letter_frequency["E"] = 20.0
+    with open(tmp_path / "generated_files" / "letter_frequency_latin.json", "w", encoding="utf-8") as output_file:
+        json.dump(letter_frequency, output_file)
+    letter_dictionary = homophonic_substitution_generate_letter_connection_dictionary(LATIN_ALPHABET)
+    assert len(letter_dictionary["E"]) == 11
+    assert all(len(letter_dictionary[letter]) == 1 for letter in LATIN_ALPHABET if letter != "E")
+
+
+@pytest.mark.parametrize("alphabet, letter_frequency",
+                         [(GREEK_ALPHABET, {letter: 1.0 + index for index, letter in enumerate(GREEK_ALPHABET)}),
+                          (LATIN_ALPHABET, LETTER_FREQUENCIES[POLISH_ALPHABET])])
+def test_homophonic_substitution_cipher_generate_letter_connection_dictionary_with_frequency(alphabet, letter_frequency):
+    letter_dictionary = homophonic_substitution_generate_letter_connection_dictionary(alphabet, letter_frequency)
+    assert list(letter_dictionary.keys()) == list(alphabet)
+    assert sorted(character for characters in letter_dictionary.values() for character in characters) == sorted(alphabet + DIGITS)
+
+
+@pytest.mark.parametrize("alphabet, letter_frequency, error_message",
+                         [(HEBREW_ALPHABET, LETTER_FREQUENCIES[LATIN_ALPHABET], "Letter frequency should have a positive value for every letter of the alphabet!"),
+                          (LATIN_ALPHABET, {**LETTER_FREQUENCIES[LATIN_ALPHABET], "Q": 0}, "Letter frequency should have a positive value for every letter of the alphabet!"),
+                          (LATIN_ALPHABET, {letter: 1.0 for letter in LATIN_ALPHABET}, "Letter frequency can't be used to split letters and digits between letters of the alphabet!")])
+def test_homophonic_substitution_cipher_generate_letter_connection_dictionary_with_frequency_edge_cases(alphabet, letter_frequency, error_message):
+    with pytest.raises(ValueError) as exception_info:
+        homophonic_substitution_generate_letter_connection_dictionary(alphabet, letter_frequency)
+    assert str(exception_info.value) == error_message
+
+
 @pytest.mark.parametrize("alphabet, error_message",
                          [(GREEK_ALPHABET, "For now, this function accepts only three alphabets (Latin, Polish and Russian)! Frequency of other alphabets is not accessible on wikipedia page."),
                           (HEBREW_ALPHABET, "For now, this function accepts only three alphabets (Latin, Polish and Russian)! Frequency of other alphabets is not accessible on wikipedia page.")])
@@ -444,6 +757,23 @@ def test_homophonic_substitution_cipher_decoding(text_to_input, letter_connectio
     assert homophonic_substitution_cipher(ciphered_test, letter_connection_dictionary, mode=DECIPHER_MODE) == text_to_input.upper()
 
 
+@pytest.mark.parametrize("alphabet, seed",
+                         [(LATIN_ALPHABET, 0),
+                          (POLISH_ALPHABET, 2137),
+                          (RUSSIAN_ALPHABET, numpy.random.default_rng(7))])
+def test_homophonic_substitution_key(alphabet, seed):
+    compiled_key = HomophonicSubstitutionKey(homophonic_substitution_generate_letter_connection_dictionary(alphabet))
+    text_to_input = (alphabet + " ")*50
+    ciphered_text = homophonic_substitution_cipher(text_to_input, compiled_key, CIPHER_MODE, seed)
+    assert sorted(set(ciphered_text)) == sorted(alphabet + DIGITS + " ")
+    assert all(ciphered_character == character == " " or ciphered_character in compiled_key.letter_connection_dictionary[character]
+               for character, ciphered_character in zip(text_to_input, ciphered_text))
+    assert compiled_key.translate(ciphered_text, DECIPHER_MODE) == text_to_input
+    assert not compiled_key.symbol_code_points.flags.writeable
+    if isinstance(seed, int):
+        assert homophonic_substitution_cipher(text_to_input, compiled_key.letter_connection_dictionary, CIPHER_MODE, seed) == ciphered_text
+
+
 @pytest.mark.parametrize("text_to_input, mode",
                          [(TEXT_TO_CIPHER_LATIN, CIPHER_MODE),
                           (TEXT_TO_CIPHER_LATIN[:-2] + "Б", CIPHER_MODE),
@@ -476,7 +806,11 @@ def test_homophonic_substitution_cipher_edge_cases_1(text_to_input, mode):
                                                                          "Ł": ["5"], "M": ["V"], "N": ["Ł", "1"], "Ń": ["Ó"], "O": ["K", "7", "Ź"],
                                                                          "Ó": ["4"], "P": ["D"], "Q": ["Ż"], "R": ["X"], "S": ["Ń"], "Ś": ["9"],
                                                                          "T": ["N"], "U": ["R"], "V": ["M"], "W": ["W"], "X": ["G"], "Y": ["J"],
-                                                                         "Z": ["H", "A"], "Ź": ["U"], "Ż": ["Ą"]})])
+                                                                         "Z": ["H", "A"], "Ź": ["U"], "Ż": ["Ą"]}),
+                          ("BCDFGjklmPQRuvwXyZ", {"A": ["D", "9"], "B": ["X"], "C": ["S"], "D": ["F"], "E": ["Z", "7", "2", "1"], "F": ["E"],
+                                                  "G": ["H"], "H": ["C", "8"], "I": ["V", "8"], "J": ["I"], "K": ["T"], "L": ["P"], "M": ["G"],
+                                                  "N": ["A", "5"], "O": ["Q", "0"], "P": ["L"], "Q": ["K"], "R": ["J"], "S": ["R", "4"],
+                                                  "T": ["U", "6"], "U": ["O"], "V": ["W"], "W": ["M"], "X": ["Y"], "Y": ["B"], "Z": ["N"]})])
 def test_homophonic_substitution_cipher_edge_cases_2(text_to_input, letter_connection_dictionary):
     with pytest.raises(ValueError) as exception_info:
         homophonic_substitution_cipher(text_to_input, letter_connection_dictionary)
@@ -536,6 +870,14 @@ def test_trifid_cipher_decoding_edge_cases(text_to_input, key, period, expected_
     assert str(exception_info.value) == expected_error_message
 
 
+@pytest.mark.parametrize("period", [2, 5, 11, 5000])
+def test_trifid_cipher_long_text(period):
+    text_to_input = TEXT_TO_CIPHER_LATIN_2.replace(" ", "")*100 + "."
+    ciphered_text = trifid_cipher_encoding(text_to_input, "EPSDUCVWYM.ZLKXNBTFGORIJHAQ", period)
+    assert all(len(block) == period for block in ciphered_text.split(" ")[:-1])
+    assert trifid_cipher_decoding(ciphered_text, "EPSDUCVWYM.ZLKXNBTFGORIJHAQ", period) == text_to_input
+
+
 @pytest.mark.parametrize("text_to_input, alphabet, key_matrix, mode, character_to_fill, expected",
                          [(TEXT_TO_CIPHER_LATIN[:-2], LATIN_ALPHABET, [[1, 3], [3, 4]], CIPHER_MODE, "x", "OHAYSOGUATCACHFERDFSIGHBWXTLLHTPTNXG"),
                           (TEXT_TO_CIPHER_LATIN_2, LATIN_ALPHABET, [[6, 24, 1], [13, 16, 10], [20, 17, 15]], CIPHER_MODE, "L", "PXVBEIAJNQYMSBAGRTZXIUGKDYQNAQ"),
@@ -564,6 +906,28 @@ def test_hill_cipher_edge_case(text_to_input, alphabet, key_matrix, character_to
     assert str(exception_info.value) == error_message
 
 
+def test_hill_cipher_fill_character_edge_case():
+    with pytest.raises(ValueError) as exception_info:
+        hill_cipher("foo", LATIN_ALPHABET, [[1, 3], [3, 4]], character_to_fill="ą")
+    assert str(exception_info.value) == '"character_to_fill" should be a letter from the given alphabet!'
+
+
+@pytest.mark.parametrize("text_to_input, alphabet, size",
+                         [(TEXT_TO_CIPHER_LATIN_2.replace(" ", "")*10, LATIN_ALPHABET, 3),
+                          (TEXT_TO_CIPHER_LATIN_2.replace(" ", "")*10, LATIN_ALPHABET, 12),
+                          (TEXT_TO_CIPHER_POLISH.replace(" ", "").replace(",", "")[:-1]*10, POLISH_ALPHABET, 10)])
+def test_hill_cipher_large_key_matrix(text_to_input, alphabet, size):
+    lower_matrix = [[1 if row == column else (3*row + column) % len(alphabet) if column < row else 0
+                     for column in range(size)] for row in range(size)]
+    upper_matrix = [[1 if row == column else (row + 5*column) % len(alphabet) if column > row else 0
+                     for column in range(size)] for row in range(size)]
+    key_matrix = [[sum(lower_matrix[row][k]*upper_matrix[k][column] for k in range(size)) % len(alphabet)
+                   for column in range(size)] for row in range(size)]
+    ciphered_text = hill_cipher(text_to_input, alphabet, key_matrix, CIPHER_MODE, "Q")
+    assert len(ciphered_text) % size == 0
+    assert hill_cipher(ciphered_text, alphabet, key_matrix, DECIPHER_MODE, "Q") == text_to_input
+
+
 @pytest.mark.parametrize("keyword_to_input, character_to_remove",
                          [("Monarchy", "J"),
                           ("BLOWZY", "a"),
@@ -618,6 +982,26 @@ def test_playfair_cipher_encoding_edge_cases(text_to_input, key_square, characte
     assert str(exception_info.value) == error_message
 
 
+@pytest.mark.parametrize("texts_to_input, key_square, character_to_replace, character_to_replace_with, swap_letter",
+                         [([TEXT_TO_CIPHER_LATIN[:-2], "a", "", "jazz", TEXT_TO_CIPHER_LATIN_2], "MONARCHYIVKBXGUWTFZLEDSQP", "J", "I", "x"),
+                          ([TEXT_TO_CIPHER_LATIN_2, "odd"], "CYBERPUNKVJIWZMHAFXSQTLOG", "d", "t", "q"),
+                          (["Aßb", "Gruß", "Eßo"], "MONARCHYIVKBXGUWTFZLEDSQP", "J", "I", "x"),
+                          ([], "CYBERPUNKVJIWZMHAFXSQTLOG", "d", "t", "q")])
+def test_playfair_cipher_encoding_batch(texts_to_input, key_square, character_to_replace, character_to_replace_with, swap_letter):
+    assert playfair_cipher_encoding_batch(iter(texts_to_input), key_square, character_to_replace, character_to_replace_with, swap_letter) == \
+        [playfair_cipher_encoding(text, key_square, character_to_replace, character_to_replace_with, swap_letter) for text in texts_to_input]
+
+
+@pytest.mark.parametrize("texts_to_input, key_square, error_message",
+                         [(["ab", "ąż"], "monarchybdefgiklpqstuvwxz", "Playfair cipher supports only letters from the key_square!"),
+                          (["ab"], "monarchy", "Key square appears to be wrong length - 8, should be 25!"),
+                          (["ab", "abxxab"], "monarchybdefgiklpqstuvwxz", "Text appears to have a double letter pair, that equals to the swap_letter: X. Please change the swap_letter!")])
+def test_playfair_cipher_encoding_batch_edge_cases(texts_to_input, key_square, error_message):
+    with pytest.raises(ValueError) as exception_info:
+        playfair_cipher_encoding_batch(texts_to_input, key_square)
+    assert str(exception_info.value) == error_message
+
+
 @pytest.mark.parametrize("text_to_input, key_square, character_to_replace, character_to_replace_with, swap_letter, expected",
                          [("DBDPGVKWUOMTYSNBVGREDNCPOLCDZRFIOHUG", "MONARCHYIVKBXGUWTFZLEDSQP", "J", "I", "x", TEXT_TO_CIPHER_LATIN.replace("J", "I").replace("I", "(I/J)").replace("X", "(X/O)").replace(" ", "")[:-1] + "(X/G/_)"),
                           ("OYXBULQACOFHLIFTOGALXCYHAGOB", "CYBERPUNKVJIWZMHAFXSQTLOG", "d", "t", "q", TEXT_TO_CIPHER_LATIN_2.replace("D", "T").replace("T", "(T/D)").replace(" ", "").replace("EE", "E(Q/E)"))])
@@ -625,6 +1009,18 @@ def test_playfair_cipher_decoding(text_to_input, key_square, character_to_replac
     assert playfair_cipher_decoding(text_to_input, key_square, character_to_replace, character_to_replace_with, swap_letter) == expected
 
 
+@pytest.mark.parametrize("key_square, swap_letter", [("MONARCHYIVKBXGUWTFZLEDSQP", "X"), ("CYBERPUNKVJIWZMHAFXSQTLOG", "Q")])
+def test_playfair_key_square(key_square, swap_letter):
+    compiled_key_square = PlayfairKeySquare(key_square, swap_letter)
+    letter_indexes = numpy.array([index for first in range(25) for second in range(25) if first != second
+                                  for index in (first, second)])
+    ciphered_indexes = compiled_key_square.translate_pairs(letter_indexes, CIPHER_MODE)
+    assert (compiled_key_square.translate_pairs(ciphered_indexes, DECIPHER_MODE) == letter_indexes).all()
+    swap_index = key_square.index(swap_letter)
+    assert list(compiled_key_square.translate_pairs(numpy.array([0, 0]) + (swap_index + 1) % 25)) == \
+        list(compiled_key_square.translate_pairs(numpy.array([(swap_index + 1) % 25, swap_index])))
+
+
 @pytest.mark.parametrize("text_to_input, key_square, character_to_replace, character_to_replace_with, swap_letter, error_message",
                          [("ąż", "monarchybdefgiklpqstuvwxz", "j", "i", "x", "Text should only have letters from the key_square!"),
                           ("foo", "ążnarchybdefgiklpqstuvwxz", "j", "i", "x", "key_square should only have letters from Latin alphabet!"),
@@ -668,6 +1064,54 @@ def test_morse_code_edge_cases(text_to_input, gap_fill, mode, error_message):
     assert str(exception_info.value) == error_message
 
 
+@pytest.mark.parametrize("text_to_input, gap_fill, chunk_size",
+                         [(TEXT_TO_CIPHER_LATIN, " ", 1),
+                          (TEXT_TO_CIPHER_LATIN, " ", 7),
+                          (TEXT_TO_CIPHER_LATIN_2, "x", 3),
+                          (TEXT_TO_CIPHER_LATIN_2, "||", 5)])
+def test_morse_code_decoder(text_to_input, gap_fill, chunk_size):
+    encoded_text = morse_code(text_to_input, gap_fill, CIPHER_MODE)
+    decoder = MorseCodeDecoder(gap_fill)
+    decoded_text = "".join(decoder.update(encoded_text[index: index + chunk_size]) for index in range(0, len(encoded_text), chunk_size))
+    assert decoded_text + decoder.finalize() == morse_code(encoded_text, gap_fill, DECIPHER_MODE) == text_to_input.upper()
+
+
+@pytest.mark.parametrize("text_to_input, gap_fill, error_message",
+                         [(" .- -...", " ", "Encoded text appears to have a gap at the beginning or more than two gaps in a row!"),
+                          (".-   -...", " ", "Encoded text appears to have a gap at the beginning or more than two gaps in a row!"),
+                          (".- ........", " ", "Encoded text appears to have a sequence, that is not in the Morse code: \"........\"!")])
+def test_morse_code_decoder_edge_cases(text_to_input, gap_fill, error_message):
+    decoder = MorseCodeDecoder(gap_fill)
+    with pytest.raises(ValueError) as exception_info:
+        decoder.update(text_to_input)
+        decoder.finalize()
+    assert str(exception_info.value) == error_message
+
+
+@pytest.mark.parametrize("text_to_input, gap_fill, split_index, expected",
+                         [(".-xy-...xyxy-.-.", "xy", 11, "AB C"),
+                          (".-xy-...xyxy-.-.", "xy", 9, "AB C"),
+                          (".-xy-...xyxy-.-.xy", "xy", 17, "AB C")])
+def test_morse_code_decoder_split_inside_gap(text_to_input, gap_fill, split_index, expected):
+    decoder = MorseCodeDecoder(gap_fill)
+    assert decoder.update(text_to_input[:split_index]) + decoder.update(text_to_input[split_index:]) + decoder.finalize() == expected
+
+
+@pytest.mark.parametrize("text_to_input, gap_fill, split_index, error_message",
+                         [(".-xy-...xyxyxy-.-.xyxy.-", "xy", 13, "Encoded text appears to have a gap at the beginning or more than two gaps in a row!"),
+                          (".-xy-...xyxyxy-.-.xyxy.-", "xy", 12, "Encoded text appears to have a gap at the beginning or more than two gaps in a row!")])
+def test_morse_code_decoder_split_inside_gap_edge_cases(text_to_input, gap_fill, split_index, error_message):
+    decoder = MorseCodeDecoder(gap_fill)
+    with pytest.raises(ValueError) as exception_info:
+        decoder.update(text_to_input[:split_index])
+        decoder.update(text_to_input[split_index:])
+        decoder.finalize()
+    assert str(exception_info.value) == error_message
+    with pytest.raises(ValueError) as exception_info:
+        morse_code(text_to_input, gap_fill, DECIPHER_MODE)
+    assert str(exception_info.value) == error_message
+
+
 @pytest.mark.parametrize("keyword_to_input",
                          [("Monarchy"),
                           ("BLOWZY"),
@@ -708,6 +1152,30 @@ def test_fractionated_morse_code_edge_cases(text_to_input, key_table, gap_fill,
     assert str(exception_info.value) == error_message
 
 
+@pytest.mark.parametrize("text_to_input, key_table, gap_fill, chunk_size",
+                         [(TEXT_TO_CIPHER_LATIN[:-2], "ROUNDTABLEIZFQXMGCPHKYWSJV", " ", 1),
+                          (TEXT_TO_CIPHER_LATIN[:-2], "ROUNDTABLEIZFQXMGCPHKYWSJV", " ", 5),
+                          (TEXT_TO_CIPHER_LATIN_2, "CYBERPUNKFXDJAMZVSTIOHGLWQ", "x", 4)])
+def test_fractionated_morse_key_table(text_to_input, key_table, gap_fill, chunk_size):
+    compiled_key_table = FractionatedMorseKeyTable(key_table, gap_fill)
+    encoded_text = "".join(compiled_key_table.encode(text_to_input[index: index + chunk_size]
+                                                     for index in range(0, len(text_to_input), chunk_size)))
+    assert encoded_text == fractionated_morse_code(text_to_input, compiled_key_table, gap_fill, CIPHER_MODE) == fractionated_morse_code(text_to_input, key_table, gap_fill, CIPHER_MODE)
+    decoded_text = "".join(compiled_key_table.decode(encoded_text[index: index + chunk_size]
+                                                     for index in range(0, len(encoded_text), chunk_size)))
+    assert decoded_text == text_to_input.upper()
+
+
+@pytest.mark.parametrize("text_to_input, key_table, gap_fill, error_message",
+                         [("THE   FOX", "ROUNDTABLEIZFQXMGCPHKYWSJV", " ", "Text appears to have spaces, that can't be encoded (at the beginning, at the end or more than one in a row)!"),
+                          ("THE FOX", "ROUNDTABLEIZFQXMGCPHKYWSJV", "xx", "Gap fill should be a single character in Fractionated morse code!"),
+                          ("THE FOX", "ROUNDTABLEIZFQXMGCPHKYWSJV", "", "Gap fill should be at least one character long (ideally a space or a character not used in the text)!")])
+def test_fractionated_morse_key_table_edge_cases(text_to_input, key_table, gap_fill, error_message):
+    with pytest.raises(ValueError) as exception_info:
+        "".join(FractionatedMorseKeyTable(key_table, gap_fill).encode([text_to_input]))
+    assert str(exception_info.value) == error_message
+
+
 def test_straddle_checkerboard_cipher_generate_random_key():
     random_key = straddle_checkerboard_cipher_generate_random_key(False)
     assert "".join(sorted(list(set(random_key)))) == LATIN_ALPHABET
@@ -736,6 +1204,8 @@ def test_straddle_checkerboard_cipher_encoding(text_to_input, key, key_number, r
                           (TEXT_TO_CIPHER_LATIN_2, "NUMYBQXOZERKISLFWDGHPVTJC", 83729, False, (3, 7), "Characters in key should only have letters from Latin alphabet, length equal to 26 and not contain duplicates!"),
                           (TEXT_TO_CIPHER_LATIN_2, "AANUMYBQXOZERKISLFWDGHPVTJC", 83729, False, (3, 7), "Characters in key should only have letters from Latin alphabet, length equal to 26 and not contain duplicates!"),
                           (TEXT_TO_CIPHER_LATIN[:-2], "ANUMYBQXOZERKISLFWDGHPVTJC", random.randint(-10, -1), False, (3, 7), "Key number should not be negative!"),
+                          (TEXT_TO_CIPHER_LATIN[:-2], "ANUMYBQXOZERKISLFWDGHPVTJC", None, False, (3, 7), "Key number should be an integer!"),
+                          (TEXT_TO_CIPHER_LATIN[:-2], "ANUMYBQXOZERKISLFWDGHPVTJC", "83729", False, (3, 7), "Key number should be an integer!"),
                           (TEXT_TO_CIPHER_LATIN[:-2], "ANUMYBQXOZERKISLFWDGHPVTJC", 83729, False, (1, 3, 7), "Spare positions list should contain 2 different elements!"),
                           (TEXT_TO_CIPHER_LATIN_2, "ANUMYBQXOZERKISLFWDGHPVTJC", 83729, False, (7, ), "Spare positions list should contain 2 different elements!"),
                           (TEXT_TO_CIPHER_LATIN_2, "ANUMYBQXOZERKISLFWDGHPVTJC", 83729, False, (7, 7), "Spare positions list should contain 2 different elements!"),
@@ -780,6 +1250,8 @@ def test_straddle_checkerboard_cipher_decoding(text_to_input, key, key_number, s
                           (TEXT_TO_CIPHER_LATIN_2.replace(" ", ""), "NUMYBQXOZERKISLFWDGHPVTJC", 83729, [3, 7], "Characters in key should only have letters from Latin alphabet, length equal to 26 and not contain duplicates!"),
                           (TEXT_TO_CIPHER_LATIN_2.replace(" ", ""), "AANUMYBQXOZERKISLFWDGHPVTJC", 83729, [3, 7], "Characters in key should only have letters from Latin alphabet, length equal to 26 and not contain duplicates!"),
                           (TEXT_TO_CIPHER_LATIN[:-2].replace(" ", ""), "ANUMYBQXOZERKISLFWDGHPVTJC", random.randint(-10, -1), [3, 7], "Key number should not be negative!"),
+                          (TEXT_TO_CIPHER_LATIN[:-2].replace(" ", ""), "ANUMYBQXOZERKISLFWDGHPVTJC", None, [3, 7], "Key number should be an integer!"),
+                          (TEXT_TO_CIPHER_LATIN[:-2].replace(" ", ""), "ANUMYBQXOZERKISLFWDGHPVTJC", 837.29, [3, 7], "Key number should be an integer!"),
                           (TEXT_TO_CIPHER_LATIN[:-2].replace(" ", ""), "ANUMYBQXOZERKISLFWDGHPVTJC", 83729, [1, 3, 7], "Spare positions list should contain 2 different elements!"),
                           (TEXT_TO_CIPHER_LATIN_2.replace(" ", ""), "ANUMYBQXOZERKISLFWDGHPVTJC", 83729, [7], "Spare positions list should contain 2 different elements!"),
                           (TEXT_TO_CIPHER_LATIN_2.replace(" ", ""), "ANUMYBQXOZERKISLFWDGHPVTJC", 83729, [7, 7], "Spare positions list should contain 2 different elements!"),
@@ -795,3 +1267,263 @@ def test_straddle_checkerboard_cipher_decoding_edge_cases(text_to_input, key, ke
     with pytest.raises(ValueError) as exception_info:
         straddle_checkerboard_cipher_decoding(text_to_input, key, key_number, spare_positions)
     assert str(exception_info.value) == error_message
+
+
+@pytest.mark.parametrize("text_to_input, key, key_number, spare_positions, expected",
+                         [(TEXT_TO_CIPHER_LATIN[:-2], "OYPHMQZSJKCDARUFNITBWLXEGV", 13295, (2, 6), b"7365085814354012579135012196153972419950388997882751318198"),
+                          (TEXT_TO_CIPHER_LATIN_2, "fkmcpdyehbigqrosazlutjnwvx", 83729, (3, 7), b"427162944282657104463659953089550282655655428"),
+                          (TEXT_TO_CIPHER_LATIN_2, "ANUMYBQXOZERKISLFWDGHPVTJC", 0, (0, 8), b"8002080228085820202106850910707000885820287106850702")])
+def test_straddle_checkerboard_cipher_bytes(text_to_input, key, key_number, spare_positions, expected):
+    encoded_digits = straddle_checkerboard_cipher_encoding(text_to_input, key, key_number, True, spare_positions, True)
+    assert encoded_digits == expected
+    assert straddle_checkerboard_cipher_decoding(encoded_digits, key, key_number, spare_positions) == text_to_input.upper().replace(" ", "")
+
+
+@pytest.mark.parametrize("key, spare_positions, letter, expected",
+                         [("OYPHMQZSJKCDARUFNITBWLXEGV", (2, 6), "O", [0]),
+                          ("OYPHMQZSJKCDARUFNITBWLXEGV", (6, 2), "M", [5]),
+                          ("OYPHMQZSJKCDARUFNITBWLXEGV", (2, 6), "C", [2, 2]),
+                          ("OYPHMQZSJKCDARUFNITBWLXEGV", (2, 6), "V", [6, 7])])
+def test_straddle_checkerboard_key(key, spare_positions, letter, expected):
+    compiled_key = StraddleCheckerboardKey(key, spare_positions)
+    assert compiled_key.letters_to_digits(letter).tolist() == expected
+    assert compiled_key.digits_to_letters(numpy.array(expected, dtype=numpy.uint8)) == letter
+    assert straddle_checkerboard_cipher_encoding(letter, compiled_key, 0, True) == "".join(map(str, expected))
+
+
+def test_straddle_checkerboard_key_edge_cases():
+    with pytest.raises(ValueError) as exception_info:
+        StraddleCheckerboardKey("OYPHMQZSJKCDARUFNITBWLXEGV", (2, 6)).digits_to_letters(numpy.array([2], dtype=numpy.uint8))
+    assert str(exception_info.value) == "Digits can't be split into numbers of letters from the key!"
+
+
+SIMPLE_SUBSTITUTION_KEY = "QWERTYUIOPASDFGHJKLZXCVBNM"
+CIPHER_STREAM_CASES = [(CaesarCipherStream, caesar_cipher, TEXT_TO_CIPHER_POLISH, (-3, POLISH_ALPHABET, True)),
+                       (AtbashCipherStream, atbash_cipher, TEXT_TO_CIPHER_LATIN, (LATIN_ALPHABET, True)),
+                       (VigenereCipherStream, vigenere_cipher, TEXT_TO_CIPHER_POLISH, ("MĘSKI", POLISH_ALPHABET, DECIPHER_MODE, 5)),
+                       (RunningKeyCipherStream, running_key_cipher, TEXT_TO_CIPHER_LATIN_2, ("The Discworld is as unreal as it is possible to be", LATIN_ALPHABET, CIPHER_MODE, 4)),
+                       (SimpleSubstitutionCipherStream, simple_substitution_cipher, TEXT_TO_CIPHER_LATIN, (SIMPLE_SUBSTITUTION_KEY, DECIPHER_MODE)),
+                       (BeaufortCipherStream, beaufort_cipher, TEXT_TO_CIPHER_LATIN_2, ("FORTIFICATION", LATIN_ALPHABET)),
+                       (PortaCipherStream, porta_cipher, TEXT_TO_CIPHER_LATIN_2, ("FORTIFICATION", LATIN_ALPHABET)),
+                       (AutokeyCipherEncoder, autokey_cipher_encoding, TEXT_TO_CIPHER_LATIN_2, ("QUEENLY", LATIN_ALPHABET)),
+                       (AutokeyCipherDecoder, autokey_cipher_decoding, "SNWSYBWDGIJWFOSUBDSMYTXHBTE", ("QUEENLY", LATIN_ALPHABET)),
+                       (BaconCipherEncoder, bacon_cipher_encoding, TEXT_TO_CIPHER_LATIN, (LATIN_ALPHABET, ("c", "d"), True)),
+                       (BaconCipherDecoder, bacon_cipher_decoding, "aabbbaabaaababb abaab", (LATIN_ALPHABET,)),
+                       (MorseCodeEncoder, morse_code, TEXT_TO_CIPHER_LATIN, ("/",)),
+                       (MorseCodeDecoder, lambda text, gap_fill: morse_code(text, gap_fill, DECIPHER_MODE), "... --- ...  .... . .-.. .--.", (" ",))]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 1000])
+@pytest.mark.parametrize("stream_class, cipher_function, text_to_input, arguments", CIPHER_STREAM_CASES)
+def test_cipher_streams(stream_class, cipher_function, text_to_input, arguments, chunk_size):
+    stream = stream_class(*arguments)
+    for _ in range(2):
+        processed_text = "".join(stream.update(text_to_input[index: index + chunk_size]) for index in range(0, len(text_to_input), chunk_size))
+        assert processed_text + stream.finalize() == cipher_function(text_to_input, *arguments)
+
+
+def test_cipher_streams_resume():
+    text_to_input = TEXT_TO_CIPHER_LATIN_2.replace(" ", "")
+    expected = vigenere_cipher(text_to_input, "LION", LATIN_ALPHABET)
+    stream = VigenereCipherStream("LION", LATIN_ALPHABET)
+    first_part = stream.update(text_to_input[:7])
+    assert stream.key_phase == 7
+    resumed_stream = VigenereCipherStream("LION", LATIN_ALPHABET, key_phase=stream.key_phase)
+    assert first_part + resumed_stream.update(text_to_input[7:]) == expected
+    keyphrase = "The Discworld is as unreal as it is possible to be while still being just real enough to exist."
+    stream = RunningKeyCipherStream(keyphrase, LATIN_ALPHABET)
+    first_part = stream.update(text_to_input[:10])
+    assert stream.keyphrase_offset == 10
+    resumed_stream = RunningKeyCipherStream(keyphrase, LATIN_ALPHABET, keyphrase_offset=stream.keyphrase_offset)
+    assert first_part + resumed_stream.update(text_to_input[10:]) == running_key_cipher(text_to_input, keyphrase, LATIN_ALPHABET)
+
+
+@pytest.mark.parametrize("stream_class, arguments, chunks, error_message",
+                         [(AutokeyCipherEncoder, ("", LATIN_ALPHABET), [], "Keyword should not be empty!"),
+                          (AutokeyCipherEncoder, ("QUEENLY", LATIN_ALPHABET), ["DEFEND", "THE EAST 1"], "Please remove any non-letter characters from the input text!"),
+                          (AutokeyCipherDecoder, ("QUEENLY", LATIN_ALPHABET), ["SNWSYB", "WD GI"], "Text after ciphering with Autokey cipher should not have any non-letter characters!"),
+                          (RunningKeyCipherStream, ("The Discworld", LATIN_ALPHABET), ["DEFEND", "THE EAST"], "Length of the keyphrase should be at least that of the ciphered text!"),
+                          (RunningKeyCipherStream, ("The Discworld", LATIN_ALPHABET, CIPHER_MODE, -1), [], "Keyphrase offset should not be negative!"),
+                          (PortaCipherStream, ("FORTIFICATION", RUSSIAN_ALPHABET), ["DEFEND"], "Unfortunately Porta cipher doesn't work with alphabets, that are odd long..."),
+                          (MorseCodeEncoder, ("/",), ["SOS", "#"], "Characters in provided text are not in the international character set!"),
+                          (MorseCodeEncoder, ("",), [], "Gap fill should be at least one character long (ideally a space or a character not used in the text)!")])
+def test_cipher_streams_edge_cases(stream_class, arguments, chunks, error_message):
+    with pytest.raises(ValueError) as exception_info:
+        stream = stream_class(*arguments)
+        for chunk in chunks:
+            stream.update(chunk)
+    assert str(exception_info.value) == error_message
+
+
+def test_cipher_stream_without_update():
+    class IncompleteStream(CipherStream):
+        def finalize(self) -> str:
+            return ""
+
+    with pytest.raises(TypeError):
+        IncompleteStream()
+
+
+@pytest.mark.parametrize("stream_class, cipher_function, text_to_input, arguments", CIPHER_STREAM_CASES)
+def test_transform_file(tmp_path, stream_class, cipher_function, text_to_input, arguments):
+    input_file_path, output_file_path = tmp_path / "message.txt", tmp_path / "processed_message.txt"
+    input_file_path.write_text(text_to_input, encoding="utf-8")
+    expected = cipher_function(text_to_input, *arguments)
+    assert transform_file(input_file_path, output_file_path, stream_class, *arguments, chunk_size=3) == output_file_path
+    assert output_file_path.read_text(encoding="utf-8") == expected
+    with stream_class(*arguments) as stream:
+        transform_file(input_file_path, output_file_path, stream, chunk_size=5)
+    assert output_file_path.read_text(encoding="utf-8") == expected
+    if cipher_function in (caesar_cipher, vigenere_cipher, morse_code, bacon_cipher_decoding):
+        transform_file(input_file_path, output_file_path, cipher_function, *arguments, chunk_size=2)
+        assert output_file_path.read_text(encoding="utf-8") == expected
+
+
+def test_transform_file_keeps_line_endings(tmp_path):
+    input_file_path, output_file_path = tmp_path / "message.txt", tmp_path / "processed_message.txt"
+    input_file_path.write_bytes(f"{TEXT_TO_CIPHER_POLISH}\r\n{TEXT_TO_CIPHER_POLISH}\n".encode("utf-8"))
+    transform_file(input_file_path, output_file_path, vigenere_cipher, "MĘSKI", POLISH_ALPHABET, chunk_size=7)
+    assert output_file_path.read_bytes().decode("utf-8") == vigenere_cipher(input_file_path.read_bytes().decode("utf-8"), "MĘSKI", POLISH_ALPHABET)
+
+
+@pytest.mark.parametrize("cipher, chunk_size, error_message",
+                         [(caesar_cipher, 0, "Chunk size should be at least 1 character!"),
+                          (rail_fence_cipher_encoding, 10, "Cipher can't process text in chunks! Please use a CipherStream or a cipher function, that can be streamed.")])
+def test_transform_file_edge_cases(tmp_path, cipher, chunk_size, error_message):
+    input_file_path = tmp_path / "message.txt"
+    input_file_path.write_text(TEXT_TO_CIPHER_LATIN, encoding="utf-8")
+    with pytest.raises(ValueError) as exception_info:
+        transform_file(input_file_path, tmp_path / "processed_message.txt", cipher, 3, chunk_size=chunk_size)
+    assert str(exception_info.value) == error_message
+
+
+async def async_chunks(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+async def collect_transformed_stream(source, *args, **kwargs):
+    return "".join([processed_chunk async for processed_chunk in transform_stream(source, *args, **kwargs)])
+
+
+async def collect_transformed_stream_reader(data, *args, **kwargs):
+    stream_reader = asyncio.StreamReader()
+    stream_reader.feed_data(data)
+    stream_reader.feed_eof()
+    return await collect_transformed_stream(stream_reader, *args, **kwargs)
+
+
+@pytest.mark.parametrize("chunk_size, executor_threshold", [(1, 16*1024), (5, 0), (1000, 10)])
+@pytest.mark.parametrize("stream_class, cipher_function, text_to_input, arguments", CIPHER_STREAM_CASES)
+def test_transform_stream(stream_class, cipher_function, text_to_input, arguments, chunk_size, executor_threshold):
+    expected = cipher_function(text_to_input, *arguments)
+    assert asyncio.run(collect_transformed_stream_reader(text_to_input.encode("utf-8"), stream_class, *arguments, chunk_size=chunk_size,
+                                                         executor_threshold=executor_threshold)) == expected
+    chunks = [text_to_input[index: index + 3] for index in range(0, len(text_to_input), 3)]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        assert asyncio.run(collect_transformed_stream(async_chunks(chunks), stream_class(*arguments), executor=executor, chunk_size=chunk_size,
+                                                      executor_threshold=executor_threshold)) == expected
+
+
+def test_transform_stream_bytes_split_between_chunks():
+    data = TEXT_TO_CIPHER_POLISH.encode("utf-8")
+    chunks = [data[index: index + 3] for index in range(0, len(data), 3)]
+    assert asyncio.run(collect_transformed_stream(async_chunks(chunks), vigenere_cipher, "MĘSKI", POLISH_ALPHABET)) == \
+        vigenere_cipher(TEXT_TO_CIPHER_POLISH, "MĘSKI", POLISH_ALPHABET)
+    memoryview_chunks = [memoryview(data)[index: index + 3] for index in range(0, len(data), 3)]
+    assert asyncio.run(collect_transformed_stream(async_chunks(memoryview_chunks), vigenere_cipher, "MĘSKI", POLISH_ALPHABET)) == \
+        vigenere_cipher(TEXT_TO_CIPHER_POLISH, "MĘSKI", POLISH_ALPHABET)
+    with pytest.raises(UnicodeDecodeError):
+        asyncio.run(collect_transformed_stream_reader(data[:2], caesar_cipher, 3, POLISH_ALPHABET))
+
+
+@pytest.mark.parametrize("cipher, executor_class, chunk_size, error_message",
+                         [(caesar_cipher, None, 0, "Chunk size should be at least 1 character!"),
+                          (caesar_cipher, concurrent.futures.ProcessPoolExecutor, 10, "Streams keep their state between chunks, so they can't be processed in a process pool! Please use a thread pool executor."),
+                          (hill_cipher, None, 10, "Cipher can't process text in chunks! Please use a CipherStream or a cipher function, that can be streamed.")])
+def test_transform_stream_edge_cases(cipher, executor_class, chunk_size, error_message):
+    with executor_class(max_workers=1) if executor_class else contextlib.nullcontext() as executor, pytest.raises(ValueError) as exception_info:
+        asyncio.run(collect_transformed_stream_reader(b"ABC", cipher, 3, LATIN_ALPHABET, executor=executor, chunk_size=chunk_size))
+    assert str(exception_info.value) == error_message
+
+
+@pytest.mark.parametrize("executor_class", [None, concurrent.futures.ThreadPoolExecutor])
+def test_cipher_async(executor_class):
+    key_matrix = [[6, 24, 1], [13, 16, 10], [20, 17, 15]]
+    with executor_class(max_workers=1) if executor_class else contextlib.nullcontext() as executor:
+        assert asyncio.run(cipher_async(hill_cipher, TEXT_TO_CIPHER_LATIN_2, LATIN_ALPHABET, key_matrix, executor=executor)) == \
+            hill_cipher(TEXT_TO_CIPHER_LATIN_2, LATIN_ALPHABET, key_matrix)
+        assert asyncio.run(cipher_async(porta_cipher, TEXT_TO_CIPHER_LATIN_2, keyword="FORTIFICATION", alphabet=LATIN_ALPHABET, executor=executor)) == \
+            porta_cipher(TEXT_TO_CIPHER_LATIN_2, "FORTIFICATION", LATIN_ALPHABET)
+
+
+def test_key_schedule_cache():
+    cache = KeyScheduleCache(maxsize=2)
+    compiled_keys = []
+    compile_key = cache.cached(lambda key: compiled_keys.append(key) or key.lower())
+    assert [compile_key("A"), compile_key("B"), compile_key("A")] == ["a", "b", "a"]
+    assert compiled_keys == ["A", "B"]
+    assert cache.cache_info() == (1, 2, 0, 2, 2)
+    compile_key("C")
+    assert cache.cache_info() == (1, 3, 1, 2, 2)
+    compile_key("A")
+    compile_key("B")
+    assert compiled_keys == ["A", "B", "C", "B"]
+    cache.resize(1)
+    assert cache.cache_info() == (2, 4, 3, 1, 1)
+    cache.cache_clear()
+    assert cache.cache_info() == (0, 0, 0, 1, 0)
+    cache.resize(0)
+    compile_key("A")
+    compile_key("A")
+    assert cache.cache_info() == (0, 2, 0, 0, 0)
+    assert compiled_keys == ["A", "B", "C", "B", "A", "A"]
+
+
+def test_key_schedule_cache_is_used_by_ciphers():
+    KEY_SCHEDULE_CACHE.cache_clear()
+    for _ in range(3):
+        playfair_cipher_encoding(TEXT_TO_CIPHER_LATIN_2, "PLAYFIREXMBCDGHKNOQSTUVWZ")
+    hits, misses, *_ = KEY_SCHEDULE_CACHE.cache_info()
+    assert hits >= 2
+    assert misses >= 1
+
+
+def test_rail_fence_cipher_caches_only_short_permutations():
+    KEY_SCHEDULE_CACHE.cache_clear()
+    rail_fence_cipher_encoding(TEXT_TO_CIPHER_LATIN_2*100, 3)
+    assert KEY_SCHEDULE_CACHE.cache_info().currsize == 0
+    rail_fence_cipher_encoding(TEXT_TO_CIPHER_LATIN_2, 3)
+    assert KEY_SCHEDULE_CACHE.cache_info().currsize == 1
+
+
+def test_columnar_transposition_cipher_caches_only_column_order():
+    KEY_SCHEDULE_CACHE.cache_clear()
+    columnar_transposition_cipher_encoding(TEXT_TO_CIPHER_LATIN_2, "GERMAN")
+    columnar_transposition_cipher_encoding(TEXT_TO_CIPHER_LATIN_2*100, "GERMAN")
+    assert KEY_SCHEDULE_CACHE.cache_info().currsize == 1
+
+
+def test_key_schedule_cache_edge_cases():
+    with pytest.raises(ValueError, match="Cache size should not be negative!"):
+        KeyScheduleCache(maxsize=-1)
+    with pytest.raises(ValueError, match="Cache size should not be negative!"):
+        KEY_SCHEDULE_CACHE.resize(-1)
+
+
+def test_import_does_not_load_heavy_modules():
+    heavy_modules = ("numpy", "pandas", "requests", "bs4", "asyncio")
+    result = subprocess.run([sys.executable, "-c", f"import sys, ciphers; print([module for module in {heavy_modules!r} if module in sys.modules])"],
+                            capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    assert result.stdout.strip() == "[]"
+
+
+def test_concurrent_first_calls_import_numpy_once():
+    script = ("import concurrent.futures, sys, ciphers\n"
+              "assert 'numpy' not in sys.modules\n"
+              "with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:\n"
+              "    results = list(executor.map(lambda _: ciphers.vigenere_cipher('HELLO WORLD', 'KEY', ciphers.LATIN_ALPHABET), range(16)))\n"
+              "print(len(set(results)))")
+    result = subprocess.run([sys.executable, "-c", script],
+                            capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    assert result.stdout.strip() == "1"